@@ -1,14 +1,12 @@
+from argparse import Namespace
 from logging import getLogger
 
 from .arguments import parse_arguments
-from .libraries.logging.configuration import configure_logging
 
-configure_logging()
 _logger = getLogger(__name__)
 
 
-def main() -> int:
-    args = parse_arguments()
+def _run(args: Namespace) -> int:
     _logger.info("#start")
 
     try:
@@ -20,3 +18,17 @@ def main() -> int:
 
     _logger.info("#end")
     return 0
+
+
+def main() -> int:
+    args = parse_arguments()
+
+    # configured after the arguments are parsed, --help and --version do not need the logging.
+    from .libraries.logging.configuration import configure_logging, shutdown_logging
+
+    configure_logging(queue=not args.sync_logging, server=args.log_server, socket=args.log_socket)
+    try:
+        return _run(args)
+    finally:
+        # writes the records still queued before the process exits.
+        shutdown_logging()
@@ -1,7 +1,33 @@
-import importlib.metadata
-from argparse import ArgumentParser, Namespace, RawTextHelpFormatter
+import sys
+from argparse import Action, ArgumentParser, Namespace, RawTextHelpFormatter
+from collections.abc import Sequence
+from importlib import import_module
+from typing import Any
 
-_version = importlib.metadata.version("examples-cli")
+# sub command: (help, description, module with `configure_arguments`)
+_SUB_COMMANDS = {
+    # argparse
+    "argparse": ("argparse example", "standard library/argparse example", ".libraries.argparse"),
+    # logging
+    "logging": ("logging example", "standard library/logging example", ".libraries.logging"),
+    # exif - pillow
+    "exif": ("exif example", "pypi library/pillow example", ".libraries.pillow.exif"),
+}
+
+# the options of the main command that take a value, which is not a sub command.
+_VALUE_OPTIONS = ("-c", "--config", "--log-socket")
+
+
+class _VersionAction(Action):
+    """reads the version only when it is asked for."""
+
+    def __init__(self, option_strings: Sequence[str], dest: str, **kwargs: Any) -> None:
+        super().__init__(option_strings, dest, nargs=0, **kwargs)
+
+    def __call__(self, parser: ArgumentParser, *_: Any) -> None:
+        from .__version__ import __version__
+
+        parser.exit(message=f"{parser.prog} {__version__}\n")
 
 
 def _configure_arguments(parser: ArgumentParser) -> None:
@@ -21,15 +47,46 @@ def _configure_arguments(parser: ArgumentParser) -> None:
         help="show verbose output, -vv -vvv is even more.",
         default=0,
     )
+    parser.add_argument(
+        "--sync-logging",
+        action="store_true",
+        help="write the log on the logging thread,\ninstead of queueing it to a background thread.",
+        dest="sync_logging",
+    )
+    parser.add_argument(
+        "--log-server",
+        action="store_true",
+        help="send the log to the log server, see `logging --serve`.",
+        dest="log_server",
+    )
+    parser.add_argument(
+        "--log-socket",
+        action="store",
+        help="socket of the log server.\n(default: examples-cli-{uid}/logging.sock in the temporary directory)",
+        dest="log_socket",
+        default=None,
+    )
     parser.add_argument(
         "-V",
         "--version",
-        action="version",
-        version=f"%(prog)s {_version}",
+        action=_VersionAction,
         help="show version and exit",
     )
 
 
+def _selected_command(args: list[str]) -> str | None:
+    """the sub command on the command line, found without parsing it."""
+    skip = False
+    for arg in args:
+        if skip:
+            skip = False
+        elif arg in _VALUE_OPTIONS:
+            skip = True
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
 def parse_arguments() -> Namespace:
     parser = ArgumentParser(
         description="console examples for argparse.",
@@ -44,35 +101,12 @@ def parse_arguments() -> Namespace:
         required=True,
     )
 
-    # argparse
-    from .libraries.argparse import configure_arguments as configure_args_argparse
-
-    args_parser = subparsers.add_parser(
-        "argparse",
-        help="argparse example",
-        description="standard library/argparse example",
-    )
-    configure_args_argparse(args_parser)
-
-    # logging
-    from .libraries.logging import configure_arguments as configure_args_logging
-
-    logging_parser = subparsers.add_parser(
-        "logging",
-        help="logging example",
-        description="standard library/logging example",
-    )
-    configure_args_logging(logging_parser)
-
-    # exif - pillow
-    from .libraries.pillow.exif import configure_arguments as configure_args_exif
-
-    exif_parser = subparsers.add_parser(
-        "exif",
-        help="exif example",
-        description="pypi library/pillow example",
-    )
-    configure_args_exif(exif_parser)
+    # only the selected sub command imports its module, and the libraries it depends on.
+    selected = _selected_command(sys.argv[1:])
+    for name, (help, description, module) in _SUB_COMMANDS.items():
+        sub_parser = subparsers.add_parser(name, help=help, description=description)
+        if name == selected:
+            import_module(module, __package__).configure_arguments(sub_parser)
 
     args = parser.parse_args()
 
@@ -1,10 +1,15 @@
 import sys
-from argparse import ArgumentParser, FileType
+from argparse import ArgumentParser, FileType, Namespace
 
-from .example import do_example
 from .game import Game
 
 
+def _run(args: Namespace) -> None:
+    from .example import do_example
+
+    do_example(args)
+
+
 def configure_arguments(parser: ArgumentParser) -> None:
     parser.add_argument(
         "infiles",
@@ -55,4 +60,4 @@ def configure_arguments(parser: ArgumentParser) -> None:
         dest="param_choices",
         help="choices",
     )
-    parser.set_defaults(exec=lambda args: do_example(args))
+    parser.set_defaults(exec=lambda args: _run(args))
@@ -1,17 +1,54 @@
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 
-from .configuration import configure_logging
-from .example import do_example
-from .filter import NoPasswordFilter, level_filter_factory
+from .configuration import configure_logging, shutdown_logging
+from .filter import (
+    NoPasswordFilter,
+    RateLimitFilter,
+    RedactionFilter,
+    SamplingFilter,
+    level_filter_factory,
+    level_range_filter_factory,
+)
+from .formatter import JsonFormatter
+from .handlers import BatchingQueueListener, DeferredQueueHandler, UnixSocketHandler
+
+
+def _run(args: Namespace) -> None:
+    if args.serve:
+        if args.log_server:
+            # exits with the message, as the log would be sent to the server that is not started.
+            raise SystemExit("examples-cli: --serve cannot be used with --log-server")
+        from .server import serve
+
+        serve(args.log_socket)
+        return
+
+    from .example import do_example
+
+    do_example(args)
 
 
 def configure_arguments(parser: ArgumentParser) -> None:
-    parser.set_defaults(exec=lambda args: do_example(args))
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="serve the log of the processes started with --log-server,\nwriting it with the handlers of the config.",
+    )
+    parser.set_defaults(exec=lambda args: _run(args))
 
 
 __all__ = [
     "configure_logging",
+    "shutdown_logging",
     "configure_arguments",
     "level_filter_factory",
+    "level_range_filter_factory",
     "NoPasswordFilter",
+    "RedactionFilter",
+    "SamplingFilter",
+    "RateLimitFilter",
+    "JsonFormatter",
+    "DeferredQueueHandler",
+    "BatchingQueueListener",
+    "UnixSocketHandler",
 ]
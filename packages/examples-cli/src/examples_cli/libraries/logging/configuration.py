@@ -1,26 +1,95 @@
-import json
-import re
-from importlib.resources import as_file
-from importlib.resources import files as resource_files
-from logging import DEBUG, basicConfig
+import marshal
+import os
+from logging import DEBUG, Logger, basicConfig, getHandlerByName, getLevelNamesMapping, root
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
-import yaml
+_CONFIG_STEM = "logging_config"
+_CONFIG_SUFFIXES = (".json", ".yaml", ".yml")
+"""the suffixes of the config in the current directory, matched ignoring case, in the order they are preferred."""
+
+_CACHE_FORMAT = 1
+"""bumped when the cached form changes, so older caches are parsed again."""
+
+_listeners: list[QueueListener] = []
+"""the listeners of the queue mode, stopped by `shutdown_logging()`."""
 
 
 def _find_logging_config() -> Path | None:
-    for file in Path(".").glob("logging_config.*"):
-        if re.match(r".+\.(json|yaml|yml)$", str(file), re.IGNORECASE):
-            return file
+    found: dict[str, str] = {}
+    with os.scandir(".") as entries:
+        for entry in entries:
+            stem, suffix = os.path.splitext(entry.name)
+            if stem == _CONFIG_STEM and suffix.lower() in _CONFIG_SUFFIXES and entry.is_file():
+                found.setdefault(suffix.lower(), entry.name)
+    for suffix in _CONFIG_SUFFIXES:
+        if suffix in found:
+            return Path(found[suffix])
     return None
 
 
 def _default_yaml_config() -> Path:
-    resource = resource_files(__package__)
-    with as_file(resource.joinpath("logging_config.yaml")) as config:
-        return config
+    return Path(__file__).with_name("logging_config.yaml")
+
+
+def _cache_path(config: Path) -> Path:
+    """the cache of the parsed config, in the user cache directory, as the package may be read-only."""
+    import hashlib
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.sha1(str(config).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_home) / "examples-cli" / f"logging_config-{digest}.marshal"
+
+
+def _parse_config(config: Path) -> dict[str, Any]:
+    with open(config) as file:
+        if config.suffix.lower() == ".json":
+            import json
+
+            config_dict: dict[str, Any] = json.load(file)
+        else:
+            import yaml
+
+            config_dict = yaml.safe_load(file)
+    return config_dict
+
+
+def _load_config(config: Path) -> dict[str, Any]:
+    """parses the config, or loads it from the marshal cache if the file has not changed since it was parsed.
+
+    Loading the marshal is much faster than parsing YAML, and PyYAML is not imported at all.
+    """
+    config = config.resolve()
+    stat = config.stat()
+    key = (_CACHE_FORMAT, str(config), stat.st_mtime_ns, stat.st_size)
+    cache = _cache_path(config)
+    try:
+        with open(cache, "rb") as file:
+            cached_key, cached = marshal.load(file)
+        if cached_key == key:
+            config_dict: dict[str, Any] = cached
+            return config_dict
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    config_dict = _parse_config(config)
+    try:
+        data = marshal.dumps((key, config_dict))
+    except ValueError:
+        # values marshal does not support, such as YAML timestamps.
+        return config_dict
+
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        # replaced at once, so concurrent processes never load a partial cache.
+        temporary = cache.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_bytes(data)
+        os.replace(temporary, cache)
+    except OSError:
+        pass
+    return config_dict
 
 
 def _make_directories(config: dict[str, Any]) -> None:
@@ -33,25 +102,95 @@ def _make_directories(config: dict[str, Any]) -> None:
     return
 
 
-def configure_logging() -> None:
+def _loggers(config: dict[str, Any]) -> list[dict[str, Any]]:
+    loggers = list(config.get("loggers", {}).values())
+    if "root" in config:
+        loggers.append(config["root"])
+    return loggers
+
+
+def _use_server(config: dict[str, Any], path: str | None) -> None:
+    """replaces the handlers with one sending the records to the log server, which writes them with its handlers."""
+    from .handlers import UnixSocketHandler
+
+    config["handlers"] = {"server": {"class": UnixSocketHandler, "path": path}}
+    for logger in _loggers(config):
+        if logger.get("handlers"):
+            logger["handlers"] = ["server"]
+
+
+def _use_queues(config: dict[str, Any]) -> list[str]:
+    """moves the handlers of the loggers behind queue handlers, returns their names.
+
+    The loggers that share the same handlers share a queue, so the records are written by one listener thread.
+    """
+    from .handlers import BatchingQueueListener, DeferredQueueHandler
+
+    queues: dict[tuple[str, ...], str] = {}
+    for logger in _loggers(config):
+        handlers = tuple(logger.get("handlers", ()))
+        if not handlers:
+            continue
+        if handlers not in queues:
+            queues[handlers] = f"queue_{len(queues)}"
+            config["handlers"][queues[handlers]] = {
+                "class": DeferredQueueHandler,
+                "queue": "queue.SimpleQueue",
+                "listener": BatchingQueueListener,
+                "handlers": list(handlers),
+                "respect_handler_level": True,
+            }
+        logger["handlers"] = [queues[handlers]]
+    return list(queues.values())
+
+
+def _warm_level_caches() -> None:
+    """fills the `isEnabledFor` cache of the loggers for each level, which the configuration cleared.
+
+    Otherwise the first call at each level walks up the logger hierarchy for its effective level.
+    """
+    levels = sorted(set(getLevelNamesMapping().values()))
+    loggers = [root, *(logger for logger in Logger.manager.loggerDict.values() if isinstance(logger, Logger))]
+    for logger in loggers:
+        for level in levels:
+            logger.isEnabledFor(level)
+
+
+def shutdown_logging() -> None:
+    """stops the listeners of the queue mode, once they have written the queued records."""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+def configure_logging(queue: bool = False, server: bool = False, socket: str | None = None) -> None:
+    """configures the logging from the config file.
+
+    With `queue`, the loggers only enqueue the records, which are formatted and written
+    on a background thread until `shutdown_logging()` is called.
+    With `server`, the records are sent to the log server on `socket` instead of the handlers of the config,
+    see `examples-cli logging --serve`.
+    """
+    shutdown_logging()
     config = _find_logging_config() or _default_yaml_config()
     suffix = config.suffix.lower()
     match suffix:
-        case ".json":
-            with open(config) as file:
-                config_dict = json.load(file)
-            _make_directories(config_dict)
-            dictConfig(config_dict)
-
-        case ".yaml" | ".yml":
-            with open(config) as file:
-                config_dict = yaml.safe_load(file)
+        case ".json" | ".yaml" | ".yml":
+            config_dict = _load_config(config)
+            if server:
+                _use_server(config_dict, socket)
             _make_directories(config_dict)
+            queues = _use_queues(config_dict) if queue else []
             dictConfig(config_dict)
+            for name in queues:
+                handler = getHandlerByName(name)
+                assert isinstance(handler, QueueHandler) and handler.listener is not None
+                handler.listener.start()
+                _listeners.append(handler.listener)
 
         case _:
             basicConfig(
                 level=DEBUG,
                 format="%(asctime)s %(name)-12s %(levelname)-8s %(message)s",
             )
+    _warm_level_caches()
     return
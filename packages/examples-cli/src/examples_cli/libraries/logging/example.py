@@ -23,3 +23,4 @@ def do_example(args: Namespace) -> None:
     logger.info("----- password : qwerty, filtered?")
     # spell-checker:disable-next-line
     logger.info("----- p@ssword : xxxxxx, not filtering.")
+    logger.info("----- token=%s, redacted.", "abc123")
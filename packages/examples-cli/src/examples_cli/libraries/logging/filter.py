@@ -1,4 +1,6 @@
-from collections.abc import Callable
+import random
+import re
+from collections.abc import Callable, Mapping, Sequence
 from logging import Filter, LogRecord
 
 
@@ -15,15 +17,151 @@ class NoPasswordFilter(Filter):
         return "password" not in log_message
 
 
+def _ignore_case(text: str) -> str:
+    return "".join(f"[{char.lower()}{char.upper()}]" if char.isalpha() else re.escape(char) for char in text)
+
+
+class RedactionFilter(Filter):
+    """Filter that masks the sensitive values in the message, instead of dropping the record.
+
+    `keys` mask the value after them, ignoring the case, as in `password: xxx` or `Token=xxx`,
+    and `patterns` are regular expressions masked as a whole.
+    They are compiled into a single regular expression, so a message is scanned once for all of them.
+    The message is formatted once and stored back in the record without its arguments,
+    so the handlers and the other filters do not format it again.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        keys: Sequence[str] = ("password", "passwd", "secret", "token", "api_key"),
+        patterns: Sequence[str] = (),
+        replacement: str = "***",
+    ) -> None:
+        super().__init__(name)
+        alternatives = [f"(?:{pattern})" for pattern in patterns]
+        if keys:
+            # re.IGNORECASE makes the scan several times slower, so the keys match both cases by character sets,
+            # and the lookahead of their first characters skips the other positions quickly.
+            firsts = "".join(sorted({re.escape(case) for key in keys for case in (key[0].lower(), key[0].upper())}))
+            names = "|".join(_ignore_case(key) for key in keys)
+            alternatives.insert(0, rf"(?=[{firsts}])(?P<key>(?:{names})\s*[:=]\s*)[^\s,;]+")
+        self.pattern = re.compile("|".join(alternatives) or "(?!)")
+        self.replacement = replacement
+
+    def _replace(self, match: re.Match[str]) -> str:
+        key = match.groupdict().get("key")
+        return self.replacement if key is None else key + self.replacement
+
+    def filter(self, record: LogRecord) -> bool:
+        # the record passes every handler with the filter, it is scanned by the first one only.
+        if record.__dict__.get("_redacted_by") is self:
+            return True
+        record.msg = self.pattern.sub(self._replace, record.getMessage())
+        record.args = None
+        record.__dict__["_redacted_by"] = self
+        return True
+
+
+def _levelno(level: str) -> int:
+    import logging as original
+
+    levelno: int = getattr(original, level, original.DEBUG)
+    return levelno
+
+
+class SamplingFilter(Filter):
+    """Filter that passes a random `rate` of the records at `level` and below, and all the records above it."""
+
+    def __init__(self, name: str = "", rate: float = 0.1, level: str = "DEBUG") -> None:
+        super().__init__(name)
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"rate [{rate}] must be between 0 and 1")
+        self.rate = rate
+        self.levelno = _levelno(level)
+
+    def filter(self, record: LogRecord) -> bool:
+        return record.levelno > self.levelno or random.random() < self.rate
+
+
+class RateLimitFilter(Filter):
+    """Filter that passes at most `rate` records per second of each logger at `level` and below,
+    allowing bursts of `burst` records, and all the records above `level`.
+
+    Each logger has a token bucket, refilled by the time of the records,
+    so the rate is the one they were logged at, even when they are handled later on the queue thread.
+    """
+
+    def __init__(self, name: str = "", rate: float = 10.0, burst: int = 10, level: str = "INFO") -> None:
+        super().__init__(name)
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"rate [{rate}] must be positive and burst [{burst}] at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.levelno = _levelno(level)
+        # logger name: [tokens, time of the last refill]
+        self._buckets: dict[str, list[float]] = {}
+
+    def filter(self, record: LogRecord) -> bool:
+        if record.levelno > self.levelno:
+            return True
+
+        bucket = self._buckets.get(record.name)
+        if bucket is None:
+            bucket = self._buckets[record.name] = [float(self.burst), record.created]
+        elapsed = max(record.created - bucket[1], 0.0)
+        bucket[0] = min(bucket[0] + elapsed * self.rate, self.burst)
+        bucket[1] = record.created
+        if bucket[0] < 1.0:
+            return False
+        bucket[0] -= 1.0
+        return True
+
+
 def level_filter_factory(level: str) -> Callable[[LogRecord], bool]:
     """Custom handling of levels:
     https://docs.python.org/3/howto/logging-cookbook.html#custom-handling-of-levels
     """
-    import logging as original
-
-    levelno = getattr(original, level, original.DEBUG)
+    levelno = _levelno(level)
 
     def filter(record: LogRecord) -> bool:
         return record.levelno <= levelno
 
     return filter
+
+
+def level_range_filter_factory(
+    low: str = "NOTSET",
+    high: str = "CRITICAL",
+    routes: Mapping[str, Sequence[str]] | None = None,
+) -> Callable[[LogRecord], bool]:
+    """Custom handling of levels, by ranges:
+    passes the records from `low` to `high`, or the range of `routes` for the loggers under its prefixes,
+    such as `{"examples_cli.libraries": ["DEBUG", "WARNING"]}`, the longest prefix winning.
+
+    The levels each logger passes are resolved once, into a set, so a record costs one dict lookup.
+    """
+    default = frozenset(range(_levelno(low), _levelno(high) + 1))
+    table = {
+        prefix: frozenset(range(_levelno(route[0]), _levelno(route[1]) + 1))
+        for prefix, route in (routes or {}).items()
+    }
+    passed: dict[str, frozenset[int]] = {}
+
+    def route(name: str) -> frozenset[int]:
+        prefix = name
+        while prefix not in table:
+            if "." not in prefix:
+                passed[name] = default
+                return default
+            prefix = prefix.rpartition(".")[0]
+        passed[name] = table[prefix]
+        return table[prefix]
+
+    def filter(record: LogRecord) -> bool:
+        try:
+            return record.levelno in passed[record.name]
+        except KeyError:
+            return record.levelno in route(record.name)
+
+    return filter
@@ -0,0 +1,70 @@
+import math
+from collections.abc import Callable, Mapping
+from json.encoder import encode_basestring
+from logging import Formatter, LogRecord
+from typing import Any
+
+_DEFAULT_FIELDS = {
+    "time": "created",
+    "level": "levelname",
+    "logger": "name",
+    "message": "message",
+}
+
+
+def _encode_float(value: float) -> str:
+    return repr(value) if math.isfinite(value) else "null"
+
+
+def _encode_other(value: object) -> str:
+    return encode_basestring(str(value))
+
+
+_ENCODERS: dict[type, Callable[[Any], str]] = {
+    str: encode_basestring,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda _: "null",
+}
+
+
+class JsonFormatter(Formatter):
+    """Formatter that writes each record as a line of JSON:
+    https://docs.python.org/3/howto/logging-cookbook.html#implementing-structured-logging
+
+    `fields` maps the keys of the object to the attributes of the record, such as `message` or `process`.
+    The keys are encoded once, into the template of the line, and the values are encoded by their type
+    straight from the record, without building a dict per record for `json.dumps`.
+    Non-ASCII characters are kept as they are, which is shorter than their escapes.
+    """
+
+    def __init__(self, fields: Mapping[str, str] | None = None, datefmt: str | None = None) -> None:
+        super().__init__(datefmt=datefmt)
+        fields = _DEFAULT_FIELDS if fields is None else fields
+        if not fields:
+            raise ValueError("JsonFormatter needs at least one field")
+        self._template = [
+            (("{" if index == 0 else ",") + encode_basestring(key) + ":", attribute)
+            for index, (key, attribute) in enumerate(fields.items())
+        ]
+        self._uses_asctime = "asctime" in fields.values()
+
+    def format(self, record: LogRecord) -> str:
+        record.message = record.getMessage()
+        if self._uses_asctime:
+            record.asctime = self.formatTime(record, self.datefmt)
+        values = record.__dict__
+        line = []
+        for prefix, attribute in self._template:
+            value = values.get(attribute)
+            line.append(prefix + _ENCODERS.get(type(value), _encode_other)(value))
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line.append(',"exc_info":' + encode_basestring(record.exc_text))
+        if record.stack_info:
+            line.append(',"stack_info":' + encode_basestring(self.formatStack(record.stack_info)))
+        line.append("}")
+        return "".join(line)
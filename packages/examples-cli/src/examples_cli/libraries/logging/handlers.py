@@ -0,0 +1,159 @@
+import json
+import os
+import queue
+import struct
+import tempfile
+from logging import FileHandler, Handler, LogRecord, StreamHandler
+from logging.handlers import (
+    BaseRotatingHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    SocketHandler,
+    TimedRotatingFileHandler,
+)
+from typing import Any
+
+_LENGTH = struct.Struct(">L")
+"""the length before each record sent to the log server, as `SocketHandler` sends it."""
+
+
+def socket_path(path: str | None = None) -> str:
+    """`path`, or the socket of the log server in a directory of the user in the temporary directory."""
+    return path or os.path.join(tempfile.gettempdir(), f"examples-cli-{os.getuid()}", "logging.sock")
+
+
+def encode_record(record: dict[str, object]) -> bytes:
+    data = json.dumps(record, default=str).encode("utf-8")
+    return _LENGTH.pack(len(data)) + data
+
+
+def decode_length(header: bytes) -> int:
+    length: int = _LENGTH.unpack(header)[0]
+    return length
+
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that enqueues the records as they are, to be formatted on the listener thread.
+
+    `QueueHandler` formats the message on the calling thread, so that the record can be pickled to another process.
+    The queue stays in this process, so the caller only pays for the enqueue,
+    and the arguments of the message are formatted later: they should not be changed after the logging call.
+    """
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        return record
+
+
+_ROTATING = (RotatingFileHandler, TimedRotatingFileHandler)
+
+
+def _writes_stream(handler: Handler) -> bool:
+    """whether the handler emits a record only by writing it to its stream and flushing it."""
+    emit = type(handler).emit
+    return emit in (StreamHandler.emit, FileHandler.emit) or (
+        emit is BaseRotatingHandler.emit and isinstance(handler, _ROTATING)
+    )
+
+
+def _write_batch(handler: StreamHandler[Any], records: list[LogRecord]) -> None:
+    """writes the records as `emit` does, but flushes the stream once after the batch instead of after each record."""
+    for record in records:
+        try:
+            if isinstance(handler, _ROTATING) and handler.shouldRollover(record):
+                handler.doRollover()
+            stream = handler.stream
+            if stream is None:
+                # a file opened lazily (`delay`), or closed by the rollover, `emit` opens it.
+                handler.emit(record)
+                continue
+            stream.write(handler.format(record) + handler.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            handler.handleError(record)
+    handler.flush()
+
+
+class BatchingQueueListener(QueueListener):
+    """QueueListener that handles the records queued while it was busy as one batch,
+    taking the lock of each handler once per batch instead of once per record.
+    The handlers that write to a stream, such as `StreamHandler`, `FileHandler` and the rotating handlers,
+    write the batch with a single flush, the other handlers emit each record.
+
+    The handlers are only used under their lock, so a handler shared by the listeners of several queues is safe.
+    """
+
+    batch_size = 512
+
+    def _handle_batch(self, records: list[LogRecord]) -> None:
+        handlers: tuple[Handler, ...] = self.handlers
+        for handler in handlers:
+            handler.acquire()
+            try:
+                accepted = []
+                for record in records:
+                    if self.respect_handler_level and record.levelno < handler.level:
+                        continue
+                    # as `Handler.handle`, a filter may return a record to emit instead.
+                    result = handler.filter(record)
+                    if result:
+                        accepted.append(result if isinstance(result, LogRecord) else record)
+                if not accepted:
+                    continue
+                if isinstance(handler, StreamHandler) and _writes_stream(handler):
+                    _write_batch(handler, accepted)
+                else:
+                    for record in accepted:
+                        handler.emit(record)
+            finally:
+                handler.release()
+
+    def _monitor(self) -> None:
+        task_done = getattr(self.queue, "task_done", None)
+        stopped = False
+        while not stopped:
+            batch: list[LogRecord] = []
+            # blocks for the first record only, then takes the ones queued meanwhile.
+            record = self.dequeue(True)
+            while True:
+                # the sentinel `stop()` enqueues.
+                if record is None:
+                    stopped = True
+                    break
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    record = self.dequeue(False)
+                except queue.Empty:
+                    break
+
+            self._handle_batch(batch)
+            if task_done is not None:
+                for _ in range(len(batch) + stopped):
+                    task_done()
+
+
+class UnixSocketHandler(SocketHandler):
+    """SocketHandler that sends the records to the log server over a Unix socket, as JSON.
+
+    The message is formatted with its arguments and the exception is formatted to text,
+    as `SocketHandler` does, so the server does not need the objects of the process.
+    Like `SocketHandler`, the records are dropped while the server cannot be reached,
+    and it connects again after a backoff.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        super().__init__(socket_path(path), None)
+
+    def makePickle(self, record: LogRecord) -> bytes:
+        if record.exc_info:
+            # sets record.exc_text.
+            self.format(record)
+        fields = dict(record.__dict__)
+        fields["msg"] = record.getMessage()
+        fields["args"] = None
+        fields["exc_info"] = None
+        fields.pop("message", None)
+        return encode_record(fields)
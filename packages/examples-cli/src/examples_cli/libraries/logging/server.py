@@ -0,0 +1,68 @@
+"""Log server, which writes the records of many processes through the handlers of this one.
+
+Rotating file handlers in several processes rotate the same file each on their own,
+so the processes send their records to the server with `UnixSocketHandler` instead.
+The server hands them to its loggers, which in the queue mode write them in batches on one thread.
+"""
+
+import json
+import os
+import socket
+from contextlib import suppress
+from logging import getLogger, makeLogRecord
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+
+from .handlers import decode_length, socket_path
+
+_logger = getLogger(__name__)
+
+
+class _RecordStreamHandler(StreamRequestHandler):
+    """reads the records of one process until it disconnects."""
+
+    def handle(self) -> None:
+        while True:
+            header = self.rfile.read(4)
+            if len(header) < 4:
+                return
+            length = decode_length(header)
+            data = self.rfile.read(length)
+            if len(data) < length:
+                return
+            record = makeLogRecord(json.loads(data))
+            # the levels were checked by the process, the handlers of this one check theirs.
+            getLogger(record.name).handle(record)
+
+
+class _LogServer(ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def _remove_stale(path: str) -> None:
+    """removes the socket left by a server that is gone, raises if one is serving on it."""
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(path)
+        except ConnectionRefusedError:
+            os.remove(path)
+            return
+    raise FileExistsError(f"a log server is serving on [{path}]")
+
+
+def serve(path: str | None = None) -> None:
+    """serves until interrupted."""
+    path = socket_path(path)
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    _remove_stale(path)
+
+    with _LogServer(path, _RecordStreamHandler) as server:
+        _logger.info("log server serving on [%s]", path)
+        try:
+            with suppress(KeyboardInterrupt):
+                server.serve_forever()
+        finally:
+            with suppress(FileNotFoundError):
+                os.remove(path)
+    _logger.info("log server stopped")
@@ -1,7 +1,11 @@
 import sys
-from argparse import ArgumentParser, FileType
+from argparse import ArgumentParser, FileType, Namespace
 
-from .example import do_example
+
+def _run(args: Namespace) -> None:
+    from .example import do_example
+
+    do_example(args)
 
 
 def configure_arguments(parser: ArgumentParser) -> None:
@@ -18,4 +22,4 @@ def configure_arguments(parser: ArgumentParser) -> None:
         type=FileType("w"),
         default=sys.stdout,
     )
-    parser.set_defaults(exec=lambda args: do_example(args))
+    parser.set_defaults(exec=lambda args: _run(args))
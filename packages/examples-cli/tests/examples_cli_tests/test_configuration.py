@@ -0,0 +1,31 @@
+"""This test is for finding the logging configuration in the current directory."""
+
+from pathlib import Path
+
+import pytest
+from examples_cli.libraries.logging.configuration import _find_logging_config
+
+
+@pytest.mark.parametrize("name", ["logging_config.json", "logging_config.YAML", "logging_config.Yml"])
+def test_suffix_ignores_case(name: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / name).write_text("{}")
+    monkeypatch.chdir(tmp_path)
+
+    assert _find_logging_config() == Path(name)
+
+
+def test_json_is_preferred(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ["logging_config.yml", "logging_config.JSON", "logging_config.yaml"]:
+        (tmp_path / name).write_text("{}")
+    monkeypatch.chdir(tmp_path)
+
+    assert _find_logging_config() == Path("logging_config.JSON")
+
+
+def test_other_files_are_ignored(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "logging_config.toml").write_text("")
+    (tmp_path / "Logging_Config.json").write_text("{}")
+    (tmp_path / "logging_config.yaml").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    assert _find_logging_config() is None
@@ -0,0 +1,66 @@
+"""This test is for the queue handlers of the logging configuration."""
+
+import io
+import logging
+import queue
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from examples_cli.libraries.logging.handlers import BatchingQueueListener
+
+
+class _CountingHandler(logging.StreamHandler[io.StringIO]):
+    def __init__(self) -> None:
+        super().__init__(io.StringIO())
+        self.flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+def _listen(records: list[logging.LogRecord], *handlers: logging.Handler) -> None:
+    """handles the records queued before the listener starts, which it takes as one batch."""
+    records_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    for record in records:
+        records_queue.put(record)
+    listener = BatchingQueueListener(records_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    listener.stop()
+
+
+def _records(count: int, level: int = logging.INFO) -> list[logging.LogRecord]:
+    return [logging.makeLogRecord({"msg": "record %d", "args": (i,), "levelno": level}) for i in range(count)]
+
+
+def test_batch_is_flushed_once() -> None:
+    handler = _CountingHandler()
+
+    _listen(_records(100), handler)
+
+    assert handler.flushes == 1
+    assert handler.stream.getvalue().splitlines() == [f"record {i}" for i in range(100)]
+
+
+def test_batch_respects_level_and_filters() -> None:
+    handler = _CountingHandler()
+    handler.setLevel(logging.WARNING)
+    handler.addFilter(lambda record: record.args != (1,))
+
+    _listen([*_records(2, logging.INFO), *_records(3, logging.WARNING)], handler)
+
+    assert handler.stream.getvalue().splitlines() == ["record 0", "record 2"]
+    assert handler.flushes == 1
+
+
+def test_batch_rolls_over(tmp_path: Path) -> None:
+    path = tmp_path / "batch.log"
+    handler = RotatingFileHandler(path, maxBytes=100, backupCount=10, delay=True)
+
+    _listen(_records(50), handler)
+    handler.close()
+
+    files = sorted(tmp_path.iterdir(), key=lambda file: -int(file.suffix[1:]) if file.suffix != ".log" else 0)
+    lines = [line for file in files for line in file.read_text().splitlines()]
+    assert lines == [f"record {i}" for i in range(50)]
+    assert all(file.stat().st_size <= 100 for file in files)
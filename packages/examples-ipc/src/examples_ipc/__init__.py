@@ -1,13 +1,28 @@
-from .arguments import parse_arguments
+import os
 
 
 def main() -> int:
-    args = parse_arguments()
+    # imports the CLI after the report starts, so it covers the imports of the subcommand as well.
+    report = None
+    if os.environ.get("EXAMPLES_IPC_IMPORTTIME"):
+        from .importtime import install
+
+        report = install()
 
     try:
-        args.exec(args)
+        from .arguments import parse_arguments
+
+        args = parse_arguments()
+
+        try:
+            args.exec(args)
+
+        except Exception as e:
+            print(type(e), e)
 
-    except Exception as e:
-        print(type(e), e)
+    finally:
+        # printed on the exit of --help and --version as well.
+        if report is not None:
+            report.print()
 
     return 0
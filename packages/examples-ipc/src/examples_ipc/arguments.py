@@ -1,18 +1,34 @@
-import importlib.metadata
-from argparse import ArgumentParser, Namespace, RawTextHelpFormatter
+from argparse import Action, ArgumentParser, Namespace, RawTextHelpFormatter
+from collections.abc import Sequence
+from typing import Any
 
-from .posix import configure_arguments as configure_posix
-from .sysv import configure_arguments as configure_sysv
+from .subcommands import Subcommand, add_subcommands
 
-_version = importlib.metadata.version("examples-ipc")
+_SUBCOMMANDS = {
+    "posix": Subcommand(".posix", "POSIX IPC examples"),
+    "sysv": Subcommand(".sysv", "SystemV IPC examples"),
+    "bench": Subcommand(".bench", "throughput and latency benchmark of the IPC transports"),
+    "gc": Subcommand(".sweep", "remove the IPC objects left behind by processes that are gone"),
+}
+
+
+class _VersionAction(Action):
+    """looks the version up only when it is asked for, reading the package metadata is slow."""
+
+    def __init__(self, option_strings: Sequence[str], dest: str, **kwargs: Any) -> None:
+        super().__init__(option_strings, dest, nargs=0, **kwargs)
+
+    def __call__(self, parser: ArgumentParser, *_: Any) -> None:
+        import importlib.metadata
+
+        parser.exit(message=f"{parser.prog} {importlib.metadata.version('examples-ipc')}\n")
 
 
 def _configure_arguments(parser: ArgumentParser) -> None:
     parser.add_argument(
         "-V",
         "--version",
-        action="version",
-        version=f"%(prog)s {_version}",
+        action=_VersionAction,
         help="show version and exit",
     )
 
@@ -24,13 +40,7 @@ def parse_arguments() -> Namespace:
     )
     _configure_arguments(parser)
 
-    subparsers = parser.add_subparsers(required=True)
-
-    posix_parser = subparsers.add_parser("posix", help="POSIX IPC examples")
-    configure_posix(posix_parser)
-
-    sysv_parser = subparsers.add_parser("sysv", help="SystemV IPC examples")
-    configure_sysv(sysv_parser)
+    add_subcommands(parser, __package__, _SUBCOMMANDS)
 
     args = parser.parse_args()
     return args
@@ -0,0 +1,82 @@
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+
+from ..codecs import CODECS, get_codec
+from .report import format_codec_table, format_json, format_table
+from .runner import run as _bench_run
+from .serializers import run as _codec_bench_run
+from .transports import TRANSPORTS
+
+
+def _count(value: str) -> int:
+    count = int(value)
+    if count < 1:
+        raise ArgumentTypeError(f"the count [{count}] must be at least 1")
+    return count
+
+
+def _run(args: Namespace) -> None:
+    transports = [TRANSPORTS[name]() for name in args.transports]
+    codecs = [get_codec(name) for name in args.codecs]
+    try:
+        measurements = _bench_run(transports, args.sizes, args.concurrency, args.count)
+        codec_measurements = _codec_bench_run(codecs, args.count)
+    except KeyboardInterrupt:
+        print("canceled.")
+        return
+
+    if measurements:
+        print(format_table(measurements))
+    if codec_measurements:
+        print(format_codec_table(codec_measurements))
+
+    if args.json == "-":
+        print(format_json(measurements, codec_measurements))
+    elif args.json:
+        with open(args.json, "w") as file:
+            file.write(format_json(measurements, codec_measurements))
+        print(f"{args.json} is written.")
+
+
+def configure_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument(
+        "-t",
+        "--transports",
+        nargs="*",
+        choices=list(TRANSPORTS),
+        help="the transports to measure, none with an empty list. (default: all)",
+        default=list(TRANSPORTS),
+    )
+    parser.add_argument(
+        "--codecs",
+        nargs="*",
+        choices=list(CODECS),
+        help="the codecs whose encode and decode cost is measured, none with an empty list. (default: all)",
+        default=list(CODECS),
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        help="the message sizes in bytes, sizes over the transport limit are skipped. (default: %(default)s)",
+        default=[64, 1024, 8192],
+    )
+    parser.add_argument(
+        "--concurrency",
+        nargs="+",
+        type=int,
+        help="the numbers of producer processes. (default: %(default)s)",
+        default=[1, 4],
+    )
+    parser.add_argument(
+        "-c",
+        "--count",
+        type=_count,
+        help="the number of messages sent by each producer. (default: %(default)s)",
+        default=10_000,
+    )
+    parser.add_argument(
+        "--json",
+        help="writes the results as JSON to the file, or to stdout with '-'.",
+        default=None,
+    )
+    parser.set_defaults(exec=lambda args: _run(args))
@@ -0,0 +1,89 @@
+import json
+from typing import NamedTuple
+
+from .serializers import CodecMeasurement
+from .transports import Result
+
+PERCENTILES = {"p50": 0.50, "p99": 0.99, "p999": 0.999}
+
+
+class Measurement(NamedTuple):
+    transport: str
+    size: int
+    concurrency: int
+    messages: int
+    seconds: float
+    messages_per_second: float
+    megabytes_per_second: float
+    latency_us: dict[str, float]
+
+
+def _percentile(values: list[int], fraction: float) -> int:
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def measure(transport: str, size: int, concurrency: int, results: list[Result]) -> Measurement:
+    latencies = sorted(latency for result in results for latency in result.latencies_ns)
+    seconds = max(result.finished_ns for result in results) - min(result.started_ns for result in results)
+    seconds = max(seconds, 1) / 1e9
+    received = sum(result.received_bytes for result in results)
+    return Measurement(
+        transport,
+        size,
+        concurrency,
+        len(latencies),
+        seconds,
+        len(latencies) / seconds,
+        received / seconds / 1e6,
+        {name: _percentile(latencies, fraction) / 1e3 for name, fraction in PERCENTILES.items()} if latencies else {},
+    )
+
+
+_COLUMNS = ["transport", "size", "conc", "messages", "msgs/s", "MB/s"] + [f"{name}(us)" for name in PERCENTILES]
+_CODEC_COLUMNS = ["codec", "size", "encode(ns)", "decode(ns)", "msgs/s"]
+
+
+def _format_rows(columns: list[str], rows: list[list[str]]) -> str:
+    widths = [max(len(row[i]) for row in [columns, *rows]) for i in range(len(columns))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+        )
+        for row in [columns, *rows]
+    ]
+    return "\n".join(lines)
+
+
+def format_table(measurements: list[Measurement]) -> str:
+    rows = [
+        [
+            m.transport,
+            f"{m.size:,}",
+            f"{m.concurrency}",
+            f"{m.messages:,}",
+            f"{m.messages_per_second:,.0f}",
+            f"{m.megabytes_per_second:,.1f}",
+            *(f"{m.latency_us.get(name, 0):,.1f}" for name in PERCENTILES),
+        ]
+        for m in measurements
+    ]
+    return _format_rows(_COLUMNS, rows)
+
+
+def format_codec_table(measurements: list[CodecMeasurement]) -> str:
+    rows = [
+        [m.codec, f"{m.size:,}", f"{m.encode_ns:,.0f}", f"{m.decode_ns:,.0f}", f"{m.messages_per_second:,.0f}"]
+        for m in measurements
+    ]
+    return _format_rows(_CODEC_COLUMNS, rows)
+
+
+def format_json(measurements: list[Measurement], codec_measurements: list[CodecMeasurement]) -> str:
+    return json.dumps(
+        {
+            "transports": [m._asdict() for m in measurements],
+            "codecs": [m._asdict() for m in codec_measurements],
+        },
+        indent=2,
+    )
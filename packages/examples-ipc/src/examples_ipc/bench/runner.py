@@ -0,0 +1,79 @@
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+
+from .report import Measurement, measure
+from .transports import Result, Transport
+
+
+def _consume(transport: Transport, address: object, index: int, producers: int, count: int, conn: Connection) -> None:
+    conn.send(transport.consume(address, index, producers, count))
+    conn.close()
+
+
+def _receive(receiver: Connection, processes: list[BaseProcess]) -> Result:
+    """waits for a consumer result, failing instead of hanging when any of the processes has failed."""
+    while not receiver.poll(0.1):
+        failed = [process.name for process in processes if process.exitcode]
+        if failed:
+            raise RuntimeError(f"benchmark process failed: {', '.join(failed)}")
+    try:
+        result: Result = receiver.recv()
+    except EOFError:
+        raise RuntimeError("benchmark consumer exited without a result") from None
+    return result
+
+
+def run_once(context: BaseContext, transport: Transport, size: int, concurrency: int, count: int) -> Measurement:
+    """runs the producers and consumers of one transport, size and concurrency in their own processes."""
+    address = transport.setup(concurrency, size)
+    try:
+        consumers = []
+        for index in range(transport.consumers(concurrency)):
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(  # type: ignore[attr-defined]
+                target=_consume,
+                args=(transport, address, index, concurrency, count, sender),
+            )
+            process.start()
+            sender.close()
+            consumers.append((process, receiver))
+
+        producers = [
+            context.Process(target=transport.produce, args=(address, index, size, count))  # type: ignore[attr-defined]
+            for index in range(concurrency)
+        ]
+        for producer in producers:
+            producer.start()
+
+        try:
+            results = [
+                _receive(receiver, producers + [process for process, _ in consumers]) for _, receiver in consumers
+            ]
+        except BaseException:
+            for process in producers + [process for process, _ in consumers]:
+                process.terminate()
+            raise
+
+        finally:
+            for process in producers + [process for process, _ in consumers]:
+                process.join()
+            for _, receiver in consumers:
+                receiver.close()
+
+        return measure(transport.name, size, concurrency, results)
+
+    finally:
+        transport.teardown(address)
+
+
+def run(transports: list[Transport], sizes: list[int], concurrencies: list[int], count: int) -> list[Measurement]:
+    # the processes inherit the anonymous mappings and the transports, so they are forked rather than spawned.
+    context = multiprocessing.get_context("fork")
+    measurements = []
+    for transport in transports:
+        for size in transport.sizes(sizes):
+            for concurrency in concurrencies:
+                measurements.append(run_once(context, transport, size, concurrency, count))
+    return measurements
@@ -0,0 +1,32 @@
+import time
+from typing import NamedTuple
+
+from ..codecs import Codec
+
+
+class CodecMeasurement(NamedTuple):
+    codec: str
+    size: int
+    encode_ns: float
+    decode_ns: float
+    messages_per_second: float
+
+
+def measure_codec(codec: Codec, count: int) -> CodecMeasurement:
+    """measures the cost of encoding and decoding the `{"count": n}` message of the queue examples."""
+    messages = [{"count": i} for i in range(count)]
+
+    started = time.perf_counter_ns()
+    encoded = [codec.encode(message) for message in messages]
+    encoded_ns = time.perf_counter_ns()
+    for data in encoded:
+        codec.decode(data)
+    decoded_ns = time.perf_counter_ns()
+
+    encode = (encoded_ns - started) / count
+    decode = (decoded_ns - encoded_ns) / count
+    return CodecMeasurement(codec.name, len(encoded[-1]), encode, decode, 1e9 / (encode + decode))
+
+
+def run(codecs: list[Codec], count: int) -> list[CodecMeasurement]:
+    return [measure_codec(codec, count) for codec in codecs]
@@ -0,0 +1,339 @@
+import mmap
+import os
+import struct
+import time
+from abc import ABC, abstractmethod
+from typing import Any, NamedTuple
+
+import posix_ipc
+import sysv_ipc
+
+from ..ring import Backoff, RingBuffer
+from ..sysv.message_queue.limits import msgmax
+
+# every message starts with the time it was sent, the rest is padding up to the message size.
+_STAMP = struct.Struct("=Q")
+MIN_SIZE = _STAMP.size
+
+
+class Result(NamedTuple):
+    """what a consumer measured."""
+
+    latencies_ns: list[int]
+    started_ns: int
+    finished_ns: int
+    received_bytes: int
+
+
+def _message(size: int) -> bytearray:
+    return bytearray(max(size, MIN_SIZE))
+
+
+def _stamp(message: bytearray) -> bytearray:
+    _STAMP.pack_into(message, 0, time.monotonic_ns())
+    return message
+
+
+class _Collector:
+    def __init__(self) -> None:
+        self.latencies: list[int] = []
+        self.started = 0
+        self.received = 0
+
+    def collect(self, message: Any) -> None:
+        now = time.monotonic_ns()
+        (sent,) = _STAMP.unpack_from(message, 0)
+        if not self.started or sent < self.started:
+            self.started = sent
+        self.latencies.append(now - sent)
+        self.received += len(message)
+
+    def result(self) -> Result:
+        return Result(self.latencies, self.started, time.monotonic_ns(), self.received)
+
+
+class Transport(ABC):
+    """An IPC transport measured by the benchmark.
+
+    `setup()` runs in the benchmark process and returns the address the producer and consumer processes attach to.
+    """
+
+    name = ""
+
+    def max_size(self) -> int:
+        return 1 << 30
+
+    def sizes(self, requested: list[int]) -> list[int]:
+        return [size for size in requested if max(size, MIN_SIZE) <= self.max_size()]
+
+    def consumers(self, producers: int) -> int:
+        return 1
+
+    @abstractmethod
+    def setup(self, producers: int, size: int) -> Any: ...
+
+    @abstractmethod
+    def produce(self, address: Any, index: int, size: int, count: int) -> None: ...
+
+    @abstractmethod
+    def consume(self, address: Any, index: int, producers: int, count: int) -> Result: ...
+
+    @abstractmethod
+    def teardown(self, address: Any) -> None: ...
+
+
+class PosixMessageQueue(Transport):
+    name = "posix-msq"
+
+    def max_size(self) -> int:
+        with open("/proc/sys/fs/mqueue/msgsize_max") as file:
+            return int(file.read())
+
+    def setup(self, producers: int, size: int) -> Any:
+        name = f"/examples-ipc-bench-{os.getpid()}"
+        posix_ipc.MessageQueue(name, posix_ipc.O_CREX, max_message_size=max(size, MIN_SIZE)).close()
+        return name
+
+    def produce(self, address: Any, index: int, size: int, count: int) -> None:
+        mq = posix_ipc.MessageQueue(address)
+        message = _message(size)
+        for _ in range(count):
+            mq.send(_stamp(message))
+        mq.close()
+
+    def consume(self, address: Any, index: int, producers: int, count: int) -> Result:
+        mq = posix_ipc.MessageQueue(address)
+        collector = _Collector()
+        for _ in range(producers * count):
+            message, _ = mq.receive()
+            collector.collect(message)
+        mq.close()
+        return collector.result()
+
+    def teardown(self, address: Any) -> None:
+        posix_ipc.unlink_message_queue(address)
+
+
+class SysvMessageQueue(Transport):
+    name = "sysv-msq"
+
+    def max_size(self) -> int:
+        return msgmax()
+
+    def setup(self, producers: int, size: int) -> Any:
+        return sysv_ipc.MessageQueue(None, sysv_ipc.IPC_CREX).key
+
+    def produce(self, address: Any, index: int, size: int, count: int) -> None:
+        message = _message(size)
+        mq = sysv_ipc.MessageQueue(address, max_message_size=len(message))
+        for _ in range(count):
+            mq.send(_stamp(message))
+
+    def consume(self, address: Any, index: int, producers: int, count: int) -> Result:
+        # sysv_ipc checks the buffer size on each side, so the consumer accepts anything up to the kernel limit.
+        mq = sysv_ipc.MessageQueue(address, max_message_size=self.max_size())
+        collector = _Collector()
+        for _ in range(producers * count):
+            message, _ = mq.receive()
+            collector.collect(message)
+        return collector.result()
+
+    def teardown(self, address: Any) -> None:
+        sysv_ipc.MessageQueue(address).remove()
+
+
+def _drain(rings: list[RingBuffer], collector: _Collector) -> int:
+    # the record views must not outlive the call, otherwise the segment cannot be detached.
+    drained = 0
+    for ring in rings:
+        for record in ring.drain():
+            collector.collect(record)
+            drained += 1
+    return drained
+
+
+class _RingTransport(Transport):
+    """one ring for each producer, drained by a single consumer."""
+
+    ring_size = 1024 * 1024
+
+    def max_size(self) -> int:
+        return self.ring_size // 4
+
+    @abstractmethod
+    def _attach(self, address: Any) -> tuple[Any, memoryview]: ...
+
+    @abstractmethod
+    def _detach(self, handle: Any) -> None: ...
+
+    def _rings(self, view: memoryview, producers: int) -> list[RingBuffer]:
+        return [RingBuffer(view[i * self.ring_size : (i + 1) * self.ring_size]) for i in range(producers)]
+
+    def produce(self, address: Any, index: int, size: int, count: int) -> None:
+        handle, view = self._attach(address)
+        ring = RingBuffer(view[index * self.ring_size : (index + 1) * self.ring_size])
+        backoff = Backoff()
+        message = _message(size)
+        for _ in range(count):
+            while not ring.push(_stamp(message)):
+                backoff.wait()
+            backoff.reset()
+        ring.close()
+        view.release()
+        self._detach(handle)
+
+    def consume(self, address: Any, index: int, producers: int, count: int) -> Result:
+        handle, view = self._attach(address)
+        rings = self._rings(view, producers)
+        backoff = Backoff()
+        collector = _Collector()
+        total = producers * count
+        while len(collector.latencies) < total:
+            if _drain(rings, collector):
+                backoff.reset()
+            else:
+                backoff.wait()
+        for ring in rings:
+            ring.close()
+        view.release()
+        self._detach(handle)
+        return collector.result()
+
+
+class PosixSharedMemory(_RingTransport):
+    name = "posix-shm"
+
+    def setup(self, producers: int, size: int) -> Any:
+        name = f"/examples-ipc-bench-{os.getpid()}"
+        shm = posix_ipc.SharedMemory(name, posix_ipc.O_CREX, size=producers * self.ring_size)
+        shm.close_fd()
+        return name
+
+    def _attach(self, address: Any) -> tuple[Any, memoryview]:
+        shm = posix_ipc.SharedMemory(address)
+        mm = mmap.mmap(shm.fd, shm.size)
+        shm.close_fd()
+        return mm, memoryview(mm)
+
+    def _detach(self, handle: Any) -> None:
+        handle.close()
+
+    def teardown(self, address: Any) -> None:
+        posix_ipc.unlink_shared_memory(address)
+
+
+class SysvSharedMemory(_RingTransport):
+    name = "sysv-shm"
+
+    def setup(self, producers: int, size: int) -> Any:
+        shm = sysv_ipc.SharedMemory(None, sysv_ipc.IPC_CREX, size=producers * self.ring_size)
+        shm.detach()
+        return shm.key
+
+    def _attach(self, address: Any) -> tuple[Any, memoryview]:
+        shm = sysv_ipc.SharedMemory(address)
+        return shm, memoryview(shm)
+
+    def _detach(self, handle: Any) -> None:
+        handle.detach()
+
+    def teardown(self, address: Any) -> None:
+        sysv_ipc.SharedMemory(address).remove()
+
+
+class _SemaphoreTransport(Transport):
+    """ping-pong between a pair of semaphores for each producer, with a consumer for each pair.
+
+    The time of each post is passed through an anonymous shared mapping inherited by the processes.
+    """
+
+    def sizes(self, requested: list[int]) -> list[int]:
+        # semaphores carry no payload.
+        return [0]
+
+    def consumers(self, producers: int) -> int:
+        return producers
+
+    @abstractmethod
+    def _open(self, address: Any, index: int) -> tuple[Any, Any]: ...
+
+    def produce(self, address: Any, index: int, size: int, count: int) -> None:
+        ping, pong = self._open(address, index)
+        stamps = memoryview(address[0]).cast("Q")
+        for _ in range(count):
+            stamps[index] = time.monotonic_ns()
+            ping.release()
+            pong.acquire()
+        stamps.release()
+
+    def consume(self, address: Any, index: int, producers: int, count: int) -> Result:
+        ping, pong = self._open(address, index)
+        stamps = memoryview(address[0]).cast("Q")
+        latencies = []
+        started = 0
+        for _ in range(count):
+            ping.acquire()
+            sent = stamps[index]
+            latencies.append(time.monotonic_ns() - sent)
+            started = started or sent
+            pong.release()
+        stamps.release()
+        return Result(latencies, started, time.monotonic_ns(), 0)
+
+
+class PosixSemaphore(_SemaphoreTransport):
+    name = "posix-sem"
+
+    def setup(self, producers: int, size: int) -> Any:
+        prefix = f"/examples-ipc-bench-{os.getpid()}"
+        for index in range(producers):
+            for role in ("ping", "pong"):
+                posix_ipc.Semaphore(f"{prefix}-{index}-{role}", posix_ipc.O_CREX).close()
+        return mmap.mmap(-1, 8 * producers), prefix, producers
+
+    def _open(self, address: Any, index: int) -> tuple[Any, Any]:
+        _, prefix, _ = address
+        return posix_ipc.Semaphore(f"{prefix}-{index}-ping"), posix_ipc.Semaphore(f"{prefix}-{index}-pong")
+
+    def teardown(self, address: Any) -> None:
+        stamps, prefix, producers = address
+        for index in range(producers):
+            for role in ("ping", "pong"):
+                posix_ipc.unlink_semaphore(f"{prefix}-{index}-{role}")
+        stamps.close()
+
+
+class SysvSemaphore(_SemaphoreTransport):
+    name = "sysv-sem"
+
+    def setup(self, producers: int, size: int) -> Any:
+        keys = [
+            (sysv_ipc.Semaphore(None, sysv_ipc.IPC_CREX).key, sysv_ipc.Semaphore(None, sysv_ipc.IPC_CREX).key)
+            for _ in range(producers)
+        ]
+        return mmap.mmap(-1, 8 * producers), keys
+
+    def _open(self, address: Any, index: int) -> tuple[Any, Any]:
+        _, keys = address
+        ping, pong = keys[index]
+        return sysv_ipc.Semaphore(ping), sysv_ipc.Semaphore(pong)
+
+    def teardown(self, address: Any) -> None:
+        stamps, keys = address
+        for ping, pong in keys:
+            sysv_ipc.Semaphore(ping).remove()
+            sysv_ipc.Semaphore(pong).remove()
+        stamps.close()
+
+
+TRANSPORTS: dict[str, type[Transport]] = {
+    transport.name: transport
+    for transport in (
+        PosixMessageQueue,
+        SysvMessageQueue,
+        PosixSharedMemory,
+        SysvSharedMemory,
+        PosixSemaphore,
+        SysvSemaphore,
+    )
+}
@@ -0,0 +1,178 @@
+import fcntl
+import os
+import struct
+from collections.abc import Buffer
+from typing import Literal, NamedTuple
+
+from . import ring, slot
+from .ring import RingBuffer
+from .slot import Slot
+
+# bus layout:
+#   0: magic(8) | topic count(u32) | reserved(u32)
+#  64: directory entries, one for each topic:
+#      name(40, utf-8) | kind(u8) | publisher lock(u8) | subscriber lock(u8) | reserved(5) | offset(u64) | size(u64)
+#  then the topic regions, each 64-byte aligned.
+#
+# the lock bytes are never written, a process claims a role on a topic with a lock on the byte range of the segment.
+MAGIC = b"SHMBUS01"
+_META = struct.Struct("=8sII")
+_ENTRY = struct.Struct("=40sB7xQQ")
+_DIRECTORY_OFFSET = 64
+MAX_NAME_BYTES = 40
+
+Kind = Literal["ring", "latest"]
+_KINDS: dict[Kind, int] = {"ring": 1, "latest": 2}
+
+DEFAULT_SIZES: dict[Kind, int] = {"ring": 64 * 1024, "latest": 4 * 1024}
+# the smallest regions the ring and the slot accept.
+MIN_SIZES: dict[Kind, int] = {"ring": ring.HEADER_SIZE + 2 * ring.RECORD_OVERHEAD, "latest": slot.HEADER_SIZE + 1}
+
+Role = Literal["publisher", "subscriber"]
+_LOCK_OFFSETS: dict[Role, int] = {"publisher": MAX_NAME_BYTES + 1, "subscriber": MAX_NAME_BYTES + 2}
+
+
+class Topic(NamedTuple):
+    name: str
+    kind: Kind
+    size: int
+
+
+def _align(size: int) -> int:
+    return (size + 63) & ~63
+
+
+def parse_topic(spec: str) -> Topic:
+    """parses `name[:ring|latest[:size]]`."""
+    name, _, rest = spec.partition(":")
+    kind, _, size = rest.partition(":")
+    kind = kind or "ring"
+    if kind not in _KINDS:
+        raise ValueError(f"topic kind [{kind}] is not one of {', '.join(_KINDS)}")
+    if not name or len(name.encode("utf-8")) > MAX_NAME_BYTES:
+        raise ValueError(f"topic name [{name}] must be 1 to {MAX_NAME_BYTES} bytes")
+    topic = Topic(name, kind, int(size) if size else DEFAULT_SIZES[kind])
+    _check_size(topic)
+    return topic
+
+
+def _check_size(topic: Topic) -> None:
+    if topic.size < MIN_SIZES[topic.kind]:
+        raise ValueError(f"{topic.kind} topic [{topic.name}] needs at least {MIN_SIZES[topic.kind]} bytes")
+
+
+def layout_size(topics: list[Topic]) -> int:
+    """the segment size needed for the topics."""
+    size = _align(_DIRECTORY_OFFSET + _ENTRY.size * len(topics))
+    return size + sum(_align(topic.size) for topic in topics)
+
+
+def format_bus(buffer: Buffer, topics: list[Topic]) -> None:
+    """writes the directory and initializes the topic regions."""
+    view = memoryview(buffer).cast("B")
+    try:
+        if len(view) < layout_size(topics):
+            raise ValueError(f"buffer of {len(view)} bytes is too small for the topics")
+        for topic in topics:
+            _check_size(topic)
+
+        offset = _align(_DIRECTORY_OFFSET + _ENTRY.size * len(topics))
+        for index, topic in enumerate(topics):
+            size = _align(topic.size)
+            entry = _DIRECTORY_OFFSET + _ENTRY.size * index
+            _ENTRY.pack_into(view, entry, topic.name.encode("utf-8"), _KINDS[topic.kind], offset, size)
+            # the ring initializes itself on an unknown header, an empty slot is all zeros.
+            view[offset : offset + slot.HEADER_SIZE] = bytes(slot.HEADER_SIZE)
+            offset += size
+
+        # publishes the directory last, so attaching processes never see it half written.
+        _META.pack_into(view, 0, MAGIC, len(topics), 0)
+
+    finally:
+        view.release()
+
+
+def is_formatted(buffer: Buffer) -> bool:
+    with memoryview(buffer) as view:
+        return bytes(view[: len(MAGIC)]) == MAGIC
+
+
+class Bus:
+    """Named topic slots in one shared memory segment.
+
+    Each topic is either a "ring" (a single-producer/single-consumer stream of records)
+    or a "latest" value cell (a seqlock-protected slot that any number of subscribers can read).
+    Publishers and subscribers attach to a topic by name through the directory at the start of the segment.
+
+    A ring has one publisher and one subscriber, and a latest cell has one publisher,
+    so attaching to a role that is already taken raises RuntimeError.
+    Other processes are excluded with a lock on `fd`, the file descriptor of the segment, if it is given,
+    which is closed with the bus. The lock is released when the process exits, even if it crashes.
+    """
+
+    def __init__(self, buffer: Buffer, fd: int | None = None) -> None:
+        self._view = memoryview(buffer).cast("B")
+        self._fd = fd
+        magic, count, _ = _META.unpack_from(self._view, 0)
+        if magic != MAGIC:
+            raise ValueError("shared memory does not contain a bus")
+
+        self._entries: dict[str, tuple[Kind, int, int]] = {}
+        kinds = {value: kind for kind, value in _KINDS.items()}
+        for index in range(count):
+            name, kind, offset, size = _ENTRY.unpack_from(self._view, _DIRECTORY_OFFSET + _ENTRY.size * index)
+            self._entries[name.rstrip(b"\0").decode("utf-8")] = (kinds[kind], offset, size)
+        self._indexes = {name: index for index, name in enumerate(self._entries)}
+
+        self._attached: list[RingBuffer | Slot] = []
+        self._claims: set[tuple[str, Role]] = set()
+
+    @property
+    def topics(self) -> list[Topic]:
+        return [Topic(name, kind, size) for name, (kind, _, size) in self._entries.items()]
+
+    def _region(self, name: str, kind: Kind) -> memoryview:
+        if name not in self._entries:
+            raise KeyError(f"topic [{name}] is not found")
+        actual, offset, size = self._entries[name]
+        if actual != kind:
+            raise ValueError(f"topic [{name}] is a {actual} topic")
+        return self._view[offset : offset + size]
+
+    def _claim(self, name: str, role: Role) -> None:
+        """takes the role on the topic, both for this process and for the other processes."""
+        if (name, role) in self._claims:
+            raise RuntimeError(f"topic [{name}] already has a {role} in this process")
+        if self._fd is not None:
+            position = _DIRECTORY_OFFSET + _ENTRY.size * self._indexes[name] + _LOCK_OFFSETS[role]
+            try:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, position)
+            except BlockingIOError:
+                raise RuntimeError(f"topic [{name}] already has a {role} in another process") from None
+        self._claims.add((name, role))
+
+    def ring(self, name: str, role: Role) -> RingBuffer:
+        """attaches to the ring topic as its only publisher or its only subscriber."""
+        with self._region(name, "ring") as region:
+            self._claim(name, role)
+            stream = RingBuffer(region)
+        self._attached.append(stream)
+        return stream
+
+    def latest(self, name: str, role: Role) -> Slot:
+        """attaches to the latest topic, as its only publisher or as one of its subscribers."""
+        with self._region(name, "latest") as region:
+            if role == "publisher":
+                self._claim(name, role)
+            cell = Slot(region)
+        self._attached.append(cell)
+        return cell
+
+    def close(self) -> None:
+        for attached in self._attached:
+            attached.close()
+        self._view.release()
+        if self._fd is not None:
+            # releases the locks of the topics.
+            os.close(self._fd)
+            self._fd = None
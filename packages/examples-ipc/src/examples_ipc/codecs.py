@@ -0,0 +1,155 @@
+"""Serializers for the queue payloads.
+
+`orjson` and `msgpack` codecs are registered only when the packages are installed.
+"""
+
+import contextlib
+import json
+import pickle
+import struct
+from abc import ABC, abstractmethod
+from typing import Any
+
+from .framing import COUNTER
+
+DEFAULT_CODEC = "json"
+"""the codec of single messages, compatible with the clients that send JSON documents."""
+
+DEFAULT_RECORD_CODEC = "struct"
+"""the codec of the records packed into frames, the fixed layout of `{"count": n}`."""
+
+
+class Codec(ABC):
+    """Encodes an object to bytes and decodes it back."""
+
+    name = ""
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes: ...
+
+    @abstractmethod
+    def decode(self, data: bytes | memoryview) -> Any: ...
+
+
+class JsonCodec(Codec):
+    name = "json"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+class PickleCodec(Codec):
+    """pickle protocol 5, with the out-of-band buffers appended to the pickle instead of copied into it.
+
+    layout: buffer count(u32) | pickle length(u64) | buffer lengths(u64 * count) | pickle | buffers
+    The buffers are decoded as views into the message without copying.
+    """
+
+    name = "pickle"
+
+    _COUNT = struct.Struct("<IQ")
+
+    def encode(self, obj: Any) -> bytes:
+        buffers: list[pickle.PickleBuffer] = []
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        raws = [buffer.raw() for buffer in buffers]
+        header = self._COUNT.pack(len(raws), len(data)) + struct.pack(f"<{len(raws)}Q", *(len(raw) for raw in raws))
+        return b"".join([header, data, *raws])
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        count, length = self._COUNT.unpack_from(data, 0)
+        offset = self._COUNT.size
+        lengths = struct.unpack_from(f"<{count}Q", data, offset)
+        offset += 8 * count
+
+        view = memoryview(data)
+        pickled = view[offset : offset + length]
+        offset += length
+        buffers = []
+        for size in lengths:
+            buffers.append(view[offset : offset + size])
+            offset += size
+        return pickle.loads(pickled, buffers=buffers)
+
+
+class StructCodec(Codec):
+    """Fixed-layout codec of a dict with the fields, nothing to parse on decode.
+
+    A dict with other keys is rejected, as the layout has no room for them.
+    """
+
+    def __init__(self, name: str, fields: tuple[str, ...], layout: struct.Struct) -> None:
+        self.name = name
+        self._fields = fields
+        self._keys = frozenset(fields)
+        self._layout = layout
+
+    def encode(self, obj: Any) -> bytes:
+        if obj.keys() != self._keys:
+            others = ", ".join(str(key) for key in obj if key not in self._keys)
+            missing = ", ".join(field for field in self._fields if field not in obj)
+            raise ValueError(
+                f"the {self.name} codec needs the fields [{', '.join(self._fields)}]"
+                f" (missing: [{missing}], not in the layout: [{others}])"
+            )
+        return self._layout.pack(*(obj[field] for field in self._fields))
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        return dict(zip(self._fields, self._layout.unpack(data), strict=True))
+
+
+class OrjsonCodec(Codec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def encode(self, obj: Any) -> bytes:
+        data: bytes = self._orjson.dumps(obj)
+        return data
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    name = "msgpack"
+
+    def __init__(self) -> None:
+        import msgpack
+
+        self._msgpack = msgpack
+
+    def encode(self, obj: Any) -> bytes:
+        data: bytes = self._msgpack.packb(obj)
+        return data
+
+    def decode(self, data: bytes | memoryview) -> Any:
+        return self._msgpack.unpackb(data)
+
+
+CODECS: dict[str, Codec] = {}
+
+
+def register(codec: Codec) -> Codec:
+    CODECS[codec.name] = codec
+    return codec
+
+
+def get_codec(name: str) -> Codec:
+    if name not in CODECS:
+        raise ValueError(f"codec [{name}] is not one of {', '.join(CODECS)}")
+    return CODECS[name]
+
+
+register(JsonCodec())
+register(PickleCodec())
+register(StructCodec("struct", ("count",), COUNTER))
+for _optional in (OrjsonCodec, MsgpackCodec):
+    with contextlib.suppress(ImportError):
+        register(_optional())
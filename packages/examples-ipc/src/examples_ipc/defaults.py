@@ -0,0 +1,14 @@
+"""Defaults shared by the argument parsers and the modules they describe.
+
+The parsers are built for every run, so this module imports nothing,
+and the modules behind the defaults are imported only by the subcommand that runs.
+"""
+
+DEFAULT_SLOT_SIZE = 1024 * 1024
+"""the size of a slot of a spill arena."""
+
+DEFAULT_SLOTS = 16
+"""the number of slots of a spill arena."""
+
+DEFAULT_HANDLER = "examples_ipc.workers:print_record"
+"""the handler the workers call with each record."""
@@ -0,0 +1,70 @@
+import json
+import struct
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import NamedTuple
+
+# event a client posts to the companion queue of a semaphore after changing it:
+#   time(ns, i64) | pid(i32) | delta(i32) | value after the change(i32) | wait(ns, i64)
+_EVENT = struct.Struct("<qiiiq")
+EVENT_SIZE = _EVENT.size
+
+DEFAULT_HISTORY_SIZE = 1024
+
+
+class SemaphoreEvent(NamedTuple):
+    time_ns: int
+    pid: int
+    delta: int
+    value: int
+    wait_ns: int
+
+    def format(self) -> str:
+        now = datetime.fromtimestamp(self.time_ns / 1e9).time()
+        text = f"{now} pid {self.pid}: {self.delta:+d} -> semaphore: {self.value}"
+        if self.wait_ns:
+            text += f" (waited {self.wait_ns / 1e6:.3f}ms)"
+        return text
+
+
+def encode_event(pid: int, delta: int, value: int, wait_ns: int = 0) -> bytes:
+    """stamps the event with the wall clock, comparable between processes."""
+    return _EVENT.pack(time.time_ns(), pid, delta, value, wait_ns)
+
+
+def decode_event(message: bytes) -> SemaphoreEvent:
+    return SemaphoreEvent(*_EVENT.unpack_from(message, 0))
+
+
+class EventHistory:
+    """Ring of the latest semaphore events, the oldest are dropped once it is full."""
+
+    def __init__(self, size: int = DEFAULT_HISTORY_SIZE) -> None:
+        self._events: deque[SemaphoreEvent] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[SemaphoreEvent]:
+        return iter(self._events)
+
+    def append(self, event: SemaphoreEvent) -> None:
+        self._events.append(event)
+
+    def extend(self, events: Iterable[SemaphoreEvent]) -> None:
+        self._events.extend(events)
+
+    def to_json(self) -> str:
+        return json.dumps([event._asdict() for event in self._events], indent=2)
+
+
+def export_history(history: EventHistory, path: str | None) -> None:
+    """writes the history as JSON to the file, or to stdout with '-'."""
+    if path == "-":
+        print(history.to_json())
+    elif path:
+        with open(path, "w") as file:
+            file.write(history.to_json())
+        print(f"{path} is written.")
@@ -0,0 +1,107 @@
+import struct
+import time
+from typing import NamedTuple
+
+# frame layout (little endian):
+#   header: magic(2) | record count(u32) | sent time ns(u64)
+#   record: length(u32) | payload(length)
+MAGIC = b"\xb1F"
+_HEADER = struct.Struct("<2sIQ")
+_LENGTH = struct.Struct("<I")
+
+HEADER_SIZE = _HEADER.size
+RECORD_OVERHEAD = _LENGTH.size
+
+# the fixed layout record used by the examples in place of `{"count": i}`.
+COUNTER = struct.Struct("<q")
+
+
+class Frame(NamedTuple):
+    sent_ns: int
+    records: list[memoryview]
+
+
+class FrameBuilder:
+    """Packs many records into a single length-prefixed binary frame.
+
+    The frame never grows beyond `capacity` bytes,
+    which should be the maximum message size of the queue.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= HEADER_SIZE + RECORD_OVERHEAD:
+            raise ValueError(f"capacity [{capacity}] is too small for a frame")
+        self._capacity = capacity
+        self._buffer = bytearray(HEADER_SIZE)
+        self._count = 0
+        self._started = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def age(self) -> float:
+        """seconds since the first record was appended."""
+        return time.monotonic() - self._started if self._count else 0.0
+
+    def fits(self, record: bytes) -> bool:
+        return len(self._buffer) + RECORD_OVERHEAD + len(record) <= self._capacity
+
+    def append(self, record: bytes) -> bool:
+        """append the record, returns False if the frame has no room for it."""
+        if not self.fits(record):
+            if self._count == 0:
+                raise ValueError(f"record of {len(record)} bytes exceeds the frame capacity")
+            return False
+
+        if self._count == 0:
+            self._started = time.monotonic()
+        self._buffer += _LENGTH.pack(len(record))
+        self._buffer += record
+        self._count += 1
+        return True
+
+    def build(self) -> bytes:
+        """returns the frame and resets the builder for the next batch."""
+        _HEADER.pack_into(self._buffer, 0, MAGIC, self._count, time.time_ns())
+        frame = bytes(self._buffer)
+        del self._buffer[HEADER_SIZE:]
+        self._count = 0
+        return frame
+
+
+def is_frame(message: bytes) -> bool:
+    # a shorter message, such as a fixed-layout record sent on its own, is never a frame.
+    return len(message) >= HEADER_SIZE and message[: len(MAGIC)] == MAGIC
+
+
+def decode_frame(message: bytes) -> Frame:
+    """unpack the frame, the records are views into the message without copying.
+
+    raises ValueError if the message is not a whole frame, such as a truncated one.
+    """
+    size = len(message)
+    if size < HEADER_SIZE:
+        raise ValueError(f"message of {size} bytes is shorter than a frame header")
+    magic, count, sent_ns = _HEADER.unpack_from(message, 0)
+    if magic != MAGIC:
+        raise ValueError("message is not a frame")
+    if count > (size - HEADER_SIZE) // RECORD_OVERHEAD:
+        raise ValueError(f"frame of {size} bytes cannot hold {count} records")
+
+    view = memoryview(message)
+    records = []
+    offset = HEADER_SIZE
+    for index in range(count):
+        if offset + RECORD_OVERHEAD > size:
+            raise ValueError(f"frame is truncated in the length of record {index}")
+        (length,) = _LENGTH.unpack_from(message, offset)
+        offset += RECORD_OVERHEAD
+        if offset + length > size:
+            raise ValueError(f"frame is truncated in record {index} of {length} bytes")
+        records.append(view[offset : offset + length])
+        offset += length
+
+    if offset != size:
+        raise ValueError(f"frame has {size - offset} bytes after its {count} records")
+    return Frame(sent_ns, records)
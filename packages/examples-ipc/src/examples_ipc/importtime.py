@@ -0,0 +1,84 @@
+"""Startup report of the modules imported by a run, in the format of `python -X importtime`.
+
+Enabled by the `EXAMPLES_IPC_IMPORTTIME` environment variable, it times the modules imported
+after the CLI starts, which are the ones a subcommand adds to the startup.
+"""
+
+import sys
+import time
+from collections.abc import Sequence
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, TextIO
+
+
+class ImportReport:
+    def __init__(self) -> None:
+        self.started = time.perf_counter_ns()
+        # (self us, cumulative us, depth, name) in the order the imports complete.
+        self.entries: list[tuple[int, int, int, str]] = []
+        self._children: list[int] = [0]
+
+    def enter(self) -> None:
+        self._children.append(0)
+
+    def leave(self, name: str, elapsed_ns: int) -> None:
+        children = self._children.pop()
+        self._children[-1] += elapsed_ns
+        self.entries.append(((elapsed_ns - children) // 1000, elapsed_ns // 1000, len(self._children) - 1, name))
+
+    def print(self, file: TextIO = sys.stderr) -> None:
+        print("import time: self [us] | cumulative | imported package", file=file)
+        for self_us, cumulative_us, depth, name in self.entries:
+            print(f"import time: {self_us:>9} | {cumulative_us:>10} | {'  ' * depth}{name}", file=file)
+        total = (time.perf_counter_ns() - self.started) / 1e6
+        imported = self._children[0] / 1e6
+        print(f"startup: {total:.3f}ms, {len(self.entries)} modules imported in {imported:.3f}ms", file=file)
+
+
+class _TimedLoader(Loader):
+    def __init__(self, loader: Loader, report: ImportReport) -> None:
+        self._loader = loader
+        self._report = report
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._report.enter()
+        started = time.perf_counter_ns()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._report.leave(module.__name__, time.perf_counter_ns() - started)
+
+
+class _TimedFinder(MetaPathFinder):
+    """Finds the modules with the other finders and times their loaders."""
+
+    def __init__(self, report: ImportReport) -> None:
+        self._report = report
+
+    def find_spec(
+        self, fullname: str, path: Sequence[str] | None, target: ModuleType | None = None
+    ) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec: ModuleSpec | None = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self._report)
+                return spec
+        return None
+
+
+def install() -> ImportReport:
+    """times the imports from now on."""
+    report = ImportReport()
+    sys.meta_path.insert(0, _TimedFinder(report))
+    return report
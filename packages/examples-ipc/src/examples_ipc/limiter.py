@@ -0,0 +1,175 @@
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Self
+
+# the longest an async acquire blocks a thread of the executor before it checks whether it was cancelled.
+_ASYNC_WAIT_STEP = 0.1
+
+
+@dataclass
+class LimiterStats:
+    """what this process observed while acquiring units of the limiter."""
+
+    acquired: int = 0
+    fast: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    wait_total_ns: int = 0
+    wait_max_ns: int = 0
+
+    def observe_wait(self, wait_ns: int) -> None:
+        self.wait_total_ns += wait_ns
+        self.wait_max_ns = max(self.wait_max_ns, wait_ns)
+
+    def summary(self) -> str:
+        text = f"acquired: {self.acquired} (fast: {self.fast}, contended: {self.contended}), timeouts: {self.timeouts}"
+        if self.contended:
+            average = self.wait_total_ns / self.contended / 1e6
+            text += f", wait: {average:.3f}ms (max {self.wait_max_ns / 1e6:.3f}ms)"
+        return text
+
+
+class ResourceLimiter(ABC):
+    """Limits the concurrent use of a resource across processes with a counting semaphore.
+
+    `acquire()` first tries to take the units without blocking, which costs no wait at all
+    while the resource is not contended, and only then blocks in the kernel until the units
+    are released or the timeout expires, so no polling latency is added.
+    As a context manager (sync or async) it holds `units` units for the block and raises
+    `TimeoutError` when they cannot be acquired within `timeout` seconds.
+    """
+
+    max_units: int | None = None
+    """the most units one acquire can take, None if unlimited."""
+
+    def __init__(self, units: int = 1, timeout: float | None = None) -> None:
+        self._check_units(units)
+        self.units = units
+        self.timeout = timeout
+        self.stats = LimiterStats()
+
+    def _check_units(self, units: int) -> None:
+        if units < 1:
+            raise ValueError(f"units [{units}] must be at least 1")
+        if self.max_units is not None and units > self.max_units:
+            raise ValueError(f"units [{units}] must be at most {self.max_units} with {type(self).__name__}")
+
+    @abstractmethod
+    def _try_acquire(self, units: int) -> bool:
+        """takes the units if they are all available without blocking."""
+
+    @abstractmethod
+    def _acquire(self, units: int, timeout: float | None) -> bool:
+        """blocks until the units are taken, returns False on timeout."""
+
+    @abstractmethod
+    def _release(self, units: int) -> None: ...
+
+    @property
+    @abstractmethod
+    def value(self) -> int:
+        """the units available now."""
+
+    def _notify(self, delta: int, wait_ns: int) -> None:  # noqa: B027
+        """called after the units are taken (negative delta) or given back, for a monitor to observe."""
+        pass
+
+    def acquire(self, units: int = 1, timeout: float | None = None) -> bool:
+        """takes the units, waiting up to `timeout` seconds (forever if None), returns False on timeout."""
+        self._check_units(units)
+        if self._try_acquire(units):
+            self.stats.acquired += 1
+            self.stats.fast += 1
+            self._notify(-units, 0)
+            return True
+
+        self.stats.contended += 1
+        started = time.perf_counter_ns()
+        try:
+            acquired = timeout != 0 and self._acquire(units, timeout)
+        finally:
+            wait_ns = time.perf_counter_ns() - started
+            self.stats.observe_wait(wait_ns)
+
+        if acquired:
+            self.stats.acquired += 1
+            self._notify(-units, wait_ns)
+        else:
+            self.stats.timeouts += 1
+        return acquired
+
+    def release(self, units: int = 1) -> None:
+        self._release(units)
+        self._notify(units, 0)
+
+    def __enter__(self) -> Self:
+        if not self.acquire(self.units, self.timeout):
+            raise TimeoutError(f"{self.units} units are not acquired within {self.timeout}s")
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.release(self.units)
+
+    def _acquire_until(self, units: int, deadline: float | None, cancelled: threading.Event) -> bool:
+        """`_acquire()` in waits of `_ASYNC_WAIT_STEP` at most, until the deadline or the cancellation."""
+        while not cancelled.is_set():
+            step = _ASYNC_WAIT_STEP if deadline is None else min(_ASYNC_WAIT_STEP, deadline - time.monotonic())
+            if step <= 0:
+                return False
+            if self._acquire(units, step):
+                return True
+        return False
+
+    async def acquire_async(self, units: int = 1, timeout: float | None = None) -> bool:
+        """`acquire()` without blocking the event loop, the kernel wait runs in the default executor.
+
+        The wait is split into short timed waits, so that the thread stops soon after the caller is cancelled
+        instead of blocking the shutdown of the executor.
+        """
+        self._check_units(units)
+        if self._try_acquire(units):
+            self.stats.acquired += 1
+            self.stats.fast += 1
+            self._notify(-units, 0)
+            return True
+
+        self.stats.contended += 1
+        deadline = None if timeout is None else time.monotonic() + timeout
+        cancelled = threading.Event()
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter_ns()
+        waiting = loop.run_in_executor(None, self._acquire_until, units, deadline, cancelled)
+        try:
+            acquired = await asyncio.shield(waiting)
+        except asyncio.CancelledError:
+            cancelled.set()
+            # gives the units back if the wait took them before it saw the cancellation.
+            waiting.add_done_callback(
+                lambda done: (
+                    self._release(units)
+                    if not done.cancelled() and done.exception() is None and done.result()
+                    else None
+                )
+            )
+            raise
+        finally:
+            wait_ns = time.perf_counter_ns() - started
+            self.stats.observe_wait(wait_ns)
+
+        if acquired:
+            self.stats.acquired += 1
+            self._notify(-units, wait_ns)
+        else:
+            self.stats.timeouts += 1
+        return acquired
+
+    async def __aenter__(self) -> Self:
+        if not await self.acquire_async(self.units, self.timeout):
+            raise TimeoutError(f"{self.units} units are not acquired within {self.timeout}s")
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        self.release(self.units)
@@ -1,25 +1,72 @@
 from argparse import ArgumentParser, Namespace
 
-import posix_ipc
-
-from .client import run as _client_run
-from .server import run as _service_run
+from ...codecs import CODECS
+from ...defaults import DEFAULT_HANDLER, DEFAULT_SLOT_SIZE
 
 
 def _clean(name: str) -> None:
+    import posix_ipc
+
+    from ...registry import POSIX_MESSAGE_QUEUE, unregister
+
     posix_ipc.unlink_message_queue(name)
+    unregister(POSIX_MESSAGE_QUEUE, name)
     print(f"{name} is removed.")
 
 
+def _names(args: Namespace) -> list[str]:
+    names = list(args.names or [])
+    if args.glob:
+        from .fanin_server import glob_queues
+
+        names += [name for name in glob_queues(args.glob) if name not in names]
+    return names or [args.name]
+
+
 def _run(args: Namespace) -> None:
     if args.clean:
         _clean(args.name)
 
+    elif args.is_server_mode and args.is_async_mode:
+        from .aio_server import run as _aio_service_run
+
+        _aio_service_run(_names(args), codec=args.codec)
+
+    elif args.is_server_mode and args.is_fan_in_mode:
+        from .fanin_server import run as _fanin_service_run
+
+        _fanin_service_run(_names(args), codec=args.codec)
+
+    elif args.is_server_mode and args.workers:
+        from .workers import run as _workers_run
+
+        _workers_run(args.name, args.workers, args.handler, args.codec)
+
     elif args.is_server_mode:
-        _service_run(args.name)
+        from .server import run as _service_run
+
+        _service_run(args.name, args.codec)
+
+    elif args.batch_size:
+        from .client import run_batched as _client_run_batched
+
+        _client_run_batched(args.name, args.count, args.batch_size, args.linger, args.priority, args.codec)
 
     else:
-        _client_run(args.name, args.count)
+        if args.codec == "struct" and args.payload_size:
+            raise ValueError("the struct codec has only the count, --payload-size needs another codec")
+
+        from .client import run as _client_run
+
+        _client_run(
+            args.name,
+            args.count,
+            args.priority,
+            args.codec,
+            args.payload_size,
+            args.spill_threshold,
+            args.slot_size,
+        )
 
 
 def configure_arguments(parser: ArgumentParser) -> None:
@@ -36,6 +83,63 @@ def configure_arguments(parser: ArgumentParser) -> None:
         help="run as a service and displays the contents of the message queue.",
         default=False,
     )
+    parser.add_argument(
+        "-a",
+        "--async",
+        action="store_true",
+        dest="is_async_mode",
+        help="run the service on an asyncio event loop, draining the queues without blocking.",
+        default=False,
+    )
+    parser.add_argument(
+        "-f",
+        "--fan-in",
+        action="store_true",
+        dest="is_fan_in_mode",
+        help="run the service over many queues multiplexed with select/epoll, in priority order.",
+        default=False,
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="run the service as a pool of worker processes competing for the messages.",
+        default=None,
+    )
+    parser.add_argument(
+        "--handler",
+        help="the function called with each decoded record in worker mode, as module:function. (default: %(default)s)",
+        default=DEFAULT_HANDLER,
+    )
+    parser.add_argument(
+        "--codec",
+        choices=list(CODECS),
+        help="the serializer of the payloads, the same on the client and the server. "
+        "(default: json for messages, struct for batched records)",
+        default=None,
+    )
+    parser.add_argument(
+        "--payload-size",
+        dest="payload_size",
+        type=int,
+        help="the size of the string payload added to each message in client mode.",
+        default=0,
+    )
+    parser.add_argument(
+        "--spill-threshold",
+        dest="spill_threshold",
+        type=int,
+        help="the message size in bytes above which the client writes the message to a shared memory arena "
+        "and sends only its descriptor.",
+        default=None,
+    )
+    parser.add_argument(
+        "--slot-size",
+        dest="slot_size",
+        type=int,
+        help="the size of each slot of the shared memory arena. (default: %(default)s)",
+        default=DEFAULT_SLOT_SIZE,
+    )
     parser.add_argument(
         "-c",
         "--count",
@@ -44,6 +148,26 @@ def configure_arguments(parser: ArgumentParser) -> None:
         help="the number of send in client mode.",
         default=10,
     )
+    parser.add_argument(
+        "-p",
+        "--priority",
+        type=int,
+        help="the message priority in client mode, higher is received first.",
+        default=0,
+    )
+    parser.add_argument(
+        "--batch-size",
+        dest="batch_size",
+        type=int,
+        help="the number of records packed into a binary frame per send in client mode.",
+        default=None,
+    )
+    parser.add_argument(
+        "--linger",
+        type=float,
+        help="the seconds to wait for a batch to fill before sending it. (default: %(default)s)",
+        default=0.005,
+    )
     parser.add_argument(
         "-n",
         "--name",
@@ -51,4 +175,15 @@ def configure_arguments(parser: ArgumentParser) -> None:
         help="messaging queue name.",
         default="/test-queue",
     )
+    parser.add_argument(
+        "--names",
+        nargs="+",
+        help="messaging queue names served at once in async or fan-in server mode. (default: --name)",
+        default=None,
+    )
+    parser.add_argument(
+        "--glob",
+        help="serves the queues in /dev/mqueue matching the pattern in async or fan-in server mode.",
+        default=None,
+    )
     parser.set_defaults(exec=lambda args: _run(args))
@@ -0,0 +1,91 @@
+import asyncio
+import reprlib
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import datetime
+
+import posix_ipc
+
+from ...codecs import DEFAULT_CODEC, DEFAULT_RECORD_CODEC, get_codec
+from ...framing import decode_frame, is_frame
+from ...registry import POSIX_MESSAGE_QUEUE, register
+from ...spill import SpillReader
+
+Handler = Callable[[str, bytes, int], Awaitable[None]]
+"""async handler called with (queue name, message, priority) for each message."""
+
+
+def printer(codec: str | None = None) -> Handler:
+    """returns a handler which prints the messages decoded by the codec."""
+    message_codec = get_codec(codec or DEFAULT_CODEC)
+    record_codec = get_codec(codec or DEFAULT_RECORD_CODEC)
+    spill = SpillReader()
+
+    async def print_message(name: str, message: bytes, priority: int) -> None:
+        now = datetime.now().time()
+        if is_frame(message):
+            frame = decode_frame(message)
+            last = record_codec.decode(frame.records[-1])
+            print(now, name, f"{len(frame.records)} records, last: {last}")
+        else:
+            with spill.payload(message) as payload:
+                print(now, name, reprlib.repr(message_codec.decode(payload)))
+
+    return print_message
+
+
+print_message = printer()
+
+
+def _drain(mq: posix_ipc.MessageQueue) -> Iterator[tuple[bytes, int]]:
+    while True:
+        try:
+            yield mq.receive()
+        except posix_ipc.BusyError:
+            return
+
+
+async def _serve_queue(mq: posix_ipc.MessageQueue, handler: Handler) -> None:
+    loop = asyncio.get_running_loop()
+    readable = asyncio.Event()
+
+    # the queue descriptor is a file descriptor on Linux, so it can be polled by the event loop.
+    loop.add_reader(mq.mqd, readable.set)
+    try:
+        while True:
+            await readable.wait()
+            readable.clear()
+            for message, priority in _drain(mq):
+                await handler(mq.name, message, priority)
+
+    finally:
+        loop.remove_reader(mq.mqd)
+
+
+async def serve(names: list[str], handler: Handler = print_message) -> None:
+    """serves all the queues on the running event loop until canceled."""
+    queues = [posix_ipc.MessageQueue(name, posix_ipc.O_CREAT) for name in names]
+    for name in names:
+        register(POSIX_MESSAGE_QUEUE, name)
+    try:
+        for mq in queues:
+            mq.block = False
+
+        async with asyncio.TaskGroup() as group:
+            for mq in queues:
+                group.create_task(_serve_queue(mq, handler))
+
+    finally:
+        for mq in queues:
+            mq.close()
+
+
+def run(names: list[str], handler: Handler | None = None, codec: str | None = None) -> None:
+    print(f"start async queue server: {', '.join(names)}")
+    try:
+        asyncio.run(serve(names, handler or printer(codec)))
+
+    except KeyboardInterrupt:
+        print("canceled.")
+        pass
+
+    print(f"end async queue server: {', '.join(names)}")
@@ -1,18 +1,47 @@
-import json
+import os
 import time
+from typing import Any
 
 import posix_ipc
 
+from ...codecs import DEFAULT_CODEC, DEFAULT_RECORD_CODEC, get_codec
+from ...defaults import DEFAULT_SLOT_SIZE
+from ...framing import FrameBuilder
+from ...registry import POSIX_MESSAGE_QUEUE, register
+from ...spill import Arena, arena_name
 
-def run(name: str, count: int) -> None:
+
+def run(
+    name: str,
+    count: int,
+    priority: int = 0,
+    codec: str | None = None,
+    payload_size: int = 0,
+    spill_threshold: int | None = None,
+    slot_size: int = DEFAULT_SLOT_SIZE,
+) -> None:
+    """sends a message a second, with a payload of `payload_size` bytes.
+
+    Messages larger than `spill_threshold` bytes are written to a shared memory arena,
+    and only their descriptors are sent over the queue.
+    """
+    encoder = get_codec(codec or DEFAULT_CODEC)
     mq = posix_ipc.MessageQueue(name, posix_ipc.O_CREAT)
+    register(POSIX_MESSAGE_QUEUE, name)
+
+    arena = Arena.create(arena_name(name, os.getpid()), slot_size) if spill_threshold is not None else None
 
     print(f"send to {name} {count} times.")
     try:
         for i in range(count):
             counter = i
-            obj = {"count": counter}
-            mq.send(json.dumps(obj))
+            obj: dict[str, Any] = {"count": counter}
+            if payload_size:
+                obj["payload"] = "x" * payload_size
+            data = encoder.encode(obj)
+            if arena is not None and len(data) > (spill_threshold or 0):
+                data = arena.spill(data)
+            mq.send(data, priority=priority)
             print(f"pushed: {counter}")
             time.sleep(1)
 
@@ -21,4 +50,46 @@ def run(name: str, count: int) -> None:
         pass
 
     mq.close()
+    if arena is not None:
+        # the server releases the slots of the spilled payloads it received.
+        if not arena.wait_idle(5.0):
+            print(f"{arena.in_use()} spilled payloads are not received.")
+        arena.close(unlink=True)
     print("send complete.")
+
+
+def run_batched(
+    name: str, count: int, batch_size: int, linger: float, priority: int = 0, codec: str | None = None
+) -> None:
+    encoder = get_codec(codec or DEFAULT_RECORD_CODEC)
+    mq = posix_ipc.MessageQueue(name, posix_ipc.O_CREAT)
+    batch = FrameBuilder(mq.max_message_size)
+    sent = 0
+
+    def flush() -> None:
+        nonlocal sent
+        if len(batch):
+            mq.send(batch.build(), priority=priority)
+            sent += 1
+
+    print(f"send to {name} {count} records, batch size: {batch_size}, linger: {linger}s.")
+    started = time.perf_counter()
+    try:
+        for i in range(count):
+            record = encoder.encode({"count": i})
+            if not batch.append(record):
+                flush()
+                batch.append(record)
+
+            if len(batch) >= batch_size or batch.age >= linger:
+                flush()
+
+        flush()
+
+    except KeyboardInterrupt:
+        print("canceled.")
+        pass
+
+    elapsed = time.perf_counter() - started
+    mq.close()
+    print(f"send complete. {count} records in {sent} messages, {elapsed:.3f}s ({count / elapsed:,.0f} records/s)")
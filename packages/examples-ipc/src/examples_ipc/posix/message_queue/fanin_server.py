@@ -0,0 +1,129 @@
+import glob
+import heapq
+import reprlib
+import selectors
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import posix_ipc
+
+from ...codecs import DEFAULT_CODEC, Codec, get_codec
+from ...framing import decode_frame, is_frame
+from ...registry import POSIX_MESSAGE_QUEUE, register
+from ...spill import SpillReader
+
+MQUEUE_DIR = "/dev/mqueue"
+
+
+def glob_queues(pattern: str) -> list[str]:
+    """returns the names of the queues in /dev/mqueue which match the pattern."""
+    return sorted(f"/{Path(path).name}" for path in glob.glob(pattern, root_dir=MQUEUE_DIR))
+
+
+@dataclass
+class QueueStats:
+    name: str
+    messages: int = 0
+    records: int = 0
+    depth: int = 0
+    max_depth: int = 0
+    latency_count: int = 0
+    latency_total_ns: int = 0
+    latency_max_ns: int = 0
+
+    def observe_depth(self, depth: int) -> None:
+        self.depth = depth
+        self.max_depth = max(self.max_depth, depth)
+
+    def observe_latency(self, latency_ns: int) -> None:
+        self.latency_count += 1
+        self.latency_total_ns += latency_ns
+        self.latency_max_ns = max(self.latency_max_ns, latency_ns)
+
+    def summary(self) -> str:
+        text = f"{self.name} messages: {self.messages}, records: {self.records}"
+        text += f", depth: {self.depth} (max {self.max_depth})"
+        if self.latency_count:
+            average = self.latency_total_ns / self.latency_count / 1e6
+            text += f", latency: {average:.3f}ms (max {self.latency_max_ns / 1e6:.3f}ms)"
+        return text
+
+    def reset(self) -> None:
+        self.messages = self.records = self.max_depth = 0
+        self.latency_count = self.latency_total_ns = self.latency_max_ns = 0
+
+
+def _dispatch(stats: QueueStats, message: bytes, priority: int, codec: Codec, spill: SpillReader) -> None:
+    stats.messages += 1
+    if is_frame(message):
+        frame = decode_frame(message)
+        stats.records += len(frame.records)
+        stats.observe_latency(time.time_ns() - frame.sent_ns)
+    else:
+        stats.records += 1
+        now = datetime.now().time()
+        with spill.payload(message) as payload:
+            print(now, stats.name, f"priority: {priority}", reprlib.repr(codec.decode(payload)))
+
+
+def _receive_ready(
+    selector: selectors.BaseSelector,
+    timeout: float,
+) -> list[tuple[int, int, QueueStats, bytes]]:
+    """receives the pending messages of all the ready queues, ordered by priority."""
+    pending: list[tuple[int, int, QueueStats, bytes]] = []
+    for key, _ in selector.select(timeout):
+        mq, stats = key.data
+        depth = mq.current_messages
+        stats.observe_depth(depth)
+
+        # receives no more than the depth at wakeup, so a busy queue cannot starve the others.
+        for _ in range(depth):
+            try:
+                message, priority = mq.receive()
+            except posix_ipc.BusyError:
+                break
+            heapq.heappush(pending, (-priority, len(pending), stats, message))
+
+    return [heapq.heappop(pending) for _ in range(len(pending))]
+
+
+def run(names: list[str], interval: float = 1.0, codec: str | None = None) -> None:
+    message_codec = get_codec(codec or DEFAULT_CODEC)
+    spill = SpillReader()
+    queues = [posix_ipc.MessageQueue(name, posix_ipc.O_CREAT) for name in names]
+    for name in names:
+        register(POSIX_MESSAGE_QUEUE, name)
+    selector = selectors.DefaultSelector()
+    for mq in queues:
+        mq.block = False
+        # the queue descriptor is a file descriptor on Linux, so it can be registered with epoll.
+        selector.register(mq.mqd, selectors.EVENT_READ, (mq, QueueStats(mq.name)))
+
+    print(f"start fan-in queue server: {', '.join(names)}")
+    try:
+        reported = time.monotonic()
+        while True:
+            for negative_priority, _, stats, message in _receive_ready(selector, interval):
+                _dispatch(stats, message, -negative_priority, message_codec, spill)
+
+            if time.monotonic() - reported >= interval:
+                now = datetime.now().time()
+                for key in selector.get_map().values():
+                    _, stats = key.data
+                    if stats.messages:
+                        print(now, stats.summary())
+                        stats.reset()
+                reported = time.monotonic()
+
+    except KeyboardInterrupt:
+        print("canceled.")
+        pass
+
+    spill.close()
+    selector.close()
+    for mq in queues:
+        mq.close()
+    print(f"end fan-in queue server: {', '.join(names)}")
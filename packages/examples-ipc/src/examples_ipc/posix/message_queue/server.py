@@ -1,24 +1,63 @@
-import json
+import reprlib
 import time
 from datetime import datetime
 
 import posix_ipc
 
+from ...codecs import DEFAULT_CODEC, DEFAULT_RECORD_CODEC, get_codec
+from ...framing import decode_frame, is_frame
+from ...registry import POSIX_MESSAGE_QUEUE, register
+from ...spill import SpillReader
 
-def run(name: str) -> None:
+
+def run(name: str, codec: str | None = None) -> None:
+    message_codec = get_codec(codec or DEFAULT_CODEC)
+    record_codec = get_codec(codec or DEFAULT_RECORD_CODEC)
+    spill = SpillReader()
     mq = posix_ipc.MessageQueue(name, posix_ipc.O_CREAT)
+    register(POSIX_MESSAGE_QUEUE, name)
 
     print(f"start queue server: {name}")
     try:
+        records = 0
+        batches = 0
+        last = None
+        reported = time.monotonic()
         while True:
-            message = mq.receive()
-            now = datetime.now().time()
-            print(now, json.loads(message[0]))
-            time.sleep(1)
+            try:
+                # wakes up at least once a second to report the batched records.
+                message, _ = mq.receive(1.0)
+            except posix_ipc.BusyError:
+                message = None
+
+            framed = False
+            if message is not None and is_frame(message):
+                framed = True
+                if not batches:
+                    reported = time.monotonic()
+                frame = decode_frame(message)
+                for record in frame.records:
+                    last = record_codec.decode(record)
+                records += len(frame.records)
+                batches += 1
+
+            if batches and (not framed or time.monotonic() - reported >= 1.0):
+                now = datetime.now().time()
+                print(now, f"{records} records in {batches} batches, last: {last}")
+                records = batches = 0
+                reported = time.monotonic()
+
+            if message is not None and not framed:
+                now = datetime.now().time()
+                with spill.payload(message) as payload:
+                    # shortens large payloads.
+                    print(now, reprlib.repr(message_codec.decode(payload)))
+                time.sleep(1)
 
     except KeyboardInterrupt:
         print("canceled.")
         pass
 
+    spill.close()
     mq.close()
     print(f"end queue server: {name}")
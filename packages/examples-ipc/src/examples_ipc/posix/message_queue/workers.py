@@ -0,0 +1,28 @@
+import posix_ipc
+
+from ...registry import POSIX_MESSAGE_QUEUE, register
+from ...workers import Decoder, Handler, WorkerPool, load_handler, record_decoder, stop_requested
+
+
+def _work(index: int, name: str, handler: Handler, decode_records: Decoder) -> None:
+    mq = posix_ipc.MessageQueue(name, posix_ipc.O_CREAT)
+    register(POSIX_MESSAGE_QUEUE, name)
+    while not stop_requested():
+        try:
+            # wakes up regularly to see whether the pool is stopping.
+            message, _ = mq.receive(0.5)
+        except (posix_ipc.BusyError, posix_ipc.SignalError):
+            continue
+
+        for record in decode_records(message):
+            handler(record)
+
+    mq.close()
+
+
+def run(name: str, workers: int, handler: str, codec: str | None = None) -> None:
+    pool = WorkerPool(workers, _work, (name, load_handler(handler), record_decoder(codec)))
+
+    print(f"start queue workers: {name}, workers: {workers}, handler: {handler}")
+    pool.run()
+    print(f"end queue workers: {name}")
@@ -1,13 +1,15 @@
 from argparse import ArgumentParser, Namespace
 
-import posix_ipc
-
-from .client import run as _client_run
-from .server import run as _service_run
+from ...events import DEFAULT_HISTORY_SIZE
 
 
 def _clean(name: str) -> None:
+    import posix_ipc
+
+    from ...registry import POSIX_SEMAPHORE, unregister
+
     posix_ipc.unlink_semaphore(name)
+    unregister(POSIX_SEMAPHORE, name)
     print(f"{name} is removed.")
 
 
@@ -15,10 +17,24 @@ def _run(args: Namespace) -> None:
     if args.clean:
         _clean(args.name)
 
+    elif args.is_server_mode and args.monitor:
+        from .server import run_monitor as _monitor_run
+
+        _monitor_run(args.name, args.count, args.history_size, args.history)
+
     elif args.is_server_mode:
+        from .server import run as _service_run
+
         _service_run(args.name, args.count)
 
+    elif args.units:
+        from .client import run_limited as _client_run_limited
+
+        _client_run_limited(args.name, args.count, args.units, args.hold, args.timeout, args.repeat)
+
     else:
+        from .client import run as _client_run
+
         _client_run(args.name, args.count, args.release)
 
 
@@ -36,12 +52,56 @@ def configure_arguments(parser: ArgumentParser) -> None:
         help="run as a service and displays the contents of the semaphore.",
         default=False,
     )
+    parser.add_argument(
+        "-m",
+        "--monitor",
+        action="store_true",
+        help="run the server as a monitor that reports every change posted by the clients.",
+    )
+    parser.add_argument(
+        "--history-size",
+        type=int,
+        help="the number of latest changes the monitor keeps. (default: %(default)s)",
+        default=DEFAULT_HISTORY_SIZE,
+    )
+    parser.add_argument(
+        "--history",
+        help="writes the changes kept by the monitor as JSON to the file on exit, or to stdout with '-'.",
+        default=None,
+    )
     parser.add_argument(
         "-r",
         "--release",
         action="store_true",
         help="unset semaphore.",
     )
+    parser.add_argument(
+        "-u",
+        "--units",
+        type=int,
+        choices=[1],
+        help="acquire the units through the resource limiter, hold them and release them."
+        " A POSIX semaphore takes 1 unit at a time, see sysv sem for more.",
+        default=None,
+    )
+    parser.add_argument(
+        "--hold",
+        type=float,
+        help="the seconds the limiter units are held. (default: %(default)s)",
+        default=1.0,
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="the seconds to wait for the limiter units, forever if not set.",
+        default=None,
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        help="the number of times the limiter units are acquired. (default: %(default)s)",
+        default=1,
+    )
     parser.add_argument(
         "-c",
         "--count",
@@ -1,8 +1,16 @@
+import time
+from datetime import datetime
+
 import posix_ipc
 
+from ...registry import POSIX_SEMAPHORE, register
+from .events import open_events, post_event
+from .limiter import PosixLimiter
+
 
 def run(name: str, count: int, release: bool) -> None:
     sem = posix_ipc.Semaphore(name, flags=posix_ipc.O_CREAT, initial_value=count)
+    register(POSIX_SEMAPHORE, name)
 
     previous = sem.value
     if release:
@@ -11,4 +19,24 @@ def run(name: str, count: int, release: bool) -> None:
         sem.acquire(0)
 
     print(f"semaphore[{name}]: {previous} -> {sem.value}")
+    events = post_event(open_events(name), 1 if release else -1, sem.value)
+    if events is not None:
+        events.close()
     sem.close()
+
+
+def run_limited(name: str, count: int, units: int, hold: float, timeout: float | None, repeat: int) -> None:
+    limiter = PosixLimiter(name, count, units, timeout)
+    try:
+        for _ in range(repeat):
+            try:
+                with limiter:
+                    print(datetime.now().time(), f"acquired {units} units, available: {limiter.value}")
+                    time.sleep(hold)
+            except TimeoutError as e:
+                print(datetime.now().time(), e)
+    except KeyboardInterrupt:
+        print("canceled.")
+
+    print(limiter.stats.summary())
+    limiter.close()
@@ -0,0 +1,97 @@
+import os
+from typing import NamedTuple
+
+import posix_ipc
+
+from ...events import EVENT_SIZE, encode_event
+from ...registry import POSIX_MESSAGE_QUEUE, POSIX_SEMAPHORE, register
+
+# the events the queue holds while the monitor is behind, if the system allows that many.
+MAX_EVENTS = 1024
+
+
+def events_name(name: str) -> str:
+    """the name of the message queue paired with the semaphore."""
+    return f"{name}.events"
+
+
+def drops_name(name: str) -> str:
+    """the name of the semaphore counting the events the queue had no room for."""
+    return f"{name}.dropped"
+
+
+def _system_max_events() -> int:
+    """the most messages a queue may hold without privileges, which is only 10 by default on Linux."""
+    try:
+        with open("/proc/sys/fs/mqueue/msg_max") as file:
+            return int(file.read())
+    except OSError:
+        default: int = posix_ipc.QUEUE_MESSAGES_MAX_DEFAULT
+        return default
+
+
+class Events(NamedTuple):
+    """The queue of a running monitor, and the semaphore counting the events dropped because it was full."""
+
+    name: str
+    mq: posix_ipc.MessageQueue
+    drops: posix_ipc.Semaphore
+
+    def close(self) -> None:
+        self.mq.close()
+        self.drops.close()
+
+
+def _create_queue(name: str, max_messages: int) -> posix_ipc.MessageQueue:
+    return posix_ipc.MessageQueue(
+        events_name(name), flags=posix_ipc.O_CREAT, max_messages=max_messages, max_message_size=EVENT_SIZE
+    )
+
+
+def create_events(name: str) -> Events:
+    """creates the queue the monitor receives the events of the semaphore from, and its drop counter."""
+    try:
+        mq = _create_queue(name, MAX_EVENTS)
+    except ValueError:
+        # more than the system allows without privileges.
+        mq = _create_queue(name, _system_max_events())
+    register(POSIX_MESSAGE_QUEUE, events_name(name))
+    drops = posix_ipc.Semaphore(drops_name(name), flags=posix_ipc.O_CREAT, initial_value=0)
+    register(POSIX_SEMAPHORE, drops_name(name))
+    return Events(name, mq, drops)
+
+
+def open_events(name: str) -> Events | None:
+    """opens the queue of a running monitor, None if no monitor is running."""
+    try:
+        mq = posix_ipc.MessageQueue(events_name(name))
+    except posix_ipc.ExistentialError:
+        return None
+    try:
+        drops = posix_ipc.Semaphore(drops_name(name))
+    except posix_ipc.ExistentialError:
+        mq.close()
+        return None
+    return Events(name, mq, drops)
+
+
+def post_event(events: Events | None, delta: int, value: int, wait_ns: int = 0) -> Events | None:
+    """posts the change of the semaphore without blocking, returns the queue to post the next events to.
+
+    The event is dropped and counted if the queue is full.
+    A monitor that stops unlinks the queue, which the clients that have it open fill up and then drop their events to.
+    """
+    if events is None:
+        return None
+    try:
+        events.mq.send(encode_event(os.getpid(), delta, value, wait_ns), 0)
+    except posix_ipc.BusyError:
+        events.drops.release()
+    except posix_ipc.ExistentialError:
+        # the queue was closed, a monitor may be running under the name again.
+        events.drops.close()
+        return open_events(events.name)
+    except OSError:
+        events.close()
+        return None
+    return events
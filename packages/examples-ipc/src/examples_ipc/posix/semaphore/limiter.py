@@ -0,0 +1,54 @@
+import posix_ipc
+
+from ...limiter import ResourceLimiter
+from ...registry import POSIX_SEMAPHORE, register
+from .events import open_events, post_event
+
+
+class PosixLimiter(ResourceLimiter):
+    """`ResourceLimiter` over a named POSIX semaphore.
+
+    A POSIX semaphore moves one unit at a time, and processes taking N units one by one
+    can each hold part of them and wait for the rest forever, so it takes a single unit:
+    use `SysvLimiter`, which takes N units atomically, for more.
+    The uncontended `sem_trywait` completes in user space without a system call.
+    """
+
+    max_units = 1
+
+    def __init__(self, name: str, size: int, units: int = 1, timeout: float | None = None) -> None:
+        super().__init__(units, timeout)
+        self.name = name
+        self._sem = posix_ipc.Semaphore(name, flags=posix_ipc.O_CREAT, initial_value=size)
+        register(POSIX_SEMAPHORE, name)
+        self._events = open_events(name)
+
+    def _notify(self, delta: int, wait_ns: int) -> None:
+        self._events = post_event(self._events, delta, self.value, wait_ns)
+
+    @property
+    def value(self) -> int:
+        value: int = self._sem.value
+        return value
+
+    def _try_acquire(self, units: int) -> bool:
+        try:
+            self._sem.acquire(0)
+            return True
+        except posix_ipc.BusyError:
+            return False
+
+    def _acquire(self, units: int, timeout: float | None) -> bool:
+        try:
+            self._sem.acquire(timeout)
+            return True
+        except posix_ipc.BusyError:
+            return False
+
+    def _release(self, units: int) -> None:
+        self._sem.release()
+
+    def close(self) -> None:
+        self._sem.close()
+        if self._events is not None:
+            self._events.close()
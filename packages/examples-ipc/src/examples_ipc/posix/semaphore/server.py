@@ -1,11 +1,18 @@
+import signal
 import time
 from datetime import datetime
+from typing import Any
 
 import posix_ipc
 
+from ...events import EventHistory, decode_event, export_history
+from ...registry import POSIX_MESSAGE_QUEUE, POSIX_SEMAPHORE, register, unregister
+from .events import create_events
+
 
 def run(name: str, count: int) -> None:
     sem = posix_ipc.Semaphore(name, flags=posix_ipc.O_CREAT, initial_value=count)
+    register(POSIX_SEMAPHORE, name)
 
     print(f"start semaphore server: {name} size: {count}")
     try:
@@ -24,3 +31,52 @@ def run(name: str, count: int) -> None:
 
     sem.close()
     print(f"end semaphore server: {name}")
+
+
+def run_monitor(name: str, count: int, history_size: int, history_path: str | None) -> None:
+    """reports every change the clients post to the companion queue, as it happens."""
+    sem = posix_ipc.Semaphore(name, flags=posix_ipc.O_CREAT, initial_value=count)
+    register(POSIX_SEMAPHORE, name)
+    events = create_events(name)
+    history = EventHistory(history_size)
+    # the counter is left by a previous monitor, if it crashed.
+    reported = dropped = events.drops.value
+    stopping = False
+
+    def stop(_signum: int, _frame: Any) -> None:
+        # spell-checker:words signum
+        nonlocal stopping
+        stopping = True
+
+    # interrupts the blocking receive with posix_ipc.SignalError instead of KeyboardInterrupt,
+    # which would otherwise be raised again later, in the middle of the cleanup.
+    signal.signal(signal.SIGINT, stop)
+
+    print(f"start semaphore monitor: {name} size: {count}")
+    print(datetime.now().time(), f"semaphore: {sem.value}")
+    try:
+        while not stopping:
+            message, _ = events.mq.receive()
+            event = decode_event(message)
+            history.append(event)
+            print(event.format())
+            if events.drops.value != reported:
+                print(f"{events.drops.value - reported} events dropped, the queue was full.")
+                reported = events.drops.value
+
+    except posix_ipc.SignalError:
+        pass
+    print("canceled.")
+
+    # the clients that still have the queue open post to it without blocking until it is full,
+    # and drop their events after that.
+    dropped = events.drops.value - dropped
+    events.mq.unlink()
+    unregister(POSIX_MESSAGE_QUEUE, events.mq.name)
+    events.drops.unlink()
+    unregister(POSIX_SEMAPHORE, events.drops.name)
+    events.close()
+    sem.close()
+    export_history(history, history_path)
+    print(f"{dropped} events dropped in total.")
+    print(f"end semaphore monitor: {name}")
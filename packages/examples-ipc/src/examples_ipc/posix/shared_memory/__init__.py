@@ -1,25 +1,62 @@
 from argparse import ArgumentParser, Namespace
 
-import posix_ipc
+from ...bus import parse_topic
 
-from .client import run as _client_run
-from .server import run as _service_run
+_DEFAULT_SIZE = 20
+_DEFAULT_RING_SIZE = 1024 * 1024
 
 
 def _clean(name: str) -> None:
+    import posix_ipc
+
+    from ...registry import POSIX_SHARED_MEMORY, unregister
+    from .notify import remove_subscriptions
+
     posix_ipc.unlink_shared_memory(name)
+    unregister(POSIX_SHARED_MEMORY, name)
     print(f"{name} is removed.")
 
+    for sem in remove_subscriptions(name):
+        print(f"{sem} is removed.")
+
 
 def _run(args: Namespace) -> None:
     if args.clean:
         _clean(args.name)
 
+    elif args.is_bus_mode and args.is_server_mode:
+        from .server import run_bus as _service_run_bus
+
+        _service_run_bus(args.name, args.topics or [])
+
+    elif args.is_bus_mode:
+        topics = args.topics or []
+        topic = args.publish or (topics[0].name if topics else None)
+        if topic is None:
+            raise ValueError("specify the topic to publish to with --publish or --topic")
+        from .client import run_bus as _client_run_bus
+
+        _client_run_bus(args.name, topics, topic)
+
+    elif args.is_ring_mode and args.is_server_mode:
+        from .server import run_ring as _service_run_ring
+
+        _service_run_ring(args.name, args.size or _DEFAULT_RING_SIZE)
+
+    elif args.is_ring_mode:
+        from .client import run_ring as _client_run_ring
+
+        _client_run_ring(args.name, args.size or _DEFAULT_RING_SIZE, args.count)
+
     elif args.is_server_mode:
-        _service_run(args.name, args.size)
+        from .server import run as _service_run
+
+        _service_run(args.name, args.size or _DEFAULT_SIZE)
 
     else:
-        _client_run(args.name, args.size)
+        from .client import run as _client_run
+
+        _client_run(args.name, args.size or _DEFAULT_SIZE)
 
 
 def configure_arguments(parser: ArgumentParser) -> None:
@@ -36,6 +73,42 @@ def configure_arguments(parser: ArgumentParser) -> None:
         help="run as a service and displays the contents of the shared memory.",
         default=False,
     )
+    parser.add_argument(
+        "--ring",
+        action="store_true",
+        dest="is_ring_mode",
+        help="stream records through a lock-free single-producer/single-consumer ring buffer.",
+        default=False,
+    )
+    parser.add_argument(
+        "--bus",
+        action="store_true",
+        dest="is_bus_mode",
+        help="publish and subscribe to named topics in one shared memory segment.",
+        default=False,
+    )
+    parser.add_argument(
+        "-t",
+        "--topic",
+        action="append",
+        dest="topics",
+        type=parse_topic,
+        help="topic of the bus as name[:ring|latest[:bytes]], repeat for each topic."
+        " the bus is created with these topics if it does not exist.",
+        default=None,
+    )
+    parser.add_argument(
+        "--publish",
+        help="the topic to publish to in bus client mode. (default: the first --topic)",
+        default=None,
+    )
+    parser.add_argument(
+        "-c",
+        "--count",
+        type=int,
+        help="the number of records streamed in ring client mode.",
+        default=1_000_000,
+    )
     parser.add_argument(
         "-n",
         "--name",
@@ -46,7 +119,7 @@ def configure_arguments(parser: ArgumentParser) -> None:
         "-b",
         "--size",
         type=int,
-        help="shared memory bytes size.",
-        default=20,
+        help=f"shared memory bytes size. (default: {_DEFAULT_SIZE}, {_DEFAULT_RING_SIZE} in ring mode)",
+        default=None,
     )
     parser.set_defaults(exec=lambda args: _run(args))
@@ -0,0 +1,58 @@
+import mmap
+import os
+import time
+
+import posix_ipc
+
+from ...bus import Bus, Topic, format_bus, is_formatted, layout_size
+from ...registry import POSIX_SHARED_MEMORY, register
+from ...ring import Backoff
+
+# how long to wait for the process that creates the bus to format it.
+_FORMAT_TIMEOUT = 1.0
+
+
+def _create(name: str, topics: list[Topic]) -> posix_ipc.SharedMemory | None:
+    """creates and formats the bus, None if it exists already."""
+    try:
+        shm = posix_ipc.SharedMemory(name, flags=posix_ipc.O_CREX, size=layout_size(topics), read_only=False)
+    except posix_ipc.ExistentialError:
+        return None
+
+    with mmap.mmap(shm.fd, 0) as mm:
+        format_bus(mm, topics)
+    return shm
+
+
+def _wait_formatted(name: str, fd: int) -> None:
+    """waits for the process that created the bus to publish its directory."""
+    backoff = Backoff()
+    deadline = time.monotonic() + _FORMAT_TIMEOUT
+    while True:
+        if os.fstat(fd).st_size:
+            with mmap.mmap(fd, 0) as mm:
+                if is_formatted(mm):
+                    return
+        if time.monotonic() > deadline:
+            raise ValueError(f"bus [{name}] is not formatted, remove it with --clean and create it with --topic")
+        backoff.wait()
+
+
+def open_bus(name: str, topics: list[Topic]) -> tuple[Bus, mmap.mmap]:
+    """attaches to the bus, creating it with the topics if it does not exist yet.
+
+    Only the process that creates the segment formats it, the others wait until its directory is published.
+    """
+    shm = _create(name, topics) if topics else None
+    if shm is None:
+        shm = posix_ipc.SharedMemory(name, flags=0, read_only=False)
+        try:
+            _wait_formatted(name, shm.fd)
+        except ValueError:
+            shm.close_fd()
+            raise
+    register(POSIX_SHARED_MEMORY, name)
+
+    mm = mmap.mmap(shm.fd, 0)
+    # the file descriptor is kept open, the bus locks it to claim the topics.
+    return Bus(mm, shm.fd), mm
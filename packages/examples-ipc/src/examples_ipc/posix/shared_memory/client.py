@@ -1,27 +1,97 @@
 import mmap
+import time
 
 import posix_ipc
 
+from ...bus import Topic
+from ...framing import COUNTER
+from ...registry import POSIX_SHARED_MEMORY, register
+from ...ring import Backoff, RingBuffer
+from ...slot import HEADER_SIZE, Slot
+from .bus import open_bus
+from .notify import Notifier
+
 
 def run(name: str, size: int) -> None:
-    shm = posix_ipc.SharedMemory(name, flags=posix_ipc.O_CREAT, size=size, read_only=False)
+    shm = posix_ipc.SharedMemory(name, flags=posix_ipc.O_CREAT, size=HEADER_SIZE + size, read_only=False)
+    register(POSIX_SHARED_MEMORY, name)
     mm = mmap.mmap(shm.fd, shm.size)
     shm.close_fd()
+    slot = Slot(mm)
+    notifier = Notifier(name)
 
     print(f"write to {name}")
     try:
         while True:
             text = input("Please enter something:")
-            # Since the last position is referenced at the time of opening,
-            # the reference position is returned.
-            mm.seek(0)
-            mm.write(b"\0" * mm.size())  # null clear.
-            mm.seek(0)
-            mm.write(text.encode(encoding="utf-8"))
+            # writes only the payload and its length, readers retry while it is being updated.
+            slot.write(text.encode(encoding="utf-8"))
+            notifier.notify()
             print(f"write: {text}")
 
     except KeyboardInterrupt:
         print("canceled.")
         pass
 
+    notifier.close()
+    slot.close()
+    mm.close()
+
+
+def run_ring(name: str, size: int, count: int) -> None:
+    shm = posix_ipc.SharedMemory(name, flags=posix_ipc.O_CREAT, size=size, read_only=False)
+    register(POSIX_SHARED_MEMORY, name)
+    mm = mmap.mmap(shm.fd, shm.size)
+    shm.close_fd()
+    ring = RingBuffer(mm)
+    backoff = Backoff()
+
+    print(f"stream to {name} {count} records, capacity={ring.capacity}")
+    sent = 0
+    started = time.perf_counter()
+    try:
+        for i in range(count):
+            record = COUNTER.pack(i)
+            # waits for the server to make room when the ring is full.
+            while not ring.push(record):
+                backoff.wait()
+            backoff.reset()
+            sent += 1
+
+    except KeyboardInterrupt:
+        print("canceled.")
+        pass
+
+    elapsed = time.perf_counter() - started
+    ring.close()
+    mm.close()
+    print(f"stream complete. {sent} records, {elapsed:.3f}s ({sent / elapsed:,.0f} records/s)")
+
+
+def run_bus(name: str, topics: list[Topic], topic: str) -> None:
+    bus, mm = open_bus(name, topics)
+    kind = next((t.kind for t in bus.topics if t.name == topic), None)
+    publisher = bus.latest(topic, "publisher") if kind == "latest" else bus.ring(topic, "publisher")
+    notifier = Notifier(name)
+
+    print(f"publish to {name} topic: {topic}")
+    try:
+        while True:
+            text = input("Please enter something:")
+            data = text.encode(encoding="utf-8")
+            if isinstance(publisher, RingBuffer):
+                if not publisher.push(data):
+                    print(f"topic {topic} is full, dropped: {text}")
+                    continue
+            else:
+                publisher.write(data)
+            notifier.notify()
+            print(f"publish: {text}")
+
+    except KeyboardInterrupt:
+        print("canceled.")
+        pass
+
+    notifier.close()
+    bus.close()
     mm.close()
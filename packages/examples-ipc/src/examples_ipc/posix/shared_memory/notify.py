@@ -0,0 +1,76 @@
+import os
+from contextlib import suppress
+
+import posix_ipc
+
+from ...registry import POSIX_SEMAPHORE, POSIX_SHARED_MEMORY, register, unregister
+from ...subscribers import subscribe, subscribers, unsubscribe
+
+
+def notifier_name(name: str) -> str:
+    """the name of the semaphore of this process, paired with the shared memory."""
+    return f"{name}.notify.{os.getpid()}"
+
+
+class Subscription:
+    """The semaphore of this reader of the shared memory, which the writers post after each write."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._sem = posix_ipc.Semaphore(notifier_name(name), flags=posix_ipc.O_CREAT, initial_value=0)
+        register(POSIX_SEMAPHORE, self._sem.name)
+        subscribe(POSIX_SHARED_MEMORY, name, self._sem.name)
+
+    def wait(self) -> None:
+        """blocks until a writer posts, consuming the posts that are already pending as well."""
+        self._sem.acquire()
+        with suppress(posix_ipc.BusyError):
+            while True:
+                self._sem.acquire(0)
+
+    def close(self) -> None:
+        unsubscribe(POSIX_SHARED_MEMORY, self._name, self._sem.name)
+        self._sem.unlink()
+        unregister(POSIX_SEMAPHORE, self._sem.name)
+        self._sem.close()
+
+
+class Notifier:
+    """Posts the semaphore of every reader of the shared memory."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._sems: dict[str, posix_ipc.Semaphore] = {}
+
+    def notify(self) -> None:
+        names = subscribers(POSIX_SHARED_MEMORY, self._name)
+        for gone in self._sems.keys() - set(names):
+            self._sems.pop(gone).close()
+
+        for name in names:
+            sem = self._sems.get(name)
+            if sem is None:
+                try:
+                    sem = self._sems[name] = posix_ipc.Semaphore(name)
+                except posix_ipc.ExistentialError:
+                    # the reader exited without unsubscribing, and its semaphore was removed since.
+                    unsubscribe(POSIX_SHARED_MEMORY, self._name, name)
+                    continue
+            sem.release()
+
+    def close(self) -> None:
+        for sem in self._sems.values():
+            sem.close()
+        self._sems.clear()
+
+
+def remove_subscriptions(name: str) -> list[str]:
+    """removes the semaphores of the readers of the shared memory, returns their names."""
+    removed = []
+    for sem in subscribers(POSIX_SHARED_MEMORY, name):
+        with suppress(posix_ipc.ExistentialError):
+            posix_ipc.unlink_semaphore(sem)
+            removed.append(sem)
+        unregister(POSIX_SEMAPHORE, sem)
+        unsubscribe(POSIX_SHARED_MEMORY, name, sem)
+    return removed
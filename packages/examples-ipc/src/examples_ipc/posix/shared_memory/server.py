@@ -4,24 +4,123 @@ from datetime import datetime
 
 import posix_ipc
 
+from ...bus import Topic
+from ...framing import COUNTER
+from ...registry import POSIX_SHARED_MEMORY, register
+from ...ring import Backoff, RingBuffer
+from ...slot import HEADER_SIZE, Slot
+from .bus import open_bus
+from .notify import Subscription
+
 
 def run(name: str, size: int) -> None:
-    shm = posix_ipc.SharedMemory(name, flags=posix_ipc.O_CREAT, size=size, read_only=False)
+    shm = posix_ipc.SharedMemory(name, flags=posix_ipc.O_CREAT, size=HEADER_SIZE + size, read_only=False)
+    register(POSIX_SHARED_MEMORY, name)
     mm = mmap.mmap(shm.fd, shm.size)
     shm.close_fd()
+    slot = Slot(mm)
+    subscription = Subscription(name)
 
     print(f"start shared memory server: {name}, size={size}")
     try:
         while True:
-            mm.seek(0)
-            bytes = mm.read()
+            bytes = slot.snapshot()
             now = datetime.now().time()
             print(now, bytes.decode(encoding="utf-8").rstrip())
-            time.sleep(3)
+            # sleeps until the client writes.
+            subscription.wait()
 
     except KeyboardInterrupt:
         print("canceled.")
         pass
 
+    subscription.close()
+    slot.close()
     mm.close()
     print(f"end shared memory server: {name}")
+
+
+def _drain(ring: RingBuffer, last: int | None) -> tuple[int, int, int | None]:
+    records = 0
+    size = 0
+    for record in ring.drain():
+        (last,) = COUNTER.unpack(record)
+        records += 1
+        size += len(record)
+    return records, size, last
+
+
+def run_ring(name: str, size: int) -> None:
+    shm = posix_ipc.SharedMemory(name, flags=posix_ipc.O_CREAT, size=size, read_only=False)
+    register(POSIX_SHARED_MEMORY, name)
+    mm = mmap.mmap(shm.fd, shm.size)
+    shm.close_fd()
+    ring = RingBuffer(mm)
+    backoff = Backoff()
+
+    print(f"start shared memory ring server: {name}, capacity={ring.capacity}")
+    try:
+        records = 0
+        received = 0
+        last = None
+        reported = time.monotonic()
+        while True:
+            drained, size, last = _drain(ring, last)
+            records += drained
+            received += size
+
+            # waits for the client to write when the ring is empty.
+            if drained:
+                backoff.reset()
+            else:
+                backoff.wait()
+
+            if records and time.monotonic() - reported >= 1.0:
+                now = datetime.now().time()
+                print(now, f"{records} records, {received} bytes, last: {{'count': {last}}}")
+                records = received = 0
+                reported = time.monotonic()
+
+    except KeyboardInterrupt:
+        print("canceled.")
+        pass
+
+    ring.close()
+    mm.close()
+    print(f"end shared memory ring server: {name}")
+
+
+def _print_topics(rings: dict[str, RingBuffer], cells: dict[str, Slot], sequences: dict[str, int]) -> None:
+    now = datetime.now().time()
+    for topic, ring in rings.items():
+        for record in ring.drain():
+            print(now, f"[{topic}]", str(record, encoding="utf-8"))
+
+    for topic, cell in cells.items():
+        if cell.sequence != sequences[topic]:
+            sequences[topic] = cell.sequence
+            print(now, f"[{topic}]", cell.snapshot().decode(encoding="utf-8"))
+
+
+def run_bus(name: str, topics: list[Topic]) -> None:
+    bus, mm = open_bus(name, topics)
+    rings = {topic.name: bus.ring(topic.name, "subscriber") for topic in bus.topics if topic.kind == "ring"}
+    cells = {topic.name: bus.latest(topic.name, "subscriber") for topic in bus.topics if topic.kind == "latest"}
+    sequences = {topic: -1 for topic in cells}
+    subscription = Subscription(name)
+
+    print(f"start shared memory bus server: {name}, topics={', '.join(t.name for t in bus.topics)}")
+    try:
+        while True:
+            _print_topics(rings, cells, sequences)
+            # sleeps until a publisher writes to any topic.
+            subscription.wait()
+
+    except KeyboardInterrupt:
+        print("canceled.")
+        pass
+
+    subscription.close()
+    bus.close()
+    mm.close()
+    print(f"end shared memory bus server: {name}")
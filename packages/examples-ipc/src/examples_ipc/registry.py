@@ -0,0 +1,169 @@
+"""Registry of the IPC objects the examples create, to remove the ones left behind by crashed processes.
+
+Each object has a record file in the registry directory, listing the processes that opened it,
+identified by their PID and start time, so a recycled PID is not taken for the original process.
+An object is an orphan when none of those processes is alive any more.
+"""
+
+import fcntl
+import json
+import os
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from typing import IO, Any, NamedTuple
+from urllib.parse import quote
+
+import posix_ipc
+import sysv_ipc
+
+POSIX_MESSAGE_QUEUE = "posix-mq"
+POSIX_SHARED_MEMORY = "posix-shm"
+POSIX_SEMAPHORE = "posix-sem"
+SYSV_MESSAGE_QUEUE = "sysv-mq"
+SYSV_SHARED_MEMORY = "sysv-shm"
+SYSV_SEMAPHORE = "sysv-sem"
+
+
+def _remove_sysv(kind: type[Any], remove: Callable[[int], None]) -> Callable[[str], None]:
+    return lambda key: remove(kind(int(key)).id)
+
+
+_REMOVERS: dict[str, Callable[[str], None]] = {
+    POSIX_MESSAGE_QUEUE: posix_ipc.unlink_message_queue,
+    POSIX_SHARED_MEMORY: posix_ipc.unlink_shared_memory,
+    POSIX_SEMAPHORE: posix_ipc.unlink_semaphore,
+    SYSV_MESSAGE_QUEUE: _remove_sysv(sysv_ipc.MessageQueue, sysv_ipc.remove_message_queue),
+    SYSV_SHARED_MEMORY: _remove_sysv(sysv_ipc.SharedMemory, sysv_ipc.remove_shared_memory),
+    SYSV_SEMAPHORE: _remove_sysv(sysv_ipc.Semaphore, sysv_ipc.remove_semaphore),
+}
+
+
+class Holder(NamedTuple):
+    pid: int
+    started: int | None
+
+
+class Resource(NamedTuple):
+    kind: str
+    name: str
+    holders: list[Holder]
+
+
+def registry_dir() -> str:
+    """`EXAMPLES_IPC_REGISTRY`, or a directory of the user in the temporary directory."""
+    return os.environ.get("EXAMPLES_IPC_REGISTRY") or os.path.join(
+        tempfile.gettempdir(), f"examples-ipc-{os.getuid()}"
+    )
+
+
+def _path(kind: str, name: str | int) -> str:
+    return os.path.join(registry_dir(), f"{kind}.{quote(str(name), safe='')}.json")
+
+
+def _start_time(pid: int) -> int | None:
+    """the start time of the process in clock ticks after boot, None without procfs or if it is not running."""
+    try:
+        with open(f"/proc/{pid}/stat") as file:
+            stat = file.read()
+    except OSError:
+        return None
+    # the fields after the command name, which may contain spaces, start with the state (3rd field).
+    return int(stat.rsplit(")", 1)[1].split()[19])
+
+
+def is_alive(holder: Holder) -> bool:
+    if os.path.isdir("/proc"):
+        return holder.started is not None and _start_time(holder.pid) == holder.started
+
+    try:
+        os.kill(holder.pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+@contextmanager
+def _locked(path: str) -> Iterator[IO[str]]:
+    """opens the record locked, retrying if it was removed while waiting for the lock."""
+    while True:
+        with open(path, "a+") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            if os.fstat(file.fileno()).st_nlink:
+                file.seek(0)
+                yield file
+                return
+
+
+def _read(file: IO[str], kind: str, name: str) -> Resource:
+    data = file.read()
+    holders = [Holder(*holder) for holder in json.loads(data)["holders"]] if data else []
+    return Resource(kind, name, holders)
+
+
+def register(kind: str, name: str | int) -> None:
+    """adds this process to the holders of the object, dropping the holders that are gone."""
+    os.makedirs(registry_dir(), mode=0o700, exist_ok=True)
+    me = Holder(os.getpid(), _start_time(os.getpid()))
+    with _locked(_path(kind, name)) as file:
+        resource = _read(file, kind, str(name))
+        holders = [holder for holder in resource.holders if holder != me and is_alive(holder)]
+        file.seek(0)
+        file.truncate()
+        json.dump({"kind": kind, "name": str(name), "holders": [*holders, me]}, file)
+
+
+def unregister(kind: str, name: str | int) -> None:
+    """forgets the object, once it is removed."""
+    with suppress(FileNotFoundError):
+        os.remove(_path(kind, name))
+
+
+def resources() -> list[Resource]:
+    found = []
+    try:
+        files = sorted(os.listdir(registry_dir()))
+    except FileNotFoundError:
+        return []
+
+    for filename in files:
+        if not filename.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(registry_dir(), filename)) as file:
+                fcntl.flock(file, fcntl.LOCK_SH)
+                data = file.read()
+        except FileNotFoundError:
+            continue
+        if data:
+            record = json.loads(data)
+            found.append(Resource(record["kind"], record["name"], [Holder(*holder) for holder in record["holders"]]))
+    return found
+
+
+def is_orphan(resource: Resource) -> bool:
+    return not any(is_alive(holder) for holder in resource.holders)
+
+
+def collect(dry_run: bool = False) -> Iterator[Resource]:
+    """removes the orphans, yielding each one, and forgets the ones already removed by hand."""
+    for found in resources():
+        if not is_orphan(found):
+            continue
+
+        with _locked(_path(found.kind, found.name)) as file:
+            # a process may have opened it since.
+            resource = _read(file, found.kind, found.name)
+            if not resource.holders:
+                # unregistered since, the lock created an empty record.
+                os.remove(_path(resource.kind, resource.name))
+                continue
+            if not is_orphan(resource):
+                continue
+            if not dry_run:
+                with suppress(posix_ipc.ExistentialError, sysv_ipc.ExistentialError):
+                    _REMOVERS[resource.kind](resource.name)
+                os.remove(_path(resource.kind, resource.name))
+        yield resource
@@ -0,0 +1,160 @@
+import struct
+import time
+from collections.abc import Buffer, Iterator
+
+# ring layout:
+#   0: magic(8) | capacity(u64)
+#  64: head(u64), written by the producer only
+# 128: tail(u64), read by the consumer only
+# 192: data(capacity)
+#
+# head and tail are monotonic byte cursors, kept on separate cache lines so that
+# the producer and the consumer do not invalidate each other on every update.
+# each record is a length(u32) | reserved(u32) header followed by the payload, padded to 8 bytes.
+MAGIC = b"SPSCRNG1"
+_META = struct.Struct("=8sQ")
+_RECORD = struct.Struct("=II")
+
+# the cursors are accessed through a native u64 view, which loads and stores an aligned u64 at once,
+# so the other side never sees a torn cursor.
+# (`struct.pack_into` is not suitable, it clears the field before packing.)
+_HEAD = 64 // 8
+_TAIL = 128 // 8
+HEADER_SIZE = 192
+RECORD_OVERHEAD = _RECORD.size
+
+_WRAP = 0xFFFFFFFF
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+class RingBuffer:
+    """Lock-free single-producer/single-consumer ring buffer of variable-length records.
+
+    The ring lives in any writable buffer such as an `mmap` of a shared memory segment.
+    One process may push and one process may pop at the same time without any lock:
+    the producer publishes `head` only after the record is written,
+    and the consumer publishes `tail` only after it is done with the record.
+    """
+
+    def __init__(self, buffer: Buffer) -> None:
+        self._view = memoryview(buffer).cast("B")
+        if len(self._view) < HEADER_SIZE + 2 * RECORD_OVERHEAD:
+            raise ValueError(f"buffer of {len(self._view)} bytes is too small for a ring buffer")
+
+        magic, capacity = _META.unpack_from(self._view, 0)
+        if magic != MAGIC:
+            # a fresh (or foreign) segment, initialize it.
+            capacity = (len(self._view) - HEADER_SIZE) & ~7
+            self._view[:HEADER_SIZE] = bytes(HEADER_SIZE)
+            _META.pack_into(self._view, 0, MAGIC, capacity)
+
+        self._capacity: int = capacity
+        self._cursors = self._view[:HEADER_SIZE].cast("Q")
+        self._data = self._view[HEADER_SIZE : HEADER_SIZE + capacity]
+        # cursors owned by this side, and a cached copy of the other side's cursor.
+        self._head: int = self._cursors[_HEAD]
+        self._tail: int = self._cursors[_TAIL]
+        self._pending = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def max_record_size(self) -> int:
+        return self._capacity // 2 - RECORD_OVERHEAD
+
+    def __len__(self) -> int:
+        """the number of bytes in use, including the record headers."""
+        return int(self._cursors[_HEAD] - self._cursors[_TAIL])
+
+    def push(self, payload: bytes | bytearray | memoryview) -> bool:
+        """append a record, returns False if the ring has no room for it."""
+        length = len(payload)
+        if length > self.max_record_size:
+            raise ValueError(f"record of {length} bytes exceeds the maximum record size {self.max_record_size}")
+
+        size = _align(RECORD_OVERHEAD + length)
+        position = self._head % self._capacity
+        skip = self._capacity - position if self._capacity - position < size else 0
+        if self._head + skip + size - self._tail > self._capacity:
+            # refresh the cached tail only when the ring looks full.
+            self._tail = self._cursors[_TAIL]
+            if self._head + skip + size - self._tail > self._capacity:
+                return False
+
+        if skip:
+            # the record does not fit before the end, mark the rest as padding and wrap around.
+            _RECORD.pack_into(self._data, position, _WRAP, 0)
+            position = 0
+
+        start = position + RECORD_OVERHEAD
+        self._data[start : start + length] = payload
+        _RECORD.pack_into(self._data, position, length, 0)
+
+        self._head += skip + size
+        self._cursors[_HEAD] = self._head
+        return True
+
+    def peek(self) -> memoryview | None:
+        """returns a view of the oldest record without copying, or None if the ring is empty.
+
+        The view is valid until `release()` is called.
+        """
+        if self._pending:
+            raise RuntimeError("the previous record must be released before peeking the next one")
+
+        if self._tail == self._head:
+            # refresh the cached head only when the ring looks empty.
+            self._head = self._cursors[_HEAD]
+            if self._tail == self._head:
+                return None
+
+        position = self._tail % self._capacity
+        length, _ = _RECORD.unpack_from(self._data, position)
+        skip = 0
+        if length == _WRAP:
+            skip = self._capacity - position
+            position = 0
+            length, _ = _RECORD.unpack_from(self._data, position)
+
+        self._pending = skip + _align(RECORD_OVERHEAD + length)
+        start = position + RECORD_OVERHEAD
+        return self._data[start : start + length]
+
+    def release(self) -> None:
+        """gives the space of the peeked record back to the producer."""
+        self._tail += self._pending
+        self._pending = 0
+        self._cursors[_TAIL] = self._tail
+
+    def drain(self) -> Iterator[memoryview]:
+        """yields views of all the available records, releasing each one when the next is requested."""
+        while (record := self.peek()) is not None:
+            try:
+                yield record
+            finally:
+                self.release()
+
+    def close(self) -> None:
+        self._cursors.release()
+        self._data.release()
+        self._view.release()
+
+
+class Backoff:
+    """Sleeps progressively longer while the other side of the ring is not ready."""
+
+    def __init__(self, maximum: float = 0.001) -> None:
+        self._maximum = maximum
+        self._delay = 0.0
+
+    def wait(self) -> None:
+        time.sleep(self._delay)
+        self._delay = min(self._delay * 2 or 1e-6, self._maximum)
+
+    def reset(self) -> None:
+        self._delay = 0.0
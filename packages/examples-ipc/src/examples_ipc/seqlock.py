@@ -0,0 +1,80 @@
+import time
+from collections.abc import Buffer, Callable, Iterator
+from contextlib import contextmanager
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# layout:
+#   0: sequence(u64), odd while the writer is updating the data
+#   8: data
+HEADER_SIZE = 8
+
+
+class SeqLock:
+    """Seqlock-protected region of a shared memory segment.
+
+    A single writer updates the data in place, and any number of readers in other processes
+    take consistent snapshots without locks: a reader retries when the sequence was odd or
+    changed while it was reading.
+    The buffer must be 8-byte aligned, as an `mmap` or an attached SystemV segment is.
+    """
+
+    def __init__(self, buffer: Buffer) -> None:
+        view = memoryview(buffer).cast("B")
+        if len(view) <= HEADER_SIZE:
+            raise ValueError(f"buffer of {len(view)} bytes is too small for a seqlock")
+
+        # the sequence is accessed through a native u64 view, which loads and stores it at once.
+        self._sequence = view[:HEADER_SIZE].cast("Q")
+        self._data = view[HEADER_SIZE:]
+        view.release()
+
+    @property
+    def sequence(self) -> int:
+        return int(self._sequence[0])
+
+    @property
+    def size(self) -> int:
+        return len(self._data)
+
+    @contextmanager
+    def write(self) -> Iterator[memoryview]:
+        """yields the data to update in place, readers retry until the block exits."""
+        sequence = self._sequence[0] + 1
+        self._sequence[0] = sequence
+        try:
+            yield self._data
+        finally:
+            self._sequence[0] = sequence + 1
+
+    def read(self, reader: Callable[[memoryview], T]) -> T:
+        """calls the reader with the live data without copying, until it sees a consistent snapshot.
+
+        The reader may run more than once and may see torn data on the attempts that are retried,
+        so it should not have side effects and any exception it raises on a torn attempt is ignored.
+        """
+        while True:
+            before = self._sequence[0]
+            if before & 1:
+                # lets the writer finish.
+                time.sleep(0)
+                continue
+
+            try:
+                result = reader(self._data)
+            except Exception:
+                if self._sequence[0] == before:
+                    raise
+                continue
+
+            if self._sequence[0] == before:
+                return result
+
+    def snapshot(self) -> bytes:
+        """returns a consistent copy of the data."""
+        return self.read(bytes)
+
+    def close(self) -> None:
+        self._sequence.release()
+        self._data.release()
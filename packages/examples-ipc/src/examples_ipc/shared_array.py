@@ -0,0 +1,102 @@
+"""Zero-copy NumPy arrays over POSIX and SystemV shared memory.
+
+This module requires the `numpy` extra.
+"""
+
+import mmap
+import struct
+from collections.abc import Buffer
+from typing import Any, Self
+
+import numpy as np
+import numpy.typing as npt
+import posix_ipc
+import sysv_ipc
+
+from .registry import POSIX_SHARED_MEMORY, SYSV_SHARED_MEMORY, register
+
+# header layout:
+#   magic(8) | dtype(16, numpy dtype string such as "<f8") | ndim(u32) | reserved(u32) | shape(u64 * 8)
+# the array data follows the header at a 64-byte aligned offset.
+MAGIC = b"SHMARR01"
+MAX_DIMENSIONS = 8
+_HEADER = struct.Struct(f"=8s16sII{MAX_DIMENSIONS}Q")
+HEADER_SIZE = (_HEADER.size + 63) & ~63
+
+
+def _nbytes(shape: tuple[int, ...], dtype: np.dtype[Any]) -> int:
+    return int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+
+
+def _write_header(buffer: Buffer, shape: tuple[int, ...], dtype: np.dtype[Any]) -> None:
+    if len(shape) > MAX_DIMENSIONS:
+        raise ValueError(f"arrays of more than {MAX_DIMENSIONS} dimensions are not supported")
+    if dtype.hasobject or dtype.fields is not None:
+        raise ValueError(f"dtype [{dtype}] cannot be shared")
+
+    padded = shape + (0,) * (MAX_DIMENSIONS - len(shape))
+    _HEADER.pack_into(buffer, 0, MAGIC, dtype.str.encode("ascii"), len(shape), 0, *padded)
+
+
+def _read_header(buffer: Buffer) -> tuple[tuple[int, ...], np.dtype[Any]]:
+    magic, dtype, ndim, _, *shape = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("shared memory does not contain an array")
+    return tuple(shape[:ndim]), np.dtype(dtype.rstrip(b"\0").decode("ascii"))
+
+
+class SharedArray:
+    """Typed `numpy.ndarray` view over a shared memory segment.
+
+    The dtype and shape are stored in a header at the start of the segment,
+    so other processes attach with the correct layout, and nothing is copied.
+    Drop every reference to `array` (and views of it) before calling `close()`.
+    """
+
+    def __init__(self, buffer: Buffer, owner: Any) -> None:
+        shape, dtype = _read_header(buffer)
+        self.array: npt.NDArray[Any] = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=HEADER_SIZE)
+        self._owner = owner
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        del self.array
+        if isinstance(self._owner, mmap.mmap):
+            self._owner.close()
+        else:
+            self._owner.detach()
+
+    @classmethod
+    def create_posix(cls, name: str, shape: tuple[int, ...], dtype: npt.DTypeLike) -> Self:
+        dtype = np.dtype(dtype)
+        shm = posix_ipc.SharedMemory(name, flags=posix_ipc.O_CREAT, size=HEADER_SIZE + _nbytes(shape, dtype))
+        register(POSIX_SHARED_MEMORY, name)
+        mm = mmap.mmap(shm.fd, shm.size)
+        shm.close_fd()
+        _write_header(mm, shape, dtype)
+        return cls(mm, mm)
+
+    @classmethod
+    def attach_posix(cls, name: str) -> Self:
+        shm = posix_ipc.SharedMemory(name)
+        mm = mmap.mmap(shm.fd, shm.size)
+        shm.close_fd()
+        return cls(mm, mm)
+
+    @classmethod
+    def create_sysv(cls, key: int, shape: tuple[int, ...], dtype: npt.DTypeLike) -> Self:
+        dtype = np.dtype(dtype)
+        shm = sysv_ipc.SharedMemory(key, sysv_ipc.IPC_CREAT, size=HEADER_SIZE + _nbytes(shape, dtype))
+        register(SYSV_SHARED_MEMORY, key)
+        _write_header(shm, shape, dtype)
+        return cls(shm, shm)
+
+    @classmethod
+    def attach_sysv(cls, key: int) -> Self:
+        shm = sysv_ipc.SharedMemory(key)
+        return cls(shm, shm)
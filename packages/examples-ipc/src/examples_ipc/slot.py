@@ -0,0 +1,62 @@
+from collections.abc import Buffer, Callable
+from typing import TypeVar
+
+from . import seqlock
+from .seqlock import SeqLock
+
+T = TypeVar("T")
+
+# layout:
+#   0: seqlock sequence(u64)
+#   8: payload length(u64)
+#  16: payload
+HEADER_SIZE = seqlock.HEADER_SIZE + 8
+
+
+class Slot:
+    """Variable-length payload cell in a shared memory segment, protected by a seqlock.
+
+    The payload length is kept in the header, so the writer touches only the bytes of the new payload
+    instead of clearing the whole segment, and readers read only the valid bytes.
+    """
+
+    def __init__(self, buffer: Buffer) -> None:
+        view = memoryview(buffer).cast("B")
+        if len(view) <= HEADER_SIZE:
+            raise ValueError(f"buffer of {len(view)} bytes is too small for a slot")
+
+        self._lock = SeqLock(view)
+        self._length = view[seqlock.HEADER_SIZE : HEADER_SIZE].cast("Q")
+        self._payload = view[HEADER_SIZE:]
+        view.release()
+
+    @property
+    def sequence(self) -> int:
+        """changes on every write."""
+        return self._lock.sequence
+
+    @property
+    def capacity(self) -> int:
+        return len(self._payload)
+
+    def write(self, payload: bytes | memoryview) -> None:
+        length = len(payload)
+        if length > self.capacity:
+            raise ValueError(f"payload of {length} bytes exceeds the slot capacity {self.capacity}")
+
+        with self._lock.write():
+            self._payload[:length] = payload
+            self._length[0] = length
+
+    def read(self, reader: Callable[[memoryview], T]) -> T:
+        """calls the reader with a view of the valid payload without copying, see `SeqLock.read()`."""
+        return self._lock.read(lambda _: reader(self._payload[: self._length[0]]))
+
+    def snapshot(self) -> bytes:
+        """returns a consistent copy of the valid payload."""
+        return self.read(bytes)
+
+    def close(self) -> None:
+        self._lock.close()
+        self._length.release()
+        self._payload.release()
@@ -0,0 +1,214 @@
+import mmap
+import struct
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from typing import NamedTuple, Self
+
+import posix_ipc
+
+from .defaults import DEFAULT_SLOT_SIZE, DEFAULT_SLOTS
+from .registry import POSIX_SHARED_MEMORY, register, unregister
+from .ring import Backoff
+
+# arena layout (a POSIX shared memory segment):
+#   0: magic(8) | slot size(u64) | slot count(u64)
+#  64: slot states(u64 * slot count), FREE or USED
+#   then the slots, each 64-byte aligned.
+#
+# the client that creates the arena is the only one allocating slots (FREE -> USED),
+# and the server is the only one releasing them (USED -> FREE),
+# so a native u64 store of the state is enough to hand a slot over.
+MAGIC = b"SHMARENA"
+_META = struct.Struct("=8sQQ")
+_STATES_OFFSET = 64
+FREE = 0
+USED = 1
+
+# descriptor sent over the queue in place of a spilled payload:
+#   magic(2) | slot(u32) | offset(u64) | length(u64) | segment name length(u16) | segment name
+DESCRIPTOR_MAGIC = b"\xb1S"
+_DESCRIPTOR = struct.Struct("<2sIQQH")
+
+DEFAULT_MAX_ARENAS = 8
+
+
+class Descriptor(NamedTuple):
+    segment: str
+    slot: int
+    offset: int
+    length: int
+
+
+def _align(size: int) -> int:
+    return (size + 63) & ~63
+
+
+def arena_name(prefix: str, pid: int) -> str:
+    """the arena of a client process, named after its queue."""
+    return f"/{prefix.lstrip('/')}.arena-{pid}"
+
+
+def is_descriptor(message: bytes) -> bool:
+    return len(message) >= _DESCRIPTOR.size and message[: len(DESCRIPTOR_MAGIC)] == DESCRIPTOR_MAGIC
+
+
+def encode_descriptor(descriptor: Descriptor) -> bytes:
+    segment = descriptor.segment.encode("utf-8")
+    header = _DESCRIPTOR.pack(DESCRIPTOR_MAGIC, descriptor.slot, descriptor.offset, descriptor.length, len(segment))
+    return header + segment
+
+
+def decode_descriptor(message: bytes) -> Descriptor:
+    magic, slot, offset, length, size = _DESCRIPTOR.unpack_from(message, 0)
+    if magic != DESCRIPTOR_MAGIC:
+        raise ValueError("message is not a descriptor")
+    segment = bytes(message[_DESCRIPTOR.size : _DESCRIPTOR.size + size]).decode("utf-8")
+    return Descriptor(segment, slot, offset, length)
+
+
+class Arena:
+    """Pool of fixed-size payload slots in a POSIX shared memory segment.
+
+    A client spills a payload too large for its queue into a free slot and sends the small descriptor instead,
+    the server maps the payload without copying and releases the slot when it is done with it.
+    """
+
+    def __init__(self, name: str, mm: mmap.mmap) -> None:
+        self.name = name
+        self._mm = mm
+        magic, self.slot_size, self.slots = _META.unpack_from(mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"shared memory [{name}] does not contain an arena")
+
+        self._states = memoryview(mm)[_STATES_OFFSET : _STATES_OFFSET + 8 * self.slots].cast("Q")
+        self._data_offset = _align(_STATES_OFFSET + 8 * self.slots)
+        self._next = 0
+
+    @classmethod
+    def create(cls, name: str, slot_size: int = DEFAULT_SLOT_SIZE, slots: int = DEFAULT_SLOTS) -> Self:
+        slot_size = _align(slot_size)
+        size = _align(_STATES_OFFSET + 8 * slots) + slot_size * slots
+        shm = posix_ipc.SharedMemory(name, posix_ipc.O_CREX, size=size)
+        register(POSIX_SHARED_MEMORY, name)
+        mm = mmap.mmap(shm.fd, shm.size)
+        shm.close_fd()
+        _META.pack_into(mm, 0, MAGIC, slot_size, slots)
+        return cls(name, mm)
+
+    @classmethod
+    def attach(cls, name: str) -> Self:
+        shm = posix_ipc.SharedMemory(name)
+        mm = mmap.mmap(shm.fd, shm.size)
+        shm.close_fd()
+        return cls(name, mm)
+
+    def spill(self, payload: bytes) -> bytes:
+        """copies the payload into a free slot, waiting for one, and returns the descriptor to send."""
+        if len(payload) > self.slot_size:
+            raise ValueError(f"payload of {len(payload)} bytes exceeds the arena slot size {self.slot_size}")
+
+        backoff = Backoff(maximum=0.01)
+        while True:
+            for _ in range(self.slots):
+                slot = self._next
+                self._next = (self._next + 1) % self.slots
+                if self._states[slot] == FREE:
+                    offset = self._data_offset + slot * self.slot_size
+                    self._mm[offset : offset + len(payload)] = payload
+                    self._states[slot] = USED
+                    return encode_descriptor(Descriptor(self.name, slot, offset, len(payload)))
+            backoff.wait()
+
+    def release(self, slot: int) -> None:
+        self._states[slot] = FREE
+
+    def in_use(self) -> int:
+        return sum(1 for state in self._states if state != FREE)
+
+    def wait_idle(self, timeout: float) -> bool:
+        """waits until the server released every slot, returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self.in_use():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    @contextmanager
+    def payload(self, descriptor: Descriptor) -> Iterator[memoryview]:
+        """yields a view of the spilled payload and releases its slot on exit."""
+        with memoryview(self._mm) as view:
+            payload = view[descriptor.offset : descriptor.offset + descriptor.length]
+        try:
+            yield payload
+        finally:
+            self.release(descriptor.slot)
+            # fails only while the decoded object still exports the view, such as a zero-copy pickle buffer.
+            with suppress(BufferError):
+                payload.release()
+
+    def exists(self) -> bool:
+        """whether the segment still has its name, the client unlinks it when it is done."""
+        try:
+            posix_ipc.SharedMemory(self.name).close_fd()
+            return True
+        except posix_ipc.ExistentialError:
+            return False
+
+    def close(self, unlink: bool = False) -> None:
+        self._states.release()
+        self._mm.close()
+        if unlink:
+            posix_ipc.unlink_shared_memory(self.name)
+            unregister(POSIX_SHARED_MEMORY, self.name)
+
+
+class SpillReader:
+    """Resolves the messages received from a queue, mapping the arenas named by descriptors on first use.
+
+    An arena stays mapped while its client sends descriptors. Before mapping a new one,
+    the arenas their clients have unlinked are unmapped, and the least recently used ones beyond `max_arenas`.
+    """
+
+    def __init__(self, max_arenas: int = DEFAULT_MAX_ARENAS) -> None:
+        self._arenas: OrderedDict[str, Arena] = OrderedDict()
+        self._max_arenas = max_arenas
+
+    def _evict(self) -> None:
+        for name, arena in list(self._arenas.items()):
+            if len(self._arenas) < self._max_arenas and arena.exists():
+                continue
+            del self._arenas[name]
+            # fails only while a decoded object still exports a view of it, it is then unmapped once collected.
+            with suppress(BufferError):
+                arena.close()
+
+    def _arena(self, name: str) -> Arena:
+        arena = self._arenas.get(name)
+        if arena is None:
+            self._evict()
+            arena = self._arenas[name] = Arena.attach(name)
+        else:
+            self._arenas.move_to_end(name)
+        return arena
+
+    @contextmanager
+    def payload(self, message: bytes) -> Iterator[bytes | memoryview]:
+        """yields the message itself, or the spilled payload its descriptor points to.
+
+        The spilled payload is a view of the shared memory, valid only inside the block.
+        """
+        if not is_descriptor(message):
+            yield message
+            return
+
+        descriptor = decode_descriptor(message)
+        with self._arena(descriptor.segment).payload(descriptor) as payload:
+            yield payload
+
+    def close(self) -> None:
+        for arena in self._arenas.values():
+            arena.close()
+        self._arenas.clear()
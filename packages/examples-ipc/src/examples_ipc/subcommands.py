@@ -0,0 +1,25 @@
+import importlib
+import sys
+from argparse import ArgumentParser
+from typing import NamedTuple
+
+
+class Subcommand(NamedTuple):
+    module: str
+    """the module with `configure_arguments(parser)`, relative to the package of the parent command."""
+    help: str
+
+
+def add_subcommands(parser: ArgumentParser, package: str, subcommands: dict[str, Subcommand]) -> None:
+    """adds the subcommands, importing the module of the selected one only.
+
+    The other subcommands are listed by name and help, so `-h` still shows them all,
+    but neither their modules nor the IPC modules they depend on are imported.
+    The selected one is the first argument naming a subcommand, as the commands above it take no option values.
+    """
+    subparsers = parser.add_subparsers(required=True)
+    selected = next((arg for arg in sys.argv[1:] if arg in subcommands), None)
+    for name, subcommand in subcommands.items():
+        subparser = subparsers.add_parser(name, help=subcommand.help)
+        if name == selected:
+            importlib.import_module(subcommand.module, package).configure_arguments(subparser)
@@ -0,0 +1,41 @@
+"""Directory of the readers of a shared memory segment, so that a writer can wake each one of them.
+
+A semaphore shared by the readers wakes only one of them per post,
+so each reader waits on a semaphore of its own and lists it in the directory of the segment,
+and the writer posts the semaphore of every reader listed there.
+"""
+
+import os
+from contextlib import suppress
+from urllib.parse import quote, unquote
+
+from .registry import registry_dir
+
+
+def _dir(kind: str, segment: str | int) -> str:
+    return os.path.join(registry_dir(), "subscribers", f"{kind}.{quote(str(segment), safe='')}")
+
+
+def _path(kind: str, segment: str | int, semaphore: str | int) -> str:
+    return os.path.join(_dir(kind, segment), quote(str(semaphore), safe=""))
+
+
+def subscribe(kind: str, segment: str | int, semaphore: str | int) -> None:
+    """lists the semaphore of a reader of the segment."""
+    os.makedirs(registry_dir(), mode=0o700, exist_ok=True)
+    os.makedirs(_dir(kind, segment), mode=0o700, exist_ok=True)
+    with open(_path(kind, segment, semaphore), "w"):
+        pass
+
+
+def unsubscribe(kind: str, segment: str | int, semaphore: str | int) -> None:
+    with suppress(FileNotFoundError):
+        os.remove(_path(kind, segment, semaphore))
+
+
+def subscribers(kind: str, segment: str | int) -> list[str]:
+    """the semaphores of the readers of the segment."""
+    try:
+        return [unquote(filename) for filename in os.listdir(_dir(kind, segment))]
+    except FileNotFoundError:
+        return []
@@ -0,0 +1,39 @@
+from argparse import ArgumentParser, Namespace
+
+from .registry import collect, is_alive, registry_dir, resources
+
+
+def _list() -> None:
+    print(f"registry: {registry_dir()}")
+    for resource in resources():
+        holders = ", ".join(f"{holder.pid}{'' if is_alive(holder) else ' (dead)'}" for holder in resource.holders)
+        print(f"{resource.kind} {resource.name}: {holders}")
+
+
+def _run(args: Namespace) -> None:
+    if args.list:
+        _list()
+        return
+
+    removed = 0
+    for resource in collect(args.dry_run):
+        pids = ", ".join(str(holder.pid) for holder in resource.holders)
+        print(f"{resource.kind} {resource.name} {'is an orphan' if args.dry_run else 'is removed'} (holders: {pids}).")
+        removed += 1
+    print(f"{removed} orphans {'found' if args.dry_run else 'removed'}.")
+
+
+def configure_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument(
+        "-l",
+        "--list",
+        action="store_true",
+        help="list the registered IPC objects and their processes.",
+    )
+    parser.add_argument(
+        "-n",
+        "--dry-run",
+        action="store_true",
+        help="report the orphans without removing them.",
+    )
+    parser.set_defaults(exec=lambda args: _run(args))
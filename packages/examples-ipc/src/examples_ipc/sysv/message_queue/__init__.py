@@ -1,14 +1,17 @@
 from argparse import ArgumentParser, Namespace
 
-import sysv_ipc
-
-from .client import run as _client_run
-from .server import run as _service_run
+from ...codecs import CODECS
+from ...defaults import DEFAULT_HANDLER, DEFAULT_SLOT_SIZE
 
 
 def _clean(key: int) -> None:
+    import sysv_ipc
+
+    from ...registry import SYSV_MESSAGE_QUEUE, unregister
+
     mq = sysv_ipc.MessageQueue(key)
     sysv_ipc.remove_message_queue(mq.id)
+    unregister(SYSV_MESSAGE_QUEUE, key)
     print(f"{key} [msqid: {mq.id}] is removed.")
     # spell-checker:words msqid
 
@@ -17,11 +20,28 @@ def _run(args: Namespace) -> None:
     if args.clean:
         _clean(args.key)
 
+    elif args.is_server_mode and args.workers:
+        from .workers import run as _workers_run
+
+        _workers_run(args.key, args.workers, args.handler, args.message_type, args.codec)
+
     elif args.is_server_mode:
-        _service_run(args.key)
+        from .server import run as _service_run
+
+        _service_run(args.key, args.message_type, args.codec)
+
+    elif args.batch_size:
+        from .client import run_batched as _client_run_batched
+
+        _client_run_batched(args.key, args.count, args.batch_size, args.linger, args.channels, args.codec)
 
     else:
-        _client_run(args.key, args.count)
+        if args.codec == "struct" and args.payload_size:
+            raise ValueError("the struct codec has only the count, --payload-size needs another codec")
+
+        from .client import run as _client_run
+
+        _client_run(args.key, args.count, args.codec, args.payload_size, args.spill_threshold, args.slot_size)
 
 
 def configure_arguments(parser: ArgumentParser) -> None:
@@ -38,6 +58,47 @@ def configure_arguments(parser: ArgumentParser) -> None:
         help="run as a service and displays the contents of the message queue.",
         default=False,
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="run the service as a pool of worker processes competing for the messages.",
+        default=None,
+    )
+    parser.add_argument(
+        "--handler",
+        help="the function called with each decoded record in worker mode, as module:function. (default: %(default)s)",
+        default=DEFAULT_HANDLER,
+    )
+    parser.add_argument(
+        "--codec",
+        choices=list(CODECS),
+        help="the serializer of the payloads, the same on the client and the server. "
+        "(default: json for messages, struct for batched records)",
+        default=None,
+    )
+    parser.add_argument(
+        "--payload-size",
+        dest="payload_size",
+        type=int,
+        help="the size of the string payload added to each message in client mode.",
+        default=0,
+    )
+    parser.add_argument(
+        "--spill-threshold",
+        dest="spill_threshold",
+        type=int,
+        help="the message size in bytes above which the client writes the message to a shared memory arena "
+        "and sends only its descriptor.",
+        default=None,
+    )
+    parser.add_argument(
+        "--slot-size",
+        dest="slot_size",
+        type=int,
+        help="the size of each slot of the shared memory arena. (default: %(default)s)",
+        default=DEFAULT_SLOT_SIZE,
+    )
     parser.add_argument(
         "-c",
         "--count",
@@ -46,6 +107,35 @@ def configure_arguments(parser: ArgumentParser) -> None:
         help="the number of send in client mode.",
         default=10,
     )
+    parser.add_argument(
+        "-t",
+        "--type",
+        dest="message_type",
+        type=int,
+        help="the message type received in server mode, "
+        "0 is any, a positive type is that channel only, a negative type is the lowest types up to it first.",
+        default=0,
+    )
+    parser.add_argument(
+        "--batch-size",
+        dest="batch_size",
+        type=int,
+        help="the number of records packed into a binary frame of up to msgmax bytes per send in client mode.",
+        default=None,
+    )
+    parser.add_argument(
+        "--linger",
+        type=float,
+        help="the seconds to wait for a batch to fill before sending it. (default: %(default)s)",
+        default=0.005,
+    )
+    parser.add_argument(
+        "--channels",
+        type=int,
+        help="the number of channels (message types 1 to N) the batches are spread over in client mode. "
+        "(default: %(default)s)",
+        default=1,
+    )
     parser.add_argument(
         "-k",
         "--key",
@@ -1,18 +1,51 @@
-import json
+import os
 import time
+from typing import Any
 
 import sysv_ipc
 
+from ...codecs import DEFAULT_CODEC, DEFAULT_RECORD_CODEC, get_codec
+from ...defaults import DEFAULT_SLOT_SIZE
+from ...framing import FrameBuilder
+from ...registry import SYSV_MESSAGE_QUEUE, register
+from ...spill import Arena, arena_name
+from .limits import msgmax
 
-def run(key: int, count: int) -> None:
-    mq = sysv_ipc.MessageQueue(key, sysv_ipc.IPC_CREAT)
+
+def run(
+    key: int,
+    count: int,
+    codec: str | None = None,
+    payload_size: int = 0,
+    spill_threshold: int | None = None,
+    slot_size: int = DEFAULT_SLOT_SIZE,
+) -> None:
+    """sends a message a second, with a payload of `payload_size` bytes.
+
+    Messages larger than `spill_threshold` bytes are written to a shared memory arena,
+    and only their descriptors are sent over the queue.
+    """
+    encoder = get_codec(codec or DEFAULT_CODEC)
+    mq = sysv_ipc.MessageQueue(key, sysv_ipc.IPC_CREAT, max_message_size=msgmax())
+    register(SYSV_MESSAGE_QUEUE, key)
+
+    arena = (
+        Arena.create(arena_name(f"examples-ipc-{key}", os.getpid()), slot_size)
+        if spill_threshold is not None
+        else None
+    )
 
     print(f"send to {key} {count} times.")
     try:
         for i in range(count):
             counter = i
-            obj = {"count": counter}
-            mq.send(json.dumps(obj))
+            obj: dict[str, Any] = {"count": counter}
+            if payload_size:
+                obj["payload"] = "x" * payload_size
+            data = encoder.encode(obj)
+            if arena is not None and len(data) > (spill_threshold or 0):
+                data = arena.spill(data)
+            mq.send(data)
             print(f"pushed: {counter}")
             time.sleep(1)
 
@@ -20,5 +53,55 @@ def run(key: int, count: int) -> None:
         print("canceled.")
         pass
 
-    # mq.close()
+    if arena is not None:
+        # the server releases the slots of the spilled payloads it received.
+        if not arena.wait_idle(5.0):
+            print(f"{arena.in_use()} spilled payloads are not received.")
+        arena.close(unlink=True)
     print("send complete.")
+
+
+def run_batched(
+    key: int, count: int, batch_size: int, linger: float, channels: int = 1, codec: str | None = None
+) -> None:
+    """sends the records in frames of up to `msgmax` bytes, spread round-robin over the channels.
+
+    A channel is a message type (1 to `channels`), so a server can receive the frames of one channel only.
+    """
+    encoder = get_codec(codec or DEFAULT_RECORD_CODEC)
+    capacity = msgmax()
+    mq = sysv_ipc.MessageQueue(key, sysv_ipc.IPC_CREAT, max_message_size=capacity)
+    register(SYSV_MESSAGE_QUEUE, key)
+    batches = {channel: FrameBuilder(capacity) for channel in range(1, channels + 1)}
+    sent = 0
+
+    def flush(channel: int) -> None:
+        nonlocal sent
+        batch = batches[channel]
+        if len(batch):
+            mq.send(batch.build(), type=channel)
+            sent += 1
+
+    print(f"send to {key} {count} records over {channels} channels, batch size: {batch_size}, linger: {linger}s.")
+    started = time.perf_counter()
+    try:
+        for i in range(count):
+            channel = i % channels + 1
+            batch = batches[channel]
+            record = encoder.encode({"count": i})
+            if not batch.append(record):
+                flush(channel)
+                batch.append(record)
+
+            if len(batch) >= batch_size or batch.age >= linger:
+                flush(channel)
+
+        for channel in batches:
+            flush(channel)
+
+    except KeyboardInterrupt:
+        print("canceled.")
+        pass
+
+    elapsed = time.perf_counter() - started
+    print(f"send complete. {count} records in {sent} messages, {elapsed:.3f}s ({count / elapsed:,.0f} records/s)")
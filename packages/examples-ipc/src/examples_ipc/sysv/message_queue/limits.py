@@ -0,0 +1,4 @@
+def msgmax() -> int:
+    """the maximum size of a SystemV message in bytes, configured by the kernel."""
+    with open("/proc/sys/kernel/msgmax") as file:
+        return int(file.read())
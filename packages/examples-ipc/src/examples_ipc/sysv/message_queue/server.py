@@ -1,4 +1,4 @@
-import json
+import reprlib
 import signal
 import time
 from datetime import datetime
@@ -6,28 +6,81 @@ from typing import Any
 
 import sysv_ipc
 
+from ...codecs import DEFAULT_CODEC, DEFAULT_RECORD_CODEC, get_codec
+from ...framing import decode_frame, is_frame
+from ...registry import SYSV_MESSAGE_QUEUE, register
+from ...spill import SpillReader
+from .limits import msgmax
+
 
 def handler(_signum: int, _frame: Any) -> None:
     # spell-checker:words signum
     pass
 
 
-def run(key: int) -> None:
+def run(key: int, message_type: int = 0, codec: str | None = None) -> None:
+    """receives the messages of the type selector.
+
+    0 receives every message, a positive type receives that channel only,
+    and a negative type receives the lowest types up to its absolute value first.
+    """
+    message_codec = get_codec(codec or DEFAULT_CODEC)
+    record_codec = get_codec(codec or DEFAULT_RECORD_CODEC)
+    spill = SpillReader()
     signal.signal(signal.SIGINT, handler)
 
-    mq = sysv_ipc.MessageQueue(key, sysv_ipc.IPC_CREAT)
+    mq = sysv_ipc.MessageQueue(key, sysv_ipc.IPC_CREAT, max_message_size=msgmax())
+    register(SYSV_MESSAGE_QUEUE, key)
 
-    print(f"start queue server: {key}")
+    print(f"start queue server: {key}, type: {message_type}")
     try:
+        records = 0
+        batches = 0
+        channels: set[int] = set()
+        last = None
+        reported = received = time.monotonic()
         while True:
-            message = mq.receive()
-            now = datetime.now().time()
-            print(now, json.loads(message[0]))
-            time.sleep(1)
+            try:
+                # polls while records are pending, to report them once the queue is idle for a moment.
+                message, channel = mq.receive(block=not batches, type=message_type)
+                received = time.monotonic()
+            except sysv_ipc.BusyError:
+                message = None
+                time.sleep(0.01)
+
+            framed = False
+            if message is not None and is_frame(message):
+                framed = True
+                if not batches:
+                    reported = time.monotonic()
+                frame = decode_frame(message)
+                for record in frame.records:
+                    last = record_codec.decode(record)
+                records += len(frame.records)
+                batches += 1
+                channels.add(channel)
+
+            idle = message is None and time.monotonic() - received >= 0.1
+            if batches and (idle or (message is not None and not framed) or time.monotonic() - reported >= 1.0):
+                now = datetime.now().time()
+                print(
+                    now,
+                    f"{records} records in {batches} batches from channels {sorted(channels)}, last: {last}",
+                )
+                records = batches = 0
+                channels.clear()
+                reported = time.monotonic()
+
+            if message is not None and not framed:
+                now = datetime.now().time()
+                with spill.payload(message) as payload:
+                    # shortens large payloads.
+                    print(now, reprlib.repr(message_codec.decode(payload)))
+                time.sleep(1)
 
     except sysv_ipc.Error:
         print("canceled.")
         pass
 
-    # mq.close()
+    spill.close()
     print(f"end queue server: {key}")
@@ -0,0 +1,30 @@
+import sysv_ipc
+
+from ...registry import SYSV_MESSAGE_QUEUE, register
+from ...workers import Decoder, Handler, WorkerPool, load_handler, record_decoder, stop_requested
+from .limits import msgmax
+
+
+def _work(index: int, key: int, message_type: int, handler: Handler, decode_records: Decoder) -> None:
+    mq = sysv_ipc.MessageQueue(key, sysv_ipc.IPC_CREAT, max_message_size=msgmax())
+    register(SYSV_MESSAGE_QUEUE, key)
+    while not stop_requested():
+        try:
+            message, _ = mq.receive(type=message_type)
+        except sysv_ipc.Error as e:
+            # the signal that stops the pool interrupts the blocking receive, which raises the base error (EINTR).
+            # Any other error, such as the queue being removed, ends the worker for the pool to see.
+            if type(e) is sysv_ipc.Error and stop_requested():
+                continue
+            raise
+
+        for record in decode_records(message):
+            handler(record)
+
+
+def run(key: int, workers: int, handler: str, message_type: int = 0, codec: str | None = None) -> None:
+    pool = WorkerPool(workers, _work, (key, message_type, load_handler(handler), record_decoder(codec)))
+
+    print(f"start queue workers: {key}, type: {message_type}, workers: {workers}, handler: {handler}")
+    pool.run()
+    print(f"end queue workers: {key}")
@@ -1,14 +1,16 @@
 from argparse import ArgumentParser, Namespace
 
-import sysv_ipc
-
-from .client import run as _client_run
-from .server import run as _service_run
+from ...events import DEFAULT_HISTORY_SIZE
 
 
 def _clean(key: int) -> None:
+    import sysv_ipc
+
+    from ...registry import SYSV_SEMAPHORE, unregister
+
     sem = sysv_ipc.Semaphore(key)
     sysv_ipc.remove_semaphore(sem.id)
+    unregister(SYSV_SEMAPHORE, key)
     print(f"{key} [semid: {sem.id}] is removed.")
     # spell-checker:words semid
 
@@ -17,10 +19,34 @@ def _run(args: Namespace) -> None:
     if args.clean:
         _clean(args.key)
 
+    elif args.is_server_mode and args.monitor:
+        from .server import run_monitor as _monitor_run
+
+        _monitor_run(args.key, args.count, args.history_size, args.history)
+
     elif args.is_server_mode:
+        from .server import run as _service_run
+
         _service_run(args.key, args.count)
 
+    elif args.lock:
+        from .client import run_locked as _client_run_locked
+
+        _client_run_locked(args.key, args.lock, args.hold, args.timeout, args.repeat)
+
+    elif args.barrier:
+        from .client import run_barrier as _client_run_barrier
+
+        _client_run_barrier(args.key, args.barrier, args.hold, args.timeout, args.repeat)
+
+    elif args.units:
+        from .client import run_limited as _client_run_limited
+
+        _client_run_limited(args.key, args.count, args.units, args.hold, args.timeout, args.repeat)
+
     else:
+        from .client import run as _client_run
+
         _client_run(args.key, args.count, args.release)
 
 
@@ -38,12 +64,67 @@ def configure_arguments(parser: ArgumentParser) -> None:
         help="run as a service and displays the contents of the semaphore.",
         default=False,
     )
+    parser.add_argument(
+        "-m",
+        "--monitor",
+        action="store_true",
+        help="run the server as a monitor that reports every change posted by the clients.",
+    )
+    parser.add_argument(
+        "--history-size",
+        type=int,
+        help="the number of latest changes the monitor keeps. (default: %(default)s)",
+        default=DEFAULT_HISTORY_SIZE,
+    )
+    parser.add_argument(
+        "--history",
+        help="writes the changes kept by the monitor as JSON to the file on exit, or to stdout with '-'.",
+        default=None,
+    )
     parser.add_argument(
         "-r",
         "--release",
         action="store_true",
         help="unset semaphore.",
     )
+    parser.add_argument(
+        "-u",
+        "--units",
+        type=int,
+        help="acquire the units through the resource limiter, hold them and release them.",
+        default=None,
+    )
+    parser.add_argument(
+        "--lock",
+        choices=["read", "write"],
+        help="take the reader-writer lock of a semaphore set of the key, hold it and release it.",
+        default=None,
+    )
+    parser.add_argument(
+        "--barrier",
+        type=int,
+        metavar="PARTIES",
+        help="wait at the barrier of a semaphore set of the key with the number of parties.",
+        default=None,
+    )
+    parser.add_argument(
+        "--hold",
+        type=float,
+        help="the seconds the limiter units or the lock are held, or before each barrier. (default: %(default)s)",
+        default=1.0,
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="the seconds to wait for the limiter units, the lock or the barrier, forever if not set.",
+        default=None,
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        help="the number of times the limiter units or the lock are acquired, or the barrier rounds. (default: %(default)s)",
+        default=1,
+    )
     parser.add_argument(
         "-c",
         "--count",
@@ -0,0 +1,70 @@
+import sysv_ipc
+
+from .semset import IPC_NOWAIT, Op, SemaphoreSet
+
+# semaphores of the set
+_REMAINING = 0
+"""the parties still to arrive, 0 releases the parties waiting for it."""
+_DEPARTED = 1
+"""the released parties, the last one to arrive waits for them before the barrier is used again."""
+
+
+class Barrier:
+    """Reusable barrier shared between a fixed number of processes.
+
+    Each process blocks in `wait()` until all the parties have called it.
+    The last party to arrive is found by atomic `semop`s that decrement the remaining count
+    only when it is exactly 1 or at least 2, and it resets the count once every other party has left,
+    so a party that calls `wait()` again right away waits for the next round.
+    A crashed party leaves the others waiting, so the barrier does not use `SEM_UNDO`.
+    """
+
+    def __init__(self, key: int, parties: int) -> None:
+        if parties < 1:
+            raise ValueError(f"parties [{parties}] must be at least 1")
+        self.parties = parties
+        self._set = SemaphoreSet(key, [parties, 0])
+
+    @property
+    def waiting(self) -> int:
+        return self.parties - self._set.value(_REMAINING)
+
+    def _arrive(self) -> bool:
+        """counts this party in, returns True for the last one."""
+        while True:
+            try:
+                # 1 -> 0: the last party, which releases the others waiting for zero.
+                self._set.op(Op(_REMAINING, -1, IPC_NOWAIT), Op(_REMAINING, 0, IPC_NOWAIT))
+                return True
+            except sysv_ipc.BusyError:
+                pass
+            try:
+                # n -> n - 1 only when n >= 2.
+                self._set.op(Op(_REMAINING, -2, IPC_NOWAIT), Op(_REMAINING, 1))
+                return False
+            except sysv_ipc.BusyError:
+                pass
+            # 0 while the previous round is leaving, sleeps until it is reset.
+            self._set.op(Op(_REMAINING, -1), Op(_REMAINING, 1))
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """blocks until all the parties arrive, returns True in the one that arrived last.
+
+        `timeout` bounds the wait of the parties that are not the last one and raises `TimeoutError`,
+        after which the barrier is broken for the round.
+        """
+        if self._arrive():
+            if self.parties > 1:
+                self._set.op(Op(_DEPARTED, -(self.parties - 1)))
+            self._set.op(Op(_REMAINING, self.parties))
+            return True
+
+        try:
+            self._set.op(Op(_REMAINING, 0), timeout=timeout)
+        except sysv_ipc.BusyError as e:
+            raise TimeoutError(f"{self.waiting} of {self.parties} parties arrived within {timeout}s") from e
+        self._set.op(Op(_DEPARTED, 1))
+        return False
+
+    def remove(self) -> None:
+        self._set.remove()
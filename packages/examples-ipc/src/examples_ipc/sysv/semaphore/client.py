@@ -1,5 +1,13 @@
+import time
+from datetime import datetime
+
 import sysv_ipc
 
+from .barrier import Barrier
+from .events import open_events, post_event
+from .limiter import SysvLimiter
+from .rwlock import RWLock
+
 
 def run(key: int, count: int, release: bool) -> None:
     with sysv_ipc.Semaphore(key) as sem:
@@ -10,3 +18,52 @@ def run(key: int, count: int, release: bool) -> None:
             sem.acquire(0)
 
         print(f"semaphore[{key}]: {previous} -> {sem.value}")
+        post_event(open_events(key), 1 if release else -1, sem.value)
+
+
+def run_limited(key: int, count: int, units: int, hold: float, timeout: float | None, repeat: int) -> None:
+    limiter = SysvLimiter(key, count, units, timeout)
+    try:
+        for _ in range(repeat):
+            try:
+                with limiter:
+                    print(datetime.now().time(), f"acquired {units} units, available: {limiter.value}")
+                    time.sleep(hold)
+            except TimeoutError as e:
+                print(datetime.now().time(), e)
+    except KeyboardInterrupt:
+        print("canceled.")
+
+    print(limiter.stats.summary())
+
+
+def run_locked(key: int, mode: str, hold: float, timeout: float | None, repeat: int) -> None:
+    lock = RWLock(key)
+    hold_lock = lock.write if mode == "write" else lock.read
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            try:
+                with hold_lock(timeout):
+                    waited = (time.perf_counter() - started) * 1e3
+                    now = datetime.now().time()
+                    print(now, f"{mode} lock acquired in {waited:.3f}ms, readers: {lock.readers}")
+                    time.sleep(hold)
+            except TimeoutError as e:
+                print(datetime.now().time(), e)
+    except KeyboardInterrupt:
+        print("canceled.")
+
+
+def run_barrier(key: int, parties: int, hold: float, timeout: float | None, repeat: int) -> None:
+    barrier = Barrier(key, parties)
+    try:
+        for round in range(repeat):
+            time.sleep(hold)
+            print(datetime.now().time(), f"round {round}: arrived, waiting: {barrier.waiting + 1}/{parties}")
+            last = barrier.wait(timeout)
+            print(datetime.now().time(), f"round {round}: released" + (" (last)" if last else ""))
+    except TimeoutError as e:
+        print(datetime.now().time(), e)
+    except KeyboardInterrupt:
+        print("canceled.")
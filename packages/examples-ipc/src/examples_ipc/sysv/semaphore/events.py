@@ -0,0 +1,47 @@
+import os
+
+import sysv_ipc
+
+from ...events import EVENT_SIZE, encode_event
+from ...registry import SYSV_MESSAGE_QUEUE, register
+
+# "EV" in the high bytes, so the queue does not collide with the message queue examples of the same key.
+_EVENTS_KEY_MARK = 0x4556_0000
+
+
+def events_key(key: int) -> int:
+    """the key of the message queue paired with the semaphore."""
+    return key ^ _EVENTS_KEY_MARK
+
+
+def create_events(key: int) -> sysv_ipc.MessageQueue:
+    """creates the queue the monitor receives the events of the semaphore from."""
+    mq = sysv_ipc.MessageQueue(events_key(key), flags=sysv_ipc.IPC_CREAT, max_message_size=EVENT_SIZE)
+    register(SYSV_MESSAGE_QUEUE, events_key(key))
+    return mq
+
+
+def open_events(key: int) -> sysv_ipc.MessageQueue | None:
+    """opens the queue of a running monitor, None if no monitor is running."""
+    try:
+        return sysv_ipc.MessageQueue(events_key(key), max_message_size=EVENT_SIZE)
+    except sysv_ipc.ExistentialError:
+        return None
+
+
+def post_event(
+    mq: sysv_ipc.MessageQueue | None, delta: int, value: int, wait_ns: int = 0
+) -> sysv_ipc.MessageQueue | None:
+    """posts the change of the semaphore without blocking, returns the queue to post the next events to.
+
+    The event is dropped if the queue is full, and None is returned once the monitor has removed the queue.
+    """
+    if mq is None:
+        return None
+    try:
+        mq.send(encode_event(os.getpid(), delta, value, wait_ns), block=False)
+    except sysv_ipc.BusyError:
+        pass
+    except (sysv_ipc.ExistentialError, OSError):
+        return None
+    return mq
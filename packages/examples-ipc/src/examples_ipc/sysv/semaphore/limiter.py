@@ -0,0 +1,64 @@
+import sysv_ipc
+
+from ...limiter import ResourceLimiter
+from ...registry import SYSV_SEMAPHORE, register
+from .events import open_events, post_event
+from .semset import SEM_UNDO, Op, semop
+
+
+class SysvLimiter(ResourceLimiter):
+    """`ResourceLimiter` over a SystemV semaphore.
+
+    N units are taken or given back at once by a single `semop` with a delta of N,
+    and with `SEM_UNDO` the kernel gives back the units held by a process that crashed.
+    Where `sysv_ipc` does not support timeouts, a timed acquire calls `semtimedop` itself.
+    """
+
+    def __init__(self, key: int, size: int, units: int = 1, timeout: float | None = None) -> None:
+        super().__init__(units, timeout)
+        self.key = key
+        try:
+            self._sem = sysv_ipc.Semaphore(key, flags=sysv_ipc.IPC_CREX, initial_value=size)
+        except sysv_ipc.ExistentialError:
+            # opening with IPC_CREAT would reset the units held by the other processes.
+            self._sem = sysv_ipc.Semaphore(key)
+        register(SYSV_SEMAPHORE, key)
+        self._sem.undo = True
+        self._events = open_events(key)
+
+    def _notify(self, delta: int, wait_ns: int) -> None:
+        self._events = post_event(self._events, delta, self.value, wait_ns)
+
+    @property
+    def value(self) -> int:
+        value: int = self._sem.value
+        return value
+
+    @property
+    def waiting(self) -> int:
+        """the number of processes waiting for units, seen by the kernel."""
+        waiting: int = self._sem.waiting_for_nonzero
+        return waiting
+
+    def _try_acquire(self, units: int) -> bool:
+        self._sem.block = False
+        try:
+            self._sem.acquire(None, units)
+            return True
+        except sysv_ipc.BusyError:
+            return False
+        finally:
+            self._sem.block = True
+
+    def _acquire(self, units: int, timeout: float | None) -> bool:
+        try:
+            if timeout is None or sysv_ipc.SEMAPHORE_TIMEOUT_SUPPORTED:
+                self._sem.acquire(timeout, units)
+            else:
+                semop(self._sem.id, Op(0, -units, SEM_UNDO), timeout=timeout)
+            return True
+        except sysv_ipc.BusyError:
+            return False
+
+    def _release(self, units: int) -> None:
+        self._sem.release(units)
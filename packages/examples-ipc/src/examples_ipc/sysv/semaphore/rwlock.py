@@ -0,0 +1,94 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import sysv_ipc
+
+from .semset import SEM_UNDO, Op, SemaphoreSet
+
+# semaphores of the set
+_READERS = 0
+"""the readers holding the lock."""
+_WRITER = 1
+"""1 while a writer holds the lock."""
+_WRITERS_WAITING = 2
+"""the writers waiting for the lock, which keep new readers out."""
+
+
+class RWLock:
+    """Reader-writer lock shared between processes, with priority to the writers.
+
+    Readers hold the lock together, a writer holds it alone.
+    A waiting writer blocks the new readers, so a stream of readers cannot starve it.
+    Every change is made with `SEM_UNDO`, so the kernel releases the lock held by a process that crashed.
+    """
+
+    def __init__(self, key: int) -> None:
+        self._set = SemaphoreSet(key, [0, 0, 0])
+
+    @property
+    def readers(self) -> int:
+        return self._set.value(_READERS)
+
+    @property
+    def writers_waiting(self) -> int:
+        return self._set.value(_WRITERS_WAITING)
+
+    def acquire_read(self, timeout: float | None = None) -> bool:
+        """waits until no writer holds or waits for the lock, returns False on timeout."""
+        try:
+            self._set.op(
+                Op(_WRITERS_WAITING, 0),
+                Op(_WRITER, 0),
+                Op(_READERS, 1, SEM_UNDO),
+                timeout=timeout,
+            )
+            return True
+        except sysv_ipc.BusyError:
+            return False
+
+    def release_read(self) -> None:
+        self._set.op(Op(_READERS, -1, SEM_UNDO))
+
+    def acquire_write(self, timeout: float | None = None) -> bool:
+        """waits until the readers and the writer release the lock, returns False on timeout."""
+        self._set.op(Op(_WRITERS_WAITING, 1, SEM_UNDO))
+        try:
+            self._set.op(
+                Op(_READERS, 0),
+                Op(_WRITER, 0),
+                Op(_WRITER, 1, SEM_UNDO),
+                Op(_WRITERS_WAITING, -1, SEM_UNDO),
+                timeout=timeout,
+            )
+            return True
+        except sysv_ipc.BusyError:
+            self._set.op(Op(_WRITERS_WAITING, -1, SEM_UNDO))
+            return False
+        except BaseException:
+            # interrupted while waiting, lets the readers in again.
+            self._set.op(Op(_WRITERS_WAITING, -1, SEM_UNDO))
+            raise
+
+    def release_write(self) -> None:
+        self._set.op(Op(_WRITER, -1, SEM_UNDO))
+
+    @contextmanager
+    def read(self, timeout: float | None = None) -> Iterator[None]:
+        if not self.acquire_read(timeout):
+            raise TimeoutError(f"read lock is not acquired within {timeout}s")
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self, timeout: float | None = None) -> Iterator[None]:
+        if not self.acquire_write(timeout):
+            raise TimeoutError(f"write lock is not acquired within {timeout}s")
+        try:
+            yield
+        finally:
+            self.release_write()
+
+    def remove(self) -> None:
+        self._set.remove()
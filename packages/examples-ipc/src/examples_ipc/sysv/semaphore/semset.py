@@ -0,0 +1,137 @@
+"""SystemV semaphore sets through `ctypes`.
+
+`sysv_ipc.Semaphore` holds a single semaphore, while `semop` applies several operations
+to the semaphores of a set atomically: either all of them are performed or the caller blocks.
+"""
+
+import ctypes
+import errno
+import os
+import time
+from typing import NamedTuple, NoReturn
+
+import sysv_ipc
+
+from ...registry import SYSV_SEMAPHORE, register, unregister
+
+# Linux values of <sys/sem.h> and <sys/ipc.h>, which `sysv_ipc` does not export.
+IPC_NOWAIT = 0o4000
+SEM_UNDO = 0x1000
+_IPC_RMID = 0
+_GETVAL = 12
+_GETNCNT = 14
+_GETZCNT = 15
+_SETALL = 17
+
+
+class _Sembuf(ctypes.Structure):
+    _fields_ = [("sem_num", ctypes.c_ushort), ("sem_op", ctypes.c_short), ("sem_flg", ctypes.c_short)]
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+_libc = ctypes.CDLL(None, use_errno=True)
+# semtimedop is Linux only, timed operations are not supported without it.
+_semtimedop = getattr(_libc, "semtimedop", None)
+
+
+class Op(NamedTuple):
+    """one operation of `semop`: adds a positive delta, subtracts a negative one
+    (blocking while the value is lower), or waits for zero with 0."""
+
+    num: int
+    delta: int
+    flags: int = 0
+
+
+def _raise_errno(message: str) -> NoReturn:
+    code = ctypes.get_errno()
+    if code == errno.EAGAIN:
+        raise sysv_ipc.BusyError(message)
+    if code == errno.EEXIST or code == errno.ENOENT or code == errno.EIDRM:
+        raise sysv_ipc.ExistentialError(f"{message}: {os.strerror(code)}")
+    if code == errno.EACCES:
+        raise sysv_ipc.PermissionsError(f"{message}: {os.strerror(code)}")
+    raise OSError(code, f"{message}: {os.strerror(code)}")
+
+
+def semop(semid: int, *ops: Op, timeout: float | None = None) -> None:
+    """performs the operations on the semaphores of the set `semid` atomically,
+    raises `BusyError` when `IPC_NOWAIT` or the timeout would block.
+
+    It works on the sets of `sysv_ipc.Semaphore` too, whose `acquire()` has no timeout without `semtimedop` support.
+    """
+    buffers = (_Sembuf * len(ops))(*(_Sembuf(op.num, op.delta, op.flags) for op in ops))
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        if deadline is None:
+            result = _libc.semop(semid, buffers, len(ops))
+        else:
+            if _semtimedop is None:
+                raise NotImplementedError("semtimedop is not available on this platform")
+            remaining = max(deadline - time.monotonic(), 0)
+            timespec = _Timespec(int(remaining), int(remaining % 1 * 1e9))
+            result = _semtimedop(semid, buffers, len(ops), ctypes.byref(timespec))
+        if result == 0:
+            return
+        # retries after a signal, whose Python handler runs on the way (KeyboardInterrupt is raised there).
+        if ctypes.get_errno() != errno.EINTR:
+            _raise_errno(f"semaphore set [{semid}] is busy")
+
+
+class SemaphoreSet:
+    """A set of SystemV semaphores, initialized atomically by the process that creates it.
+
+    The set has one more semaphore than requested, set to 1 together with the initial values by a single `SETALL`,
+    so a process that attaches between the creation and the initialization waits for the values instead of using zeros.
+    """
+
+    def __init__(self, key: int, values: list[int]) -> None:
+        self.key = key
+        self.count = len(values)
+        try:
+            self.id = self._get(sysv_ipc.IPC_CREX)
+            initial = (ctypes.c_ushort * (self.count + 1))(*values, 1)
+            if _libc.semctl(self.id, 0, _SETALL, initial) < 0:
+                _raise_errno(f"semaphore set [{key}] cannot be initialized")
+        except sysv_ipc.ExistentialError:
+            self.id = self._get(0)
+            # waits until the creator has set the values.
+            self.op(Op(self.count, -1), Op(self.count, 1))
+        register(SYSV_SEMAPHORE, key)
+
+    def _get(self, flags: int) -> int:
+        # spell-checker:words semid
+        semid: int = _libc.semget(self.key, self.count + 1, flags | 0o600)
+        if semid < 0:
+            if ctypes.get_errno() == errno.EINVAL:
+                raise ValueError(f"key [{self.key}] is used by a semaphore set of another size")
+            _raise_errno(f"semaphore set [{self.key}]")
+        return semid
+
+    def op(self, *ops: Op, timeout: float | None = None) -> None:
+        """performs the operations atomically, raises `BusyError` when `IPC_NOWAIT` or the timeout would block."""
+        semop(self.id, *ops, timeout=timeout)
+
+    def _ctl(self, num: int, command: int) -> int:
+        value: int = _libc.semctl(self.id, num, command)
+        if value < 0:
+            _raise_errno(f"semaphore set [{self.key}]")
+        return value
+
+    def value(self, num: int) -> int:
+        return self._ctl(num, _GETVAL)
+
+    def waiting_for_nonzero(self, num: int) -> int:
+        """the number of processes blocked subtracting from the semaphore."""
+        return self._ctl(num, _GETNCNT)
+
+    def waiting_for_zero(self, num: int) -> int:
+        return self._ctl(num, _GETZCNT)
+
+    def remove(self) -> None:
+        if _libc.semctl(self.id, 0, _IPC_RMID) < 0:
+            _raise_errno(f"semaphore set [{self.key}] cannot be removed")
+        unregister(SYSV_SEMAPHORE, self.key)
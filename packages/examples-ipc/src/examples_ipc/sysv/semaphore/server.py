@@ -1,12 +1,24 @@
+import signal
 import time
 from datetime import datetime
+from typing import Any
 
 import sysv_ipc
 
+from ...events import EventHistory, decode_event, export_history
+from ...registry import SYSV_MESSAGE_QUEUE, SYSV_SEMAPHORE, register, unregister
+from .events import create_events
+
+
+def handler(_signum: int, _frame: Any) -> None:
+    # spell-checker:words signum
+    pass
+
 
 def run(key: int, count: int) -> None:
     try:
         with sysv_ipc.Semaphore(key, flags=sysv_ipc.IPC_CREAT, initial_value=count) as sem:
+            register(SYSV_SEMAPHORE, key)
             print(f"start semaphore server: {key} size: {count}")
 
             previous = None
@@ -23,3 +35,36 @@ def run(key: int, count: int) -> None:
         pass
 
     print(f"end semaphore server: {key}")
+
+
+def run_monitor(key: int, count: int, history_size: int, history_path: str | None) -> None:
+    """reports every change the clients post to the companion queue, as it happens."""
+    # interrupts the blocking receive with sysv_ipc.Error instead of KeyboardInterrupt.
+    signal.signal(signal.SIGINT, handler)
+
+    try:
+        sem = sysv_ipc.Semaphore(key, flags=sysv_ipc.IPC_CREX, initial_value=count)
+    except sysv_ipc.ExistentialError:
+        sem = sysv_ipc.Semaphore(key)
+    register(SYSV_SEMAPHORE, key)
+    mq = create_events(key)
+    history = EventHistory(history_size)
+
+    print(f"start semaphore monitor: {key} size: {count}")
+    print(datetime.now().time(), f"semaphore: {sem.value}")
+    try:
+        while True:
+            message, _ = mq.receive()
+            event = decode_event(message)
+            history.append(event)
+            print(event.format())
+
+    except sysv_ipc.Error:
+        print("canceled.")
+        pass
+
+    # the clients stop posting once a send finds the queue removed.
+    mq.remove()
+    unregister(SYSV_MESSAGE_QUEUE, mq.key)
+    export_history(history, history_path)
+    print(f"end semaphore monitor: {key}")
@@ -1,26 +1,35 @@
 from argparse import ArgumentParser, Namespace
 
-import sysv_ipc
 
-from .client import run as _client_run
-from .server import run as _service_run
+def _clean(key: int) -> None:
+    import sysv_ipc
 
+    from ...registry import SYSV_SHARED_MEMORY, unregister
+    from .notify import remove_subscriptions
 
-def _clean(key: int) -> None:
     shm = sysv_ipc.SharedMemory(key)
     sysv_ipc.remove_shared_memory(shm.id)
+    unregister(SYSV_SHARED_MEMORY, key)
     print(f"{key} [shmid: {shm.id}] is removed.")
     # spell-checker:words shmid
 
+    for sem in remove_subscriptions(key):
+        print(f"{sem.key} [semid: {sem.id}] is removed.")
+        # spell-checker:words semid
+
 
 def _run(args: Namespace) -> None:
     if args.clean:
         _clean(args.key)
 
     elif args.is_server_mode:
+        from .server import run as _service_run
+
         _service_run(args.key, args.size)
 
     else:
+        from .client import run as _client_run
+
         _client_run(args.key, args.size)
 
 
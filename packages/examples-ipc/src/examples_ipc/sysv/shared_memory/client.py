@@ -1,19 +1,28 @@
 import sysv_ipc
 
+from ...registry import SYSV_SHARED_MEMORY, register
+from ...slot import HEADER_SIZE, Slot
+from .notify import Notifier
+
 
 def run(key: int, size: int) -> None:
-    shm = sysv_ipc.SharedMemory(key, sysv_ipc.IPC_CREAT, size=size)
+    shm = sysv_ipc.SharedMemory(key, sysv_ipc.IPC_CREAT, size=HEADER_SIZE + size)
+    register(SYSV_SHARED_MEMORY, key)
+    slot = Slot(shm)
+    notifier = Notifier(key)
 
     print(f"write to {key}")
     try:
         while True:
             text = input("Please enter something:")
-            shm.write("\0" * shm.size)
-            shm.write(text.encode(encoding="utf-8"))
+            # writes only the payload and its length, readers retry while it is being updated.
+            slot.write(text.encode(encoding="utf-8"))
+            notifier.notify()
             print(f"write: {text}")
 
     except KeyboardInterrupt:
         print("canceled.")
         pass
 
-    # shm.close()
+    slot.close()
+    shm.detach()
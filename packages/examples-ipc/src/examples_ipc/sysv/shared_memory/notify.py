@@ -0,0 +1,68 @@
+from contextlib import suppress
+
+import sysv_ipc
+
+from ...registry import SYSV_SEMAPHORE, SYSV_SHARED_MEMORY, register, unregister
+from ...subscribers import subscribe, subscribers, unsubscribe
+
+
+class Subscription:
+    """The semaphore of this reader of the shared memory of `key`, which the writers post after each write.
+
+    Its key is chosen by sysv_ipc, and listed with the readers of the shared memory.
+    """
+
+    def __init__(self, key: int) -> None:
+        self._key = key
+        self._sem = sysv_ipc.Semaphore(None, sysv_ipc.IPC_CREX, initial_value=0)
+        register(SYSV_SEMAPHORE, self._sem.key)
+        subscribe(SYSV_SHARED_MEMORY, key, self._sem.key)
+
+    def wait(self) -> None:
+        """blocks until a writer posts, consuming the posts that are already pending as well."""
+        self._sem.acquire()
+        # only this reader decrements the semaphore, so these do not block.
+        while self._sem.value > 0:
+            self._sem.acquire()
+
+    def close(self) -> None:
+        unsubscribe(SYSV_SHARED_MEMORY, self._key, self._sem.key)
+        unregister(SYSV_SEMAPHORE, self._sem.key)
+        self._sem.remove()
+
+
+class Notifier:
+    """Posts the semaphore of every reader of the shared memory of `key`."""
+
+    def __init__(self, key: int) -> None:
+        self._key = key
+        self._sems: dict[str, sysv_ipc.Semaphore] = {}
+
+    def notify(self) -> None:
+        keys = subscribers(SYSV_SHARED_MEMORY, self._key)
+        for gone in self._sems.keys() - set(keys):
+            del self._sems[gone]
+
+        for key in keys:
+            try:
+                sem = self._sems.get(key)
+                if sem is None:
+                    sem = self._sems[key] = sysv_ipc.Semaphore(int(key))
+                sem.release()
+            except sysv_ipc.ExistentialError:
+                # the reader exited without unsubscribing, and its semaphore was removed since.
+                self._sems.pop(key, None)
+                unsubscribe(SYSV_SHARED_MEMORY, self._key, key)
+
+
+def remove_subscriptions(key: int) -> list[sysv_ipc.Semaphore]:
+    """removes the semaphores of the readers of the shared memory of `key`, returns the removed ones."""
+    removed = []
+    for sem_key in subscribers(SYSV_SHARED_MEMORY, key):
+        with suppress(sysv_ipc.ExistentialError):
+            sem = sysv_ipc.Semaphore(int(sem_key))
+            sysv_ipc.remove_semaphore(sem.id)
+            removed.append(sem)
+        unregister(SYSV_SEMAPHORE, sem_key)
+        unsubscribe(SYSV_SHARED_MEMORY, key, sem_key)
+    return removed
@@ -1,23 +1,42 @@
-import time
+import signal
 from datetime import datetime
+from typing import Any
 
 import sysv_ipc
 
+from ...registry import SYSV_SHARED_MEMORY, register
+from ...slot import HEADER_SIZE, Slot
+from .notify import Subscription
+
+
+def handler(_signum: int, _frame: Any) -> None:
+    # spell-checker:words signum
+    pass
+
 
 def run(key: int, size: int) -> None:
-    shm = sysv_ipc.SharedMemory(key, sysv_ipc.IPC_CREAT, size=size)
+    # interrupts the blocking semaphore wait with sysv_ipc.Error instead of KeyboardInterrupt.
+    signal.signal(signal.SIGINT, handler)
+
+    shm = sysv_ipc.SharedMemory(key, sysv_ipc.IPC_CREAT, size=HEADER_SIZE + size)
+    register(SYSV_SHARED_MEMORY, key)
+    slot = Slot(shm)
+    subscription = Subscription(key)
 
     print(f"start shared memory server: {key}, size={size}")
     try:
         while True:
-            bytes = shm.read()
+            bytes = slot.snapshot()
             now = datetime.now().time()
             print(now, bytes.decode(encoding="utf-8").rstrip())
-            time.sleep(3)
+            # sleeps until the client writes.
+            subscription.wait()
 
-    except KeyboardInterrupt:
+    except sysv_ipc.Error:
         print("canceled.")
         pass
 
-    # shm.close()
+    subscription.close()
+    slot.close()
+    shm.detach()
     print(f"end shared memory server: {key}")
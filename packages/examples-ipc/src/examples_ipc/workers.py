@@ -0,0 +1,126 @@
+import importlib
+import os
+import signal
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from multiprocessing import get_context
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+from .codecs import DEFAULT_CODEC, DEFAULT_RECORD_CODEC, Codec, get_codec
+from .framing import decode_frame, is_frame
+from .spill import SpillReader
+
+Handler = Callable[[Any], None]
+"""handler called with each decoded record."""
+
+Decoder = Callable[[bytes], Iterator[Any]]
+"""decoder which yields the records of a message."""
+
+_stopping = False
+
+
+def print_record(record: Any) -> None:
+    now = datetime.now().time()
+    print(now, os.getpid(), record)
+
+
+def load_handler(path: str) -> Handler:
+    """loads the handler from an import path such as `package.module:function`."""
+    module_name, _, attribute = path.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"handler [{path}] is not in the form module:function")
+
+    target: Any = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        target = getattr(target, name)
+    if not callable(target):
+        raise TypeError(f"handler [{path}] is not callable")
+    handler: Handler = target
+    return handler
+
+
+def record_decoder(codec: str | None = None) -> Decoder:
+    """returns a function which yields the decoded records of a frame, or the decoded message or spilled payload."""
+    message_codec: Codec = get_codec(codec or DEFAULT_CODEC)
+    record_codec: Codec = get_codec(codec or DEFAULT_RECORD_CODEC)
+
+    spill = SpillReader()
+
+    def decode_records(message: bytes) -> Iterator[Any]:
+        if is_frame(message):
+            for record in decode_frame(message).records:
+                yield record_codec.decode(record)
+        else:
+            # a spilled payload is released once the handler returns.
+            with spill.payload(message) as payload:
+                yield message_codec.decode(payload)
+
+    return decode_records
+
+
+def _request_stop(_signum: int, _frame: Any) -> None:
+    # spell-checker:words signum
+    global _stopping
+    _stopping = True
+
+
+def stop_requested() -> bool:
+    """True once the process received SIGINT or SIGTERM while the pool is running."""
+    return _stopping
+
+
+class WorkerPool:
+    """Forks worker processes competing for the messages of the same queue.
+
+    Each worker runs `target(index, *args)` until it returns once `stop_requested()` is True,
+    so it finishes the message in hand before exiting.
+    A worker that exits while the pool is running (a crash) is restarted.
+    On SIGINT or SIGTERM the pool stops restarting, forwards SIGTERM and waits for the workers to drain.
+    """
+
+    def __init__(self, size: int, target: Callable[..., None], args: tuple[Any, ...] = ()) -> None:
+        if size < 1:
+            raise ValueError(f"the number of workers [{size}] must be at least 1")
+        self._size = size
+        self._target = target
+        self._args = args
+        # the workers inherit the handler and the stop flag, so they are forked rather than spawned.
+        self._context = get_context("fork")
+
+    def _start(self, index: int) -> BaseProcess:
+        process = self._context.Process(
+            target=self._target,
+            args=(index, *self._args),
+            name=f"worker-{index}",
+        )
+        process.start()
+        print(f"{process.name} started: {process.pid}")
+        return process
+
+    def run(self) -> None:
+        global _stopping
+        _stopping = False
+        previous = {signum: signal.signal(signum, _request_stop) for signum in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            workers = [self._start(index) for index in range(self._size)]
+            while not _stopping:
+                wait([worker.sentinel for worker in workers], timeout=0.5)
+                for index, worker in enumerate(workers):
+                    if worker.exitcode is not None and not _stopping:
+                        print(f"{worker.name} exited with {worker.exitcode}, restarting.")
+                        worker.join()
+                        workers[index] = self._start(index)
+
+            # the workers already have the signal when it was sent to the whole process group by a terminal.
+            for worker in workers:
+                if worker.is_alive() and worker.pid is not None:
+                    os.kill(worker.pid, signal.SIGTERM)
+            for worker in workers:
+                worker.join()
+                print(f"{worker.name} stopped: {worker.exitcode}")
+
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
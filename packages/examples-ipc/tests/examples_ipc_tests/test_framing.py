@@ -0,0 +1,76 @@
+"""This test is for the frames that batch many records into one message."""
+
+import pytest
+from examples_ipc.framing import COUNTER, HEADER_SIZE, RECORD_OVERHEAD, FrameBuilder, decode_frame, is_frame
+
+
+def _frame(*records: bytes) -> bytes:
+    builder = FrameBuilder(1024)
+    for record in records:
+        assert builder.append(record)
+    return builder.build()
+
+
+def test_round_trip() -> None:
+    records = [COUNTER.pack(i) for i in range(10)] + [b"", b"text"]
+
+    message = _frame(*records)
+    frame = decode_frame(message)
+
+    assert is_frame(message)
+    assert [bytes(record) for record in frame.records] == records
+    assert frame.sent_ns > 0
+
+
+def test_empty_frame() -> None:
+    frame = decode_frame(_frame())
+
+    assert frame.records == []
+
+
+def test_builder_stops_at_capacity() -> None:
+    builder = FrameBuilder(HEADER_SIZE + 2 * (RECORD_OVERHEAD + 8))
+
+    assert builder.append(COUNTER.pack(0))
+    assert builder.append(COUNTER.pack(1))
+    assert not builder.append(COUNTER.pack(2))
+    assert len(decode_frame(builder.build()).records) == 2
+    # the builder is reset by build.
+    assert len(builder) == 0
+
+
+@pytest.mark.parametrize("cut", [1, RECORD_OVERHEAD, RECORD_OVERHEAD + 3, 14])
+def test_truncated_frame(cut: int) -> None:
+    message = _frame(b"a" * 10)
+
+    with pytest.raises(ValueError, match="truncated|cannot hold"):
+        decode_frame(message[:-cut])
+
+
+def test_truncated_header() -> None:
+    message = _frame(b"a")
+
+    with pytest.raises(ValueError, match="shorter than a frame header"):
+        decode_frame(message[: HEADER_SIZE - 1])
+
+
+def test_count_beyond_message() -> None:
+    message = bytearray(_frame(b"a"))
+    # a record count that the message cannot hold.
+    message[2:6] = (1000).to_bytes(4, "little")
+
+    with pytest.raises(ValueError, match="cannot hold 1000 records"):
+        decode_frame(bytes(message))
+
+
+def test_trailing_bytes() -> None:
+    with pytest.raises(ValueError, match="after its 1 records"):
+        decode_frame(_frame(b"a") + b"\0")
+
+
+def test_not_a_frame() -> None:
+    message = b"\0" * HEADER_SIZE
+
+    assert not is_frame(message)
+    with pytest.raises(ValueError, match="not a frame"):
+        decode_frame(message)
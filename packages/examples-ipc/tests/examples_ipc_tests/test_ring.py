@@ -0,0 +1,96 @@
+"""This test is for the single-producer/single-consumer ring buffer."""
+
+import pytest
+from examples_ipc.ring import HEADER_SIZE, MAGIC, RECORD_OVERHEAD, RingBuffer
+
+
+def _ring(capacity: int = 256) -> tuple[RingBuffer, RingBuffer, bytearray]:
+    """a producer and a consumer on the same buffer, as two processes attach to one segment."""
+    buffer = bytearray(HEADER_SIZE + capacity)
+    return RingBuffer(buffer), RingBuffer(buffer), buffer
+
+
+def test_empty() -> None:
+    producer, consumer, _ = _ring()
+
+    assert consumer.peek() is None
+    assert list(consumer.drain()) == []
+    assert len(producer) == 0
+
+
+def test_push_and_pop_in_order() -> None:
+    producer, consumer, _ = _ring()
+
+    for i in range(5):
+        assert producer.push(bytes([i]) * (i + 1))
+
+    assert [bytes(record) for record in consumer.drain()] == [bytes([i]) * (i + 1) for i in range(5)]
+    assert consumer.peek() is None
+    assert len(producer) == 0
+
+
+def test_full() -> None:
+    producer, consumer, _ = _ring(capacity=64)
+    # each record of 8 bytes takes 16 bytes with its header.
+    for i in range(4):
+        assert producer.push(bytes([i]) * 8)
+
+    assert len(producer) == 64
+    assert not producer.push(b"x")
+
+    record = consumer.peek()
+    assert record is not None and bytes(record) == bytes([0]) * 8
+    # the space is given back only on release.
+    assert not producer.push(b"x")
+    consumer.release()
+    assert producer.push(b"x")
+
+
+def test_wraparound() -> None:
+    producer, consumer, _ = _ring(capacity=64)
+    received: list[bytes] = []
+    # records of 24 bytes with their headers do not divide the capacity, so they wrap with padding.
+    for i in range(100):
+        payload = i.to_bytes(2, "little") * 8
+        while not producer.push(payload):
+            received.extend(bytes(record) for record in consumer.drain())
+        assert len(producer) <= producer.capacity
+
+    received.extend(bytes(record) for record in consumer.drain())
+    assert received == [i.to_bytes(2, "little") * 8 for i in range(100)]
+
+
+def test_largest_record() -> None:
+    producer, consumer, _ = _ring(capacity=64)
+
+    with pytest.raises(ValueError, match="exceeds the maximum record size"):
+        producer.push(bytes(producer.max_record_size + 1))
+
+    for _ in range(3):
+        assert producer.push(bytes(producer.max_record_size))
+        assert [len(record) for record in consumer.drain()] == [producer.max_record_size]
+
+
+def test_peek_needs_release() -> None:
+    producer, consumer, _ = _ring()
+    producer.push(b"a")
+    producer.push(b"b")
+
+    assert consumer.peek() is not None
+    with pytest.raises(RuntimeError):
+        consumer.peek()
+
+
+def test_attach_keeps_records() -> None:
+    producer, _, buffer = _ring()
+    producer.push(b"kept")
+
+    attached = RingBuffer(buffer)
+
+    assert bytes(buffer[: len(MAGIC)]) == MAGIC
+    assert [bytes(record) for record in attached.drain()] == [b"kept"]
+
+
+def test_too_small() -> None:
+    with pytest.raises(ValueError, match="too small"):
+        RingBuffer(bytearray(HEADER_SIZE + RECORD_OVERHEAD))
@@ -0,0 +1,99 @@
+"""This test is for the seqlock that readers snapshot without locks."""
+
+import sys
+import threading
+from collections.abc import Callable
+
+import pytest
+from examples_ipc.seqlock import HEADER_SIZE, SeqLock
+
+
+def _sequence(buffer: bytearray) -> int:
+    # the sequence is a native u64.
+    return int.from_bytes(buffer[:HEADER_SIZE], sys.byteorder)
+
+
+def _set_sequence(buffer: bytearray, sequence: int) -> None:
+    buffer[:HEADER_SIZE] = sequence.to_bytes(HEADER_SIZE, sys.byteorder)
+
+
+def test_write_and_snapshot() -> None:
+    buffer = bytearray(HEADER_SIZE + 4)
+    lock = SeqLock(buffer)
+
+    with lock.write() as data:
+        # odd while the writer is updating the data.
+        assert lock.sequence % 2 == 1
+        data[:] = b"abcd"
+
+    assert lock.sequence == 2
+    assert lock.snapshot() == b"abcd"
+
+
+def test_read_waits_while_sequence_is_odd() -> None:
+    buffer = bytearray(HEADER_SIZE + 4)
+    lock = SeqLock(buffer)
+    _set_sequence(buffer, 1)
+    buffer[HEADER_SIZE:] = b"torn"
+
+    def finish() -> None:
+        buffer[HEADER_SIZE:] = b"done"
+        _set_sequence(buffer, 2)
+
+    writer = threading.Timer(0.05, finish)
+    writer.start()
+    try:
+        assert lock.snapshot() == b"done"
+    finally:
+        writer.join()
+
+
+def _torn_once(buffer: bytearray, reader: Callable[[memoryview], bytes]) -> Callable[[memoryview], bytes]:
+    """a reader that sees the writer complete an update while it reads, the first time only."""
+    calls = 0
+
+    def read(data: memoryview) -> bytes:
+        nonlocal calls
+        calls += 1
+        try:
+            return reader(data)
+        finally:
+            if calls == 1:
+                data[:] = b"new!"
+                _set_sequence(buffer, _sequence(buffer) + 2)
+
+    return read
+
+
+def test_read_retries_torn_snapshot() -> None:
+    buffer = bytearray(HEADER_SIZE + 4)
+    lock = SeqLock(buffer)
+    buffer[HEADER_SIZE:] = b"old!"
+
+    assert lock.read(_torn_once(buffer, bytes)) == b"new!"
+
+
+def test_read_ignores_error_of_torn_attempt() -> None:
+    buffer = bytearray(HEADER_SIZE + 4)
+    lock = SeqLock(buffer)
+    buffer[HEADER_SIZE:] = b"\xff\xff\xff\xff"
+
+    def decode(data: memoryview) -> bytes:
+        # fails on the torn data.
+        return bytes(data).decode("ascii").encode("ascii")
+
+    assert lock.read(_torn_once(buffer, decode)) == b"new!"
+
+
+def test_read_raises_error_of_consistent_attempt() -> None:
+    buffer = bytearray(HEADER_SIZE + 4)
+    lock = SeqLock(buffer)
+    buffer[HEADER_SIZE:] = b"\xff\xff\xff\xff"
+
+    with pytest.raises(UnicodeDecodeError):
+        lock.read(lambda data: bytes(data).decode("ascii"))
+
+
+def test_seqlock_too_small() -> None:
+    with pytest.raises(ValueError, match="too small"):
+        SeqLock(bytearray(HEADER_SIZE))
@@ -0,0 +1,35 @@
+"""This test is for the variable-length payload slot protected by a seqlock."""
+
+import pytest
+from examples_ipc.slot import Slot
+
+
+def test_slot_keeps_only_valid_payload() -> None:
+    slot = Slot(bytearray(64))
+
+    assert slot.snapshot() == b""
+    slot.write(b"a longer payload")
+    slot.write(b"short")
+
+    assert slot.snapshot() == b"short"
+    assert slot.read(len) == 5
+    assert slot.sequence == 4
+
+
+def test_slot_capacity() -> None:
+    slot = Slot(bytearray(64))
+
+    slot.write(bytes(slot.capacity))
+    with pytest.raises(ValueError, match="exceeds the slot capacity"):
+        slot.write(bytes(slot.capacity + 1))
+    assert slot.sequence == 2
+
+
+def test_slot_shares_buffer() -> None:
+    buffer = bytearray(64)
+    writer, reader = Slot(buffer), Slot(buffer)
+
+    writer.write(b"shared")
+
+    assert reader.snapshot() == b"shared"
+    assert reader.sequence == writer.sequence